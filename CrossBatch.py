@@ -0,0 +1,307 @@
+"""
+Renders cross sections from the command line without opening any windows.
+
+Example:
+    python CrossBatch.py "county_sections/*.xlsx" -o renders -f png pdf dxf --jobs 0
+    python CrossBatch.py "county_sections/*.xlsx" --plate-book county_plates.pdf
+"""
+import argparse
+import collections
+from concurrent import futures
+import glob
+import os
+import sys
+
+from CrossSection import CrossSection, SHEET_NAMES, TABLE_READERS, section_files
+import CrossExport
+import CrossCache
+import CrossProject
+
+
+#Formats that are written straight from the matplotlib figure, the value is the file extension
+FIGURE_FORMATS = {'png': 'png', 'pdf': 'pdf', 'tiff': 'tiff', 'jpeg': 'jpeg', 'eps': 'eps'}
+#Formats that are written with ezdxf, the value is what is added to the end of the file name
+DXF_FORMATS = {'dxf': '.dxf', 'illustrator-dxf': '_illustrator.dxf'}
+#Formats that are written straight from the section's arrays without a matplotlib figure, the value is the file extension
+DIRECT_FORMATS = {'svg': '.svg'}
+
+
+def iter_workbooks(inputs):
+    """
+    inputs - list of strings, each one a workbook, project file or CSV/Parquet pair, a directory of them or a glob pattern
+
+    Yields the path of every workbook one at a time so that a batch never has to hold the whole list of sections.
+    Excel lock files (~$name.xlsx) are skipped. A CSV or Parquet pair is only yielded once, as its Xsecs file when that is in the list.
+    A section matched by more than one input, like both files of a pair from a shell-expanded a_*.csv, is only yielded the first time
+    """
+
+    patterns = ['*.xlsx', '*' + CrossProject.PROJECT_EXTENSION] + ['*_Xsecs' + extension for extension in TABLE_READERS]
+    #Xsecs file of a pair or the file itself, for every section already yielded. Rendering one twice would have two processes writing the same files
+    seen = set()
+
+    for item in inputs:
+        if os.path.isdir(item):
+            paths = sorted(path for pattern in patterns for path in glob.glob(os.path.join(item, pattern)))
+        elif os.path.isfile(item):
+            paths = [item]
+        else:
+            paths = sorted(glob.iglob(item))
+
+        for path in paths:
+            if os.path.basename(path).startswith('~$'):
+                continue
+            #The Elev file of a pair is skipped when its Xsecs file is in the list too
+            cross_path = section_files(path)[-1]
+            if path != cross_path and cross_path in paths or os.path.abspath(cross_path) in seen:
+                continue
+            seen.add(os.path.abspath(cross_path))
+            yield path
+
+
+def output_name(filepath):
+    """
+    Returns the name the rendered files are given. A CSV or Parquet pair is named after the part in front of _Elev and _Xsecs
+    """
+
+    files = section_files(filepath)
+    name = os.path.splitext(os.path.basename(files[0]))[0]
+    if len(files) > 1:
+        name = name[:-len(SHEET_NAMES[0]) - 1]
+
+    return name
+
+
+def load_section(filepath, max_TD=None, cache_dir=None):
+    """
+    filepath  - string, workbook in the cross section template, a CSV or Parquet pair with the same sheets (see
+                CrossSection.section_files) or a project file saved in the window
+    max_TD    - float or None, same as the Max Total Depth box in the window. A positive depth
+    cache_dir - string or None, folder of a CrossCache.WorkbookCache. Workbooks that haven't changed since they were cached
+                aren't read again. None doesn't use a cache
+
+    Reads and calculates one cross section. Returns (section, settings), settings are the ones saved in a project or empty
+    """
+
+    if filepath.endswith(CrossProject.PROJECT_EXTENSION):
+        #Projects keep every edit made in the window and are already calculated
+        section, settings = CrossProject.load_project(filepath)
+    else:
+        cache = CrossCache.WorkbookCache(cache_dir) if cache_dir is not None else None
+        section = CrossSection()
+        section.create_initial_info(filepath, cache)
+        settings = {}
+
+    if max_TD is not None:
+        section.set_max_TD(-max_TD)
+    section.build_section()
+
+    return section, settings
+
+
+def render_workbook(filepath, output_dir, formats, vertical_exaggeration=None, fig_height=None, dpi=300, max_TD=None, cache_dir=None, svg_precision=1):
+    """
+    filepath              - string, passed to load_section
+    output_dir            - string, folder the files are written to
+    formats               - list of strings, any of the keys in FIGURE_FORMATS, DXF_FORMATS and DIRECT_FORMATS
+    vertical_exaggeration - integer or None, same as the Vertical Exaggeration box in the window. None uses the project's or 100
+    fig_height            - float or None, height of the figure in inches. None uses the project's or 12
+    dpi                   - integer, resolution of the raster formats
+    max_TD, cache_dir     - passed to load_section
+    svg_precision         - integer, decimal places of the coordinates in svg files
+
+    Calculates one cross section and writes every requested format. Returns a list of the files written
+    """
+
+    section, settings = load_section(filepath, max_TD, cache_dir)
+    if vertical_exaggeration is None:
+        vertical_exaggeration = settings.get('vertical_exaggeration', 100)
+    if fig_height is None:
+        fig_height = settings.get('figure_height', 12)
+
+    name = output_name(filepath)
+    written = []
+
+    figure_formats = [form for form in formats if form in FIGURE_FORMATS]
+    if figure_formats:
+        #One figure for every format, the raster formats are all encoded from one render of it
+        save_paths = {FIGURE_FORMATS[form]: os.path.join(output_dir, name + '.' + FIGURE_FORMATS[form]) for form in figure_formats}
+        written += CrossExport.export_figures(section, save_paths, vertical_exaggeration, fig_height, dpi)
+
+    for form in formats:
+        if form == 'dxf':
+            save_path = os.path.join(output_dir, name + DXF_FORMATS[form])
+            CrossExport.save_autocad_dxf(section, save_path, vertical_exaggeration)
+            written.append(save_path)
+        elif form == 'illustrator-dxf':
+            save_path = os.path.join(output_dir, name + DXF_FORMATS[form])
+            CrossExport.save_illustrator_dxf(section, save_path, vertical_exaggeration)
+            written.append(save_path)
+        elif form == 'svg':
+            save_path = os.path.join(output_dir, name + DIRECT_FORMATS[form])
+            CrossExport.save_svg(section, save_path, vertical_exaggeration, fig_height, svg_precision)
+            written.append(save_path)
+
+    return written
+
+
+def render_job(filepath, output_dir, formats, vertical_exaggeration=None, fig_height=None, dpi=300, max_TD=None, cache_dir=None, svg_precision=1):
+    """
+    Runs render_workbook and catches any error so that one bad workbook is reported instead of stopping the batch.
+    Returns (filepath, list of files written, error message or None). This is what the worker processes run
+    """
+
+    try:
+        written = render_workbook(filepath, output_dir, formats, vertical_exaggeration, fig_height, dpi, max_TD, cache_dir, svg_precision)
+    except Exception as error:
+        return filepath, [], '{}: {}'.format(type(error).__name__, error)
+
+    return filepath, written, None
+
+
+def run_batch(inputs, output_dir, formats, jobs=1, vertical_exaggeration=None, fig_height=None, dpi=300, max_TD=None, cache_dir=None, svg_precision=1):
+    """
+    inputs - list of strings, passed to iter_workbooks
+    jobs   - integer, number of worker processes. 1 renders in this process, 0 uses one process per CPU core
+
+    Renders every workbook and yields the result of render_job for each one as it finishes.
+    In parallel mode each workbook (reading, polygons and exports) is one job. Only a couple of jobs per worker are submitted
+    ahead so the batch still streams through the inputs instead of queueing all of them at once.
+    """
+
+    options = (output_dir, formats, vertical_exaggeration, fig_height, dpi, max_TD, cache_dir, svg_precision)
+    workbooks = iter_workbooks(inputs)
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs == 1:
+        for filepath in workbooks:
+            yield render_job(filepath, *options)
+        return
+
+    with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = {}
+        for filepath in workbooks:
+            pending[executor.submit(render_job, filepath, *options)] = filepath
+
+            #Wait for a job to finish before reading more workbooks once enough are queued
+            if len(pending) >= 2 * jobs:
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    yield collect_job(future, pending.pop(future))
+
+        for future in futures.as_completed(list(pending)):
+            yield collect_job(future, pending.pop(future))
+
+
+def load_job(filepath, max_TD=None, cache_dir=None):
+    """
+    Runs load_section and catches any error, the same way as render_job. Returns (filepath, section or None, error message or None)
+    """
+
+    try:
+        section, _ = load_section(filepath, max_TD, cache_dir)
+    except Exception as error:
+        return filepath, None, '{}: {}'.format(type(error).__name__, error)
+
+    return filepath, section, None
+
+
+def run_plate_book(inputs, save_path, jobs=1, vertical_exaggeration=None, feet_per_inch=None, max_TD=None, cache_dir=None):
+    """
+    inputs        - list of strings, passed to iter_workbooks
+    save_path     - string, the pdf written
+    jobs          - integer, number of worker processes reading and calculating sections. The pages are always drawn in this process
+    feet_per_inch - float or None, horizontal scale of every page. None uses the smallest round scale that fits the first section
+
+    Writes every section as one page of a single pdf (CrossExport.PlateBook), in the order of the inputs. Every page uses the same
+    vertical exaggeration, the one given or 100, so the plates can be compared. Pages are written as each section is calculated and
+    only a couple of sections per worker are held at once. Yields (filepath, [save_path] or [], error message or None) for each section
+    """
+
+    options = (max_TD, cache_dir)
+    workbooks = iter_workbooks(inputs)
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    with CrossExport.PlateBook(save_path, vertical_exaggeration or 100, feet_per_inch=feet_per_inch) as book:
+        def add_page(result):
+            filepath, section, error = result
+            if error is None:
+                try:
+                    book.add_section(section, output_name(filepath))
+                except Exception as page_error:
+                    error = '{}: {}'.format(type(page_error).__name__, page_error)
+            return filepath, [save_path] if error is None else [], error
+
+        if jobs == 1:
+            for filepath in workbooks:
+                yield add_page(load_job(filepath, *options))
+            return
+
+        #Pages go in the order the inputs were listed, not the order the workers finish, so the oldest job is always waited on first
+        with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending = collections.deque()
+            for filepath in workbooks:
+                pending.append((executor.submit(load_job, filepath, *options), filepath))
+                if len(pending) >= 2 * jobs:
+                    yield add_page(collect_job(*pending.popleft()))
+
+            while pending:
+                yield add_page(collect_job(*pending.popleft()))
+
+
+def collect_job(future, filepath):
+    """
+    Gets the result of a finished job. A worker process that dies without returning still only fails its own workbook
+    """
+
+    try:
+        return future.result()
+    except Exception as error:
+        return filepath, [], '{}: {}'.format(type(error).__name__, error)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Render cross section workbooks (Elev and Xsecs sheets) and saved projects to image and DXF files without opening the window.')
+    parser.add_argument('inputs', nargs='+', help='Workbooks, project files, CSV or Parquet pairs (name_Elev.csv and name_Xsecs.csv), folders of them or glob patterns such as "sections/*.xlsx"')
+    parser.add_argument('-o', '--output-dir', default='.', help='Folder the rendered files are written to. Created if it does not exist')
+    parser.add_argument('-f', '--formats', nargs='+', default=['png'], choices=list(FIGURE_FORMATS) + list(DXF_FORMATS) + list(DIRECT_FORMATS), help='Formats to write for every workbook')
+    parser.add_argument('--vertical-exaggeration', type=int, default=None, help='Vertical exaggeration, same as the box in the window. Default 100, or the one saved in a project')
+    parser.add_argument('--height', type=float, default=None, help='Figure height in inches. Default 12, or the one saved in a project')
+    parser.add_argument('--dpi', type=int, default=300, help='Resolution of raster formats. Default 300')
+    parser.add_argument('--svg-precision', type=int, default=1, help='Decimal places of the coordinates in svg files, in points. 0 makes the smallest files. Default 1')
+    parser.add_argument('--max-td', type=float, default=None, help='Max total depth, same as the box in the window')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of workbooks rendered at the same time in separate processes. 0 uses every CPU core. Default 1')
+    parser.add_argument('--cache-dir', default=None, help='Folder where the data read from workbooks is cached so unchanged workbooks are not read again. Default {}'.format(CrossCache.default_cache_dir()))
+    parser.add_argument('--no-cache', action='store_true', help='Always read the workbooks and do not cache them')
+    parser.add_argument('--plate-book', default=None, help='Write every section as one page of this PDF instead of separate files. Every page uses the same scale')
+    parser.add_argument('--plate-scale', type=float, default=None, help='Horizontal scale of the plate book in feet per inch. Default is the smallest round scale that fits the first section')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    cache_dir = None if args.no_cache else (args.cache_dir or CrossCache.default_cache_dir())
+
+    if args.plate_book is not None:
+        results = run_plate_book(args.inputs, args.plate_book, args.jobs, args.vertical_exaggeration, args.plate_scale, args.max_td, cache_dir)
+    else:
+        results = run_batch(args.inputs, args.output_dir, args.formats, args.jobs, args.vertical_exaggeration, args.height, args.dpi, args.max_td, cache_dir, args.svg_precision)
+
+    failures = 0
+    for filepath, written, error in results:
+        if error is not None:
+            failures += 1
+            print('FAILED {}: {}'.format(filepath, error), file=sys.stderr)
+            continue
+        print('{} -> {}'.format(filepath, ', '.join(written)))
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
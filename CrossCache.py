@@ -0,0 +1,196 @@
+"""
+Keeps the data read from workbooks on disk so opening an unchanged workbook again skips reading the excel file. Files are named by a hash
+of the workbook's contents, so a renamed or copied workbook still hits the cache and an edited one never does.
+Several batch processes can share one cache folder, files are only ever replaced whole and a file that disappears while it is being
+read is treated as a miss.
+"""
+import hashlib
+import os
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+
+#Bumped whenever the way workbooks are read changes, so files made by an older version are never used
+CACHE_VERSION = 1
+
+#Arguments of CrossSection.set_section_data that are lists, everything else is kept as an array
+LIST_FIELDS = ['w_num', 'formations_list', 'core_or_cuttings']
+
+
+def default_cache_dir():
+    """
+    Folder used when no other one is given. CROSSPLOT_CACHE_DIR overrides it
+    """
+
+    if os.environ.get('CROSSPLOT_CACHE_DIR'):
+        return os.environ['CROSSPLOT_CACHE_DIR']
+
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'CrossPlot')
+
+
+def pack_values(values):
+    """
+    values - list or array
+
+    Returns (array, missing) where array can be saved without pickling. Text with empty cells is saved as strings and the empty cells
+    are remembered in missing. Returns None if the values are a mix that can't be saved that way
+    """
+
+    array = np.asarray(values)
+    if array.dtype != object:
+        return array, None
+
+    missing = pd.isna(array)
+    if not all(isinstance(value, str) for value in array[~missing]):
+        return None
+
+    return array.astype(str), missing
+
+
+def unpack_values(array, missing):
+    """
+    Undoes pack_values
+    """
+
+    if missing is None:
+        return array
+
+    array = array.astype(object)
+    array[missing] = np.nan
+    return array
+
+
+class WorkbookCache(object):
+    """
+    Size limited cache of the data read from workbooks. Each workbook is one compressed .npz file.
+    When the folder gets bigger than max_bytes the files that were used longest ago are deleted
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 1024 * 1024):
+        """
+        directory - string or None, folder the files are kept in. None uses default_cache_dir()
+        max_bytes - integer, size the folder is trimmed to after every new file
+        """
+
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+
+
+    def key(self, *filepaths):
+        """
+        filepaths - strings, the workbook or the files of a CSV or Parquet pair (CrossSection.section_files)
+
+        Returns the hash of the files' contents, used to name their cache file
+        """
+
+        digest = hashlib.sha256()
+        for filepath in filepaths:
+            with open(filepath, 'rb') as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            digest.update(b'\0') #Keeps the boundary between files, so moving rows from one file to the other changes the hash
+
+        return 'v{}-{}'.format(CACHE_VERSION, digest.hexdigest())
+
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+
+    def get(self, key):
+        """
+        key - string, from key()
+
+        Returns the dictionary of CrossSection.set_section_data arguments that was stored for this workbook, or None if it isn't cached
+        """
+
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                data = {}
+                for name in stored.files:
+                    if name.endswith('__missing'):
+                        continue
+                    missing_name = name + '__missing'
+                    data[name] = unpack_values(stored[name], stored[missing_name] if missing_name in stored.files else None)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            #Not cached, deleted by another process while being read or left broken by a crash. Reading the workbook fixes all of them
+            return None
+
+        for name in LIST_FIELDS:
+            data[name] = data[name].tolist()
+
+        #Marks the file as just used so it is the last one trimmed
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return data
+
+
+    def put(self, key, data):
+        """
+        key  - string, from key()
+        data - dictionary of CrossSection.set_section_data arguments
+
+        Stores the data for a workbook. The file is written under a temporary name and renamed when it is complete, so another process
+        never reads half of it. Nothing is stored if the data can't be saved without pickling or the folder can't be written to
+        """
+
+        arrays = {}
+        for name, values in data.items():
+            packed = pack_values(values)
+            if packed is None:
+                return
+            arrays[name] = packed[0]
+            if packed[1] is not None:
+                arrays[name + '__missing'] = packed[1]
+
+        temp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as file:
+                temp_path = file.name
+                np.savez_compressed(file, **arrays)
+            os.replace(temp_path, self.path(key))
+        except OSError:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        self.trim()
+
+
+    def trim(self):
+        """
+        Deletes the least recently used files until the folder is under max_bytes. Files another process deletes first are skipped.
+        Temporary files more than an hour old were left by a process that crashed while writing and are deleted too
+        """
+
+        files = []
+        for entry in os.scandir(self.directory):
+            try:
+                stat = entry.stat()
+                if entry.name.endswith('.tmp') and stat.st_mtime < time.time() - 3600:
+                    os.remove(entry.path)
+            except OSError:
+                continue
+            
+            if entry.name.endswith('.npz'):
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
@@ -0,0 +1,1609 @@
+"""
+Builds figures and export files from a CrossSection. None of this needs the Qt window, so the same functions are used by the
+Save menu in CrossPlot.py and by the batch renderer in CrossBatch.py.
+"""
+from concurrent import futures
+import copy
+import os
+import struct
+import threading
+from xml.sax.saxutils import escape
+import zlib
+
+import numpy as np
+import ezdxf
+import matplotlib
+import matplotlib.colors
+import matplotlib.image
+from matplotlib import ticker
+from matplotlib.backend_bases import GraphicsContextBase
+from matplotlib.backends.backend_agg import FigureCanvasAgg, RendererAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import Collection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch, Rectangle
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D, IdentityTransform, TransformedPath
+
+from CrossSection import STYLE_N, STYLE_F
+
+
+def hex_to_rgb(hex_color):
+    """
+    Convert hex color (e.g., '#FF5733') to RGB integer.
+    """
+    
+    hex_color = hex_color.lstrip("#")
+    return int(hex_color, 16)
+
+
+#######################################################################################################################################################
+#######################################################################################################################################################
+#######################################################################################################################################################
+
+# =============================================================================
+#region Figure
+# =============================================================================
+def create_figure(section, vertical_exaggeration, fig_height=12):
+    """
+    section               - CrossSection, with polygons and contacts already calculated
+    vertical_exaggeration - integer, how many times the vertical scale is stretched compared to the horizontal
+    fig_height            - float, height of the figure in inches. The width is calculated from the vertical exaggeration
+    
+    Creates the cross section figure. This is the same figure that is shown in the main window.
+    A plain matplotlib Figure is used instead of pyplot so nothing is kept alive after the figure is saved
+    """
+    
+    return SectionFigure().draw(section, vertical_exaggeration, fig_height)
+
+
+#Formats that are encoded from one raster render of the figure, the value is the format name PIL is given
+RASTER_FORMATS = {'png': 'png', 'tiff': 'tiff', 'tif': 'tiff', 'jpeg': 'jpeg', 'jpg': 'jpeg'}
+#Raster images with more pixels than this are drawn and written in strips of at most this many pixels, 64 MB of RGBA.
+#JPEG can't be written a strip at a time and is always drawn whole
+STRIP_PIXELS = 16000000
+#Rows drawn past each end of a strip and thrown away, so lines are cut by Agg outside the rows that are kept
+STRIP_OVERLAP = 16
+
+
+def save_figure(fig, save_path, file_format, dpi=300, progress=None):
+    """
+    fig         - matplotlib Figure that isn't shown anywhere, it must not be changed while it is being saved
+    save_path   - string, the full path of the file being written
+    file_format - string, any format savefig accepts (pdf, png, tiff, jpeg, eps)
+    dpi         - integer, resolution of the raster formats
+    progress    - function or None, called as progress(steps done, total steps)
+    
+    Writes the figure to a file
+    """
+    
+    return save_figure_formats(fig, {file_format: save_path}, dpi, progress=progress)
+
+
+def save_figure_formats(fig, save_paths, dpi=300, concurrent=True, progress=None, max_pixels=STRIP_PIXELS):
+    """
+    fig        - matplotlib Figure that isn't shown anywhere, it must not be changed while it is being saved
+    save_paths - dictionary, file format (pdf, png, tiff, jpeg, eps or anything else savefig accepts) to the path written in that format
+    dpi        - integer, resolution of the raster formats
+    concurrent - bool, encodes the raster files on other threads while the vector formats are drawn
+    progress   - function or None, called as progress(steps done, total steps) between files. It can raise an exception to stop the export
+    max_pixels - integer, png and tiff images bigger than this are written in strips by save_raster_strips so memory doesn't grow with their size
+    
+    Writes the figure in every format with as few draws as possible. savefig draws the whole figure again for each file, here the raster
+    formats are all encoded from a single render and only the vector formats (pdf, eps, svg) are drawn by their own renderer.
+    Returns the list of files written
+    """
+    
+    raster = [form for form in save_paths if form.lower() in RASTER_FORMATS]
+    vector = [form for form in save_paths if form.lower() not in RASTER_FORMATS]
+    width, height = raster_size(fig, dpi)
+    striped = [form for form in raster if RASTER_FORMATS[form.lower()] in STRIP_WRITERS] if width * height > max_pixels else []
+    raster = [form for form in raster if form not in striped]
+    total = len(save_paths) + (1 if raster else 0)
+    done = 0
+    
+    if striped:
+        #Every strip is drawn once and written to all of the striped files. Each step of the export is split into strip sized steps so
+        #the progress moves once per strip, which is also when a cancel is noticed
+        strip_progress = None if progress is None else (lambda strips_done, strips: progress(done * strips + strips_done, total * strips))
+        save_raster_strips(fig, {form: save_paths[form] for form in striped}, dpi, max_pixels, strip_progress)
+        done += len(striped)
+    
+    with futures.ThreadPoolExecutor(max_workers=len(raster) if concurrent and raster else 1) as executor:
+        encoding = []
+        if raster:
+            if progress is not None:
+                progress(done, total)
+            
+            #The same render savefig makes for png. It is copied so the vector formats can draw the figure while it is being encoded
+            original_dpi = fig.dpi
+            fig.dpi = dpi
+            canvas = FigureCanvasAgg(fig)
+            canvas.draw()
+            image = np.asarray(canvas.buffer_rgba()).copy()
+            fig.dpi = original_dpi
+            done += 1
+            
+            for form in raster:
+                job = executor.submit(matplotlib.image.imsave, save_paths[form], image, format=RASTER_FORMATS[form.lower()], origin='upper', dpi=dpi)
+                encoding.append((form, job))
+                if not concurrent:
+                    job.result()
+            
+        for form in vector:
+            if progress is not None:
+                progress(done, total)
+            fig.savefig(save_paths[form], format=form, dpi=dpi)
+            done += 1
+            
+        for form, job in encoding:
+            if progress is not None:
+                progress(done, total)
+            job.result()
+            done += 1
+    
+    if progress is not None:
+        progress(done, total)
+    
+    return list(save_paths.values())
+
+
+def export_figures(section, save_paths, vertical_exaggeration, fig_height=12, dpi=300, concurrent=True, progress=None, max_pixels=STRIP_PIXELS):
+    """
+    section - CrossSection, only read. The window passes a copy so it can keep being edited
+    
+    Draws the section once, the same way as the plot in the window, and writes it in every format in save_paths. The other arguments
+    are the same as create_figure and save_figure_formats. Returns the list of files written
+    """
+    
+    fig = create_figure(section, vertical_exaggeration, fig_height)
+    
+    return save_figure_formats(fig, save_paths, dpi, concurrent, progress, max_pixels)
+
+
+# =============================================================================
+#region Raster Strips
+# =============================================================================
+def raster_size(fig, dpi):
+    """
+    Returns the (width, height) in pixels of the image savefig makes of fig at dpi
+    """
+    
+    width, height = fig.get_size_inches() * dpi
+    return int(width), int(height)
+
+
+class PNGStripWriter(object):
+    """
+    Writes an RGBA png a strip of rows at a time. Each strip is filtered and compressed as soon as it is written, so only one strip is
+    ever held in memory
+    """
+    
+    def __init__(self, save_path, width, height, dpi):
+        self.file = open(save_path, 'wb')
+        self.compressor = zlib.compressobj(6)
+        self.previous_row = np.zeros(width * 4, dtype=np.uint8)
+        
+        pixels_per_meter = int(round(dpi / 0.0254))
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        self.write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)) #8 bit RGBA
+        self.write_chunk(b'pHYs', struct.pack('>IIB', pixels_per_meter, pixels_per_meter, 1))
+        self.write_chunk(b'tEXt', b'Software\0matplotlib version' + matplotlib.__version__.encode('latin-1'))
+        
+        
+    def write_chunk(self, kind, data):
+        self.file.write(struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data)))
+        
+        
+    def write(self, rows):
+        """
+        rows - array of uint8, (rows, width, 4), the next rows of the image from the top
+        """
+        
+        #Up filter, each row is stored as its difference from the row above. The plot is mostly flat colour so this compresses well
+        flat = rows.reshape(rows.shape[0], -1)
+        filtered = np.empty((flat.shape[0], flat.shape[1] + 1), dtype=np.uint8)
+        filtered[:, 0] = 2
+        np.subtract(flat[0], self.previous_row, out=filtered[0, 1:])
+        np.subtract(flat[1:], flat[:-1], out=filtered[1:, 1:])
+        self.previous_row = flat[-1].copy()
+        
+        data = self.compressor.compress(filtered.tobytes())
+        if data:
+            self.write_chunk(b'IDAT', data)
+            
+            
+    def close(self):
+        self.write_chunk(b'IDAT', self.compressor.flush())
+        self.write_chunk(b'IEND', b'')
+        self.file.close()
+        
+        
+class TIFFStripWriter(object):
+    """
+    Writes an RGBA tiff a strip of rows at a time, each strip deflate compressed. The directory of the file, which lists where every
+    strip is, is written at the end once all of them are known. Images too big for the 4 GB limit of tiff are written as BigTIFF
+    """
+    
+    #Raw pixel bytes above which BigTIFF is written. Compressed strips are never bigger than the raw pixels by more than a little,
+    #so the raw size decides if offsets need 8 bytes
+    BIG_BYTES = 2**32 - 2**26
+    
+    def __init__(self, save_path, width, height, dpi):
+        self.file = open(save_path, 'wb')
+        self.width = width
+        self.height = height
+        self.dpi = dpi
+        self.rows_per_strip = None
+        self.strip_offsets = []
+        self.strip_byte_counts = []
+        
+        self.big = width * height * 4 > self.BIG_BYTES
+        if self.big:
+            self.file.write(b'II' + struct.pack('<HHHQ', 43, 8, 0, 0))
+        else:
+            self.file.write(b'II' + struct.pack('<HI', 42, 0))
+            
+            
+    def write(self, rows):
+        """
+        rows - array of uint8, (rows, width, 4), the next rows of the image from the top. Every strip but the last must have as many rows as the first
+        """
+        
+        if self.rows_per_strip is None:
+            self.rows_per_strip = rows.shape[0]
+            
+        #Horizontal differencing (predictor 2) before compressing, the same idea as the png filter
+        differenced = np.empty_like(rows)
+        differenced[:, 0] = rows[:, 0]
+        np.subtract(rows[:, 1:], rows[:, :-1], out=differenced[:, 1:])
+        data = zlib.compress(differenced.tobytes(), 6)
+        
+        self.strip_offsets.append(self.file.tell())
+        self.strip_byte_counts.append(len(data))
+        self.file.write(data)
+        
+        
+    def close(self):
+        offset_type, count_format, value_size = (16, 'Q', 8) if self.big else (4, 'I', 4)
+        
+        #Tag, type, values. Type 3 is short, 4 long, 5 rational and 16 long8
+        resolution = (int(round(self.dpi * 1000)), 1000)
+        tags = [(256, 4, [self.width]), (257, 4, [self.height]), (258, 3, [8, 8, 8, 8]), (259, 3, [8]), (262, 3, [2]),
+                (273, offset_type, self.strip_offsets), (277, 3, [4]), (278, 4, [self.rows_per_strip or self.height]),
+                (279, offset_type, self.strip_byte_counts), (282, 5, [resolution]), (283, 5, [resolution]), (284, 3, [1]),
+                (296, 3, [2]), (317, 3, [2]), (338, 3, [2])]
+        type_formats = {3: 'H', 4: 'I', 5: 'II', 16: 'Q'}
+        
+        #Values that don't fit in the directory entry are written before the directory and pointed to
+        entries = []
+        for tag, value_type, values in tags:
+            data = b''.join(struct.pack('<' + type_formats[value_type], *(value if isinstance(value, tuple) else (value,))) for value in values)
+            if len(data) > value_size:
+                if self.file.tell() % 2:
+                    self.file.write(b'\0')
+                position = self.file.tell()
+                self.file.write(data)
+                data = struct.pack('<' + count_format, position)
+            entries.append(struct.pack('<HH' + count_format, tag, value_type, len(values)) + data.ljust(value_size, b'\0'))
+            
+        if self.file.tell() % 2:
+            self.file.write(b'\0')
+        directory = self.file.tell()
+        self.file.write(struct.pack('<' + ('Q' if self.big else 'H'), len(entries)) + b''.join(entries) + struct.pack('<' + count_format, 0))
+        
+        #Points the header at the directory
+        self.file.seek(8 if self.big else 4)
+        self.file.write(struct.pack('<' + count_format, directory))
+        self.file.close()
+        
+        
+STRIP_WRITERS = {'png': PNGStripWriter, 'tiff': TIFFStripWriter}
+
+
+def moved_gc(gc, offset):
+    """
+    Returns a copy of the graphics context gc with its clipping moved down offset pixels
+    """
+    
+    moved = GraphicsContextBase()
+    moved.copy_properties(gc)
+    if gc.get_clip_rectangle() is not None:
+        moved.set_clip_rectangle(gc.get_clip_rectangle().frozen().translated(0, -offset))
+    clip_path, clip_transform = gc.get_clip_path()
+    if clip_path is not None:
+        moved.set_clip_path(TransformedPath(clip_path, clip_transform + Affine2D().translate(0, -offset)))
+        
+    return moved
+
+
+class StripRenderer(RendererAgg):
+    """
+    Agg renderer for one strip of a striped image image_height rows tall. Everything is drawn moved down by offset rows, so the rows
+    of the whole image from offset up to offset + height (counted from the bottom) land on it. The figure itself is never changed
+    """
+    
+    def __init__(self, width, height, dpi, offset, image_height):
+        super().__init__(width, height, dpi)
+        self.offset = offset
+        self.image_height = image_height
+        self.shift = Affine2D().translate(0, -offset)
+        
+        #Agg draws these straight from C++, so the ones it set up are wrapped to move everything first. The wrappers don't hold on to
+        #the renderer itself, which would keep its image alive until the garbage collector finds the loop
+        agg_markers, agg_collection = self.draw_markers, self.draw_path_collection
+        agg_mesh, agg_triangles, agg_image = self.draw_quad_mesh, self.draw_gouraud_triangles, self.draw_image
+        moved, shift = lambda gc: moved_gc(gc, offset), self.shift
+        self.draw_markers = lambda gc, marker_path, marker_trans, path, trans, rgbFace=None: agg_markers(
+            moved(gc), marker_path, marker_trans, path, trans + shift, rgbFace)
+        self.draw_path_collection = lambda gc, master_transform, *args, **kwargs: agg_collection(
+            moved(gc), master_transform + shift, *args, **kwargs)
+        self.draw_quad_mesh = lambda gc, master_transform, *args: agg_mesh(moved(gc), master_transform + shift, *args)
+        self.draw_gouraud_triangles = lambda gc, triangles, colors, transform: agg_triangles(moved(gc), triangles, colors, transform + shift)
+        self.draw_image = lambda gc, x, y, im, transform=None: agg_image(moved(gc), x, y - offset, im)
+        
+        
+    def dashed_runs(self, path, transform):
+        """
+        Returns [(vertices, distance)], each run of path that comes into the strip in pixels and the distance along its line to where
+        it comes in. Agg cuts a line one pixel outside the image before dashing it and starts the dashes again wherever it comes back
+        in, so each run is drawn with its dashes moved along by that distance to line up with the strips around it
+        """
+        
+        low, high = self.offset - 1, self.offset + self.height + 1
+        runs = []
+        run = previous = None
+        for vertices, code in path.iter_segments(transform, simplify=False, curves=False):
+            point = vertices[-2:]
+            if code == Path.MOVETO or previous is None:
+                travelled, run, previous = 0, None, point
+                continue
+            
+            length = np.hypot(*(point - previous))
+            if max(previous[1], point[1]) >= low and min(previous[1], point[1]) <= high:
+                if run is None:
+                    distance = travelled
+                    if not low <= previous[1] <= high:
+                        edge = low if previous[1] < low else high
+                        distance += length * (edge - previous[1]) / (point[1] - previous[1])
+                    run = [previous]
+                    runs.append((run, distance))
+                run.append(point)
+            if not low <= point[1] <= high:
+                run = None
+            travelled += length
+            previous = point
+            
+        return [(np.array(vertices), distance) for vertices, distance in runs]
+    
+    
+    def draw_path(self, gc, path, transform, rgbFace=None):
+        if rgbFace is None and path.should_simplify:
+            #Agg thins out long lines after cutting them at the edge of the image, so they're thinned here against the whole image instead
+            path = path.cleaned(transform, remove_nans=True, clip=(-1, -1, self.width + 1, self.image_height + 1), simplify=True)
+            path.should_simplify = False
+            transform = IdentityTransform()
+            
+        moved = moved_gc(gc, self.offset)
+        offset, dashes = gc.get_dashes()
+        if dashes is None or rgbFace is not None:
+            super().draw_path(moved, path, transform + self.shift, rgbFace)
+            return
+        
+        #A line that comes into the strip once is drawn whole, so Agg thins and snaps it the same as in the image drawn in one go
+        runs = self.dashed_runs(path, transform)
+        if len(runs) == 1:
+            moved.set_dashes(offset + runs[0][1] * 72 / self.dpi, dashes)
+            super().draw_path(moved, path, transform + self.shift, rgbFace)
+            return
+        
+        for vertices, distance in runs:
+            moved.set_dashes(offset + distance * 72 / self.dpi, dashes)
+            super().draw_path(moved, Path(vertices), self.shift, rgbFace)
+            
+            
+    def draw_text(self, gc, x, y, s, prop, angle, ismath=False, mtext=None):
+        #Agg places text from the top of the image, so it's moved the other way
+        super().draw_text(moved_gc(gc, self.offset), x, y + self.offset, s, prop, angle, ismath, mtext)
+        
+        
+    def draw_tex(self, gc, x, y, s, prop, angle, *, mtext=None):
+        super().draw_tex(moved_gc(gc, self.offset), x, y + self.offset, s, prop, angle, mtext=mtext)
+
+
+def save_raster_strips(fig, save_paths, dpi=300, max_pixels=STRIP_PIXELS, progress=None):
+    """
+    fig        - matplotlib Figure that isn't shown anywhere
+    save_paths - dictionary, png or tiff to the path written in that format
+    dpi        - integer, resolution of the image
+    max_pixels - integer, most pixels in a strip. Each one is drawn with STRIP_OVERLAP extra rows at both ends, so memory stays around
+                 4 bytes per pixel of max_pixels plus those rows no matter how long the section or how high the dpi
+    progress   - function or None, called as progress(strips done, total strips). It can raise an exception to stop the export
+    
+    Draws the figure a strip of rows at a time and streams each strip into every file, so the whole image is never held in memory.
+    The files are written under temporary names next to save_paths and only renamed once the last strip is in, so a cancelled or failed
+    export never leaves half an image behind or replaces a file that was already there
+    """
+    
+    width, height = raster_size(fig, dpi)
+    rows_per_strip = max(1, min(height, max_pixels // max(width, 1)))
+    
+    temp_paths = {}
+    writers = []
+    try:
+        for form, save_path in save_paths.items():
+            #Named after this process and thread so two exports of the same file never share one. A plain open keeps the usual permissions
+            temp_paths[save_path] = '{}.{}-{}.tmp'.format(save_path, os.getpid(), threading.get_ident())
+            writers.append(STRIP_WRITERS[RASTER_FORMATS[form.lower()]](temp_paths[save_path], width, height, dpi))
+            
+        original_dpi = fig.dpi
+        try:
+            fig.dpi = dpi
+            strips = range(0, height, rows_per_strip)
+            for done, top in enumerate(strips):
+                if progress is not None:
+                    progress(done, len(strips))
+                    
+                #A few rows past each end are drawn and thrown away so Agg cuts the lines crossing out of the strip away from the rows kept
+                bottom = min(height, top + rows_per_strip)
+                drawn_top, drawn_bottom = max(0, top - STRIP_OVERLAP), min(height, bottom + STRIP_OVERLAP)
+                renderer = StripRenderer(width, drawn_bottom - drawn_top, dpi, height - drawn_bottom, height)
+                fig.draw(renderer)
+                rows = np.asarray(renderer.buffer_rgba())
+                if rows.shape != (drawn_bottom - drawn_top, width, 4):
+                    raise ValueError('Strip of rows {} to {} was drawn {} by {} pixels instead of {} by {}'.format(
+                        drawn_top, drawn_bottom, rows.shape[1], rows.shape[0], width, drawn_bottom - drawn_top))
+                
+                for writer in writers:
+                    writer.write(rows[top - drawn_top:bottom - drawn_top])
+                    
+            if progress is not None:
+                progress(len(strips), len(strips))
+        finally:
+            fig.dpi = original_dpi
+            
+        for writer in writers:
+            writer.close()
+    except BaseException:
+        #Cancelled or failed, including a KeyboardInterrupt. Nothing is written to save_paths
+        for writer in writers:
+            writer.file.close()
+        for temp_path in temp_paths.values():
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+    
+    for save_path, temp_path in temp_paths.items():
+        os.replace(temp_path, save_path)
+        
+    return list(save_paths.values())
+
+
+def section_outline_data(section):
+    """
+    Returns copies of the data the surface, sky and boreholes are drawn from, as a list of arrays
+    """
+    
+    return [np.array(data, dtype=float) for data in (section.distance, section.top_of_bottom, section.elev, section.locations, section.well_elev, 
+                                                     section.borehole_TD, [section.max_TD, section.tallest_borehole])] + [np.array(section.w_num, dtype=str)]
+
+
+def changed_span(old, new):
+    """
+    old, new - arrays, the data of a formation or contact line before and after a change. The last row is distance
+    
+    Returns (left, right) distances covering every vertex that moved and the vertices on either side of it, since the lines to those
+    are drawn differently too. Returns None if nothing moved
+    """
+    
+    if old.shape != new.shape:
+        distances = np.concatenate((old[-1], new[-1]))
+    else:
+        moved = np.any((old != new) & ~(np.isnan(old) & np.isnan(new)), axis=0)
+        if not moved.any():
+            return None
+        moved[1:] = moved[1:] | moved[:-1].copy()
+        moved[:-1] = moved[:-1] | moved[1:].copy()
+        distances = np.concatenate((old[-1][moved], new[-1][moved]))
+        
+    distances = distances[~np.isnan(distances)]
+    if distances.shape[0] == 0:
+        return None
+    return np.min(distances), np.max(distances)
+
+
+class SectionFigure(object):
+    """
+    figure - Figure or None, the figure to draw on. The main window passes the figure on its canvas
+    
+    Draws a cross section and keeps a handle to every artist: one fill per formation, one line per contact and one line per borehole.
+    The first draw builds the figure. Later draws of the same section only change the data of the artists whose geometry changed,
+    so moving a pinch or fade doesn't rebuild the whole plot.
+    """
+    
+    def __init__(self, figure=None):
+        if figure is None:
+            figure = Figure()
+        self.figure = figure
+        self.ax = None
+        
+        
+    def draw(self, section, vertical_exaggeration, fig_height=12):
+        """
+        section               - CrossSection, with polygons and contacts already calculated
+        vertical_exaggeration - integer, how many times the vertical scale is stretched compared to the horizontal
+        fig_height            - float, height of the figure in inches. The width is calculated from the vertical exaggeration
+        
+        Brings the figure up to date with the section and returns it
+        """
+        
+        section.update('contacts') #Only recalculates what is out of date
+        section.create_plot_limits()
+        
+        vertical_exaggeration_ratio = ((section.locations[-1]) / (section.tallest_borehole - section.deepest_borehole)) / vertical_exaggeration
+        fig_width = vertical_exaggeration_ratio * fig_height
+        self.figure.set_size_inches(fig_width, fig_height, forward=False)
+        
+        #A different number of formations or wells means a different section, so everything is drawn again
+        #Updating fills in place needs set_data on the fill_between collection, older versions of matplotlib always rebuild
+        if (self.ax is None
+                or len(self.formation_fills) != len(section.formation_polygons)
+                or len(self.borehole_lines) != len(section.w_num)
+                or not hasattr(self.surface_fill, 'set_data')):
+            self.build(section)
+        else:
+            self.update(section)
+        
+        return self.figure
+    
+    
+    def build(self, section):
+        """
+        Clears the figure and draws every artist
+        """
+        
+        self.figure.clear()
+        self.ax = ax = self.figure.subplots()
+        
+        #Plots the surface elevation and outline
+        self.surface_fill = ax.fill_between(section.distance, section.top_of_bottom, section.elev, color="#FFE563")
+        self.surface_line, = ax.plot(section.distance, section.elev, color='k', linewidth=0.8, zorder=14)
+        
+        #Loops through the formation polygon and plots them with user inputted colors if possible
+        self.formation_fills = []
+        self.formation_data = []
+        for runs, formation in enumerate(section.formation_polygons):
+            self.formation_fills.append(ax.fill_between(formation[-1], formation[0], formation[1], color=section.plotting_colors[runs])) #Attempts to use inputted colors
+            self.formation_data.append((formation.copy(), section.plotting_colors[runs]))
+        
+        #Plots the contact lines
+        self.solid_lines = []
+        self.dashed_lines = []
+        self.changed_artists = []
+        self.changed_distances = None
+        self.update_contacts(self.solid_lines, section.solid_contacts, '-')
+        self.update_contacts(self.dashed_lines, section.dashed_contacts, '--')
+            
+        self.sky_fill = ax.fill_between(section.distance, section.elev, section.tallest_borehole+50, color='w', zorder = 13)
+        
+        #Plots the borehole lines to indicate location and depth, also adds W-#
+        self.borehole_lines = []
+        self.borehole_labels = []
+        for n in range(len(section.w_num)):
+            ymin = max(section.borehole_TD[n], section.max_TD)
+            self.borehole_lines.append(ax.vlines(section.locations[n], color='k', ymin=ymin, ymax=section.well_elev[n]))
+            self.borehole_labels.append(ax.annotate("W-" + str(section.w_num[n]), (section.locations[n] - section.locations[-1]*0.01 , section.tallest_borehole + 80))) #Note that this uses 1% of the total length to offset labels over well lines
+            
+        self.outline_data = section_outline_data(section)
+            
+        #Set x and y axis labels
+        ax.set_xlabel("Distance (ft)")
+        ax.set_ylabel('Elevation (ft)')
+        
+        ax.set_ylim(section.deepest_borehole-50, section.tallest_borehole+100)
+        
+        
+    def update(self, section):
+        """
+        Changes the data of the existing artists. Formations that haven't changed are left alone
+        """
+        
+        ax = self.ax
+        self.changed_artists = [] #Formation fills and contact lines given new data by this update
+        self.changed_distances = None #(left, right) distances of the part of the plot those changes are in
+        
+        #The surface, sky and boreholes set the x limits. They are only changed, and the limits only worked out again, when their data changed.
+        #Formations and contacts are always between the first and last borehole so they never change the limits
+        outline_data = section_outline_data(section)
+        outline_changed = not all(np.array_equal(old, new, equal_nan=old.dtype.kind == 'f') for old, new in zip(self.outline_data, outline_data))
+        if outline_changed:
+            self.surface_fill.set_data(section.distance, section.top_of_bottom, section.elev)
+            self.surface_line.set_data(section.distance, section.elev)
+            self.sky_fill.set_data(section.distance, section.elev, section.tallest_borehole+50)
+            
+            for n in range(len(section.w_num)):
+                ymin = max(section.borehole_TD[n], section.max_TD)
+                self.borehole_lines[n].set_segments([[(section.locations[n], ymin), (section.locations[n], section.well_elev[n])]])
+                self.borehole_labels[n].xy = (section.locations[n] - section.locations[-1]*0.01 , section.tallest_borehole + 80)
+                self.borehole_labels[n].set_text("W-" + str(section.w_num[n]))
+                
+            self.outline_data = outline_data
+        
+        for runs, formation in enumerate(section.formation_polygons):
+            old_formation, old_color = self.formation_data[runs]
+            if old_formation.shape != formation.shape or not np.array_equal(old_formation, formation, equal_nan=True):
+                self.formation_fills[runs].set_data(formation[-1], formation[0], formation[1])
+                self.add_changed_artist(self.formation_fills[runs], changed_span(old_formation, formation))
+            if old_color != section.plotting_colors[runs]:
+                self.formation_fills[runs].set_color(section.plotting_colors[runs])
+                self.add_changed_artist(self.formation_fills[runs], (np.nanmin(formation[-1]), np.nanmax(formation[-1])))
+            self.formation_data[runs] = (formation.copy(), section.plotting_colors[runs])
+            
+        self.update_contacts(self.solid_lines, section.solid_contacts, '-')
+        self.update_contacts(self.dashed_lines, section.dashed_contacts, '--')
+        
+        #The x limits are worked out from the artists again, the same way a new figure would
+        if outline_changed:
+            ax.relim()
+            ax.autoscale_view()
+        ax.set_ylim(section.deepest_borehole-50, section.tallest_borehole+100)
+        
+        
+    def data_artists(self):
+        """
+        Returns every artist on the axes in the order the axes draws them, leaving out the axes background and the axis ticks and labels.
+        These are everything a change to the section can move, so a window can draw just these over a saved copy of the rest
+        """
+        
+        ax = self.ax
+        artists = [artist for artist in ax.get_children() if artist not in (ax.patch, ax.xaxis, ax.yaxis)]
+        return sorted(artists, key=lambda artist: artist.get_zorder())
+        
+        
+    def artist_extent(self, artist, renderer):
+        """
+        artist   - one of the artists from data_artists
+        renderer - renderer of the canvas the figure is drawn on
+        
+        Returns the area of the canvas the artist is drawn in, padded by a few pixels for line widths.
+        Collections report an empty area from get_window_extent, so their data limits are used instead
+        """
+        
+        if isinstance(artist, Collection):
+            extent = artist.get_datalim(self.ax.transData).transformed(self.ax.transData)
+        else:
+            extent = artist.get_window_extent(renderer)
+        return extent.padded(3)
+        
+        
+    def add_changed_artist(self, artist, span):
+        """
+        artist - the artist given new data
+        span   - (left, right) distances or None, the part of the artist that changed
+        
+        Records a changed artist and widens changed_distances to cover it
+        """
+        
+        self.changed_artists.append(artist)
+        if span is None:
+            return
+        if self.changed_distances is None:
+            self.changed_distances = span
+        else:
+            self.changed_distances = (min(self.changed_distances[0], span[0]), max(self.changed_distances[1], span[1]))
+        
+        
+    def update_contacts(self, lines, contacts, linestyle):
+        """
+        lines     - list of Line2D, the lines already on the plot. Changed in place
+        contacts  - list of arrays, contact lines from the section. Row 0 is elevation, row 1 is distance
+        linestyle - string, - or --
+        
+        Reuses the existing lines for the contacts, adding or removing lines when the number of contacts changed
+        """
+        
+        for index, line in enumerate(contacts):
+            if index < len(lines):
+                old_x, old_y = lines[index].get_data()
+                if len(old_x) != line.shape[1] or not (np.array_equal(old_x, line[1], equal_nan=True) and np.array_equal(old_y, line[0], equal_nan=True)):
+                    lines[index].set_data(line[1], line[0])
+                    self.add_changed_artist(lines[index], changed_span(np.vstack((old_y, old_x)), line))
+            else:
+                contact_line, = self.ax.plot(line[1], line[0], linestyle=linestyle, color='k', zorder = 12)
+                lines.append(contact_line)
+                self.add_changed_artist(contact_line, (np.nanmin(line[1]), np.nanmax(line[1])))
+                
+        for extra_line in lines[len(contacts):]:
+            extra_line.remove()
+        del lines[len(contacts):]
+
+
+# =============================================================================
+#region Plate Book
+# =============================================================================
+#Tabloid landscape, in inches
+PLATE_PAGE_SIZE = (17, 11)
+#Inches of the page kept clear around the section: left, right, top (title) and bottom (axis labels, legend and scale bar)
+PLATE_MARGINS = (1.0, 0.5, 1.0, 1.8)
+#Page scales are one of these times a power of ten, so plates read 1 in = 600 ft instead of 1 in = 573.2 ft
+SCALE_STEPS = (1, 1.2, 1.5, 2, 2.5, 3, 4, 5, 6, 8)
+
+
+def round_scale(value, steps=SCALE_STEPS):
+    """
+    Returns the smallest of steps times a power of ten that is at least value
+    """
+    
+    power = 10 ** np.floor(np.log10(value))
+    for step in steps + (10,):
+        if step * power >= value * (1 - 1e-9):
+            return step * power
+
+
+class PlateBook(object):
+    """
+    save_path             - string, the pdf written
+    vertical_exaggeration - integer, used for every page
+    page_size             - (width, height) of every page in inches
+    feet_per_inch         - float or None, horizontal scale of every page. None uses the first section's, the smallest round scale
+                            that fits it on the page
+    
+    Writes many cross sections to one pdf, one page each, all drawn at the same scale with the same legend and scale bar layout.
+    Each page is written to the file as soon as it is added and its figure is thrown away, so memory doesn't grow with the number
+    of pages. A section too big for the page at the book's scale is drawn at the next round scale that fits, its scale bar shows it
+    """
+    
+    def __init__(self, save_path, vertical_exaggeration, page_size=PLATE_PAGE_SIZE, feet_per_inch=None):
+        self.save_path = save_path
+        self.vertical_exaggeration = vertical_exaggeration
+        self.page_size = page_size
+        self.feet_per_inch = feet_per_inch
+        self.pages = 0
+        self.pdf = PdfPages(save_path, metadata={'Title': 'Cross Sections'})
+        
+        
+    def __enter__(self):
+        return self
+    
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        
+        
+    def add_section(self, section, title=''):
+        """
+        section - CrossSection, with polygons and contacts already calculated
+        title   - string, printed at the top of the page
+        
+        Draws the section on a new page and writes it
+        """
+        
+        fig = Figure(figsize=self.page_size)
+        self.draw_page(fig, section, title)
+        self.pdf.savefig(fig)
+        self.pages += 1
+        
+        
+    def draw_page(self, fig, section, title):
+        """
+        Draws one page. The section is drawn by SectionFigure, the same as the window, then its axes are sized to the book's scale
+        """
+        
+        section.update('contacts')
+        section.create_plot_limits()
+        section_figure = SectionFigure(fig)
+        section_figure.build(section)
+        ax = section_figure.ax
+        
+        page_width, page_height = self.page_size
+        left, right, top, bottom = PLATE_MARGINS
+        area_width, area_height = page_width - left - right, page_height - top - bottom
+        
+        x_range = np.diff(ax.get_xlim())[0]
+        y_range = np.diff(ax.get_ylim())[0]
+        fits = round_scale(max(x_range / area_width, y_range * self.vertical_exaggeration / area_height))
+        if self.feet_per_inch is None:
+            self.feet_per_inch = fits
+        feet_per_inch = max(self.feet_per_inch, fits)
+        
+        #Centered across the page and hung from the bottom of the title
+        width = x_range / feet_per_inch
+        height = y_range * self.vertical_exaggeration / feet_per_inch
+        ax_left = left + (area_width - width) / 2
+        ax_bottom = page_height - top - height
+        ax.set_position([ax_left / page_width, ax_bottom / page_height, width / page_width, height / page_height])
+        
+        fig.text(0.5, 1 - 0.5 / page_height, title, ha='center', va='center', fontsize=16, weight='bold')
+        
+        #Legend of the formations and contact styles, below the axis label at the bottom left
+        handles = [Patch(facecolor=color, edgecolor='k', linewidth=0.5, label=name) for name, color in zip(section.formations_list, section.plotting_colors[:len(section.formation_polygons)])]
+        handles += [Line2D([], [], color='k', linestyle='-', label='Contact, core'), Line2D([], [], color='k', linestyle='--', label='Contact, cuttings')]
+        fig.legend(handles=handles, loc='upper left', bbox_to_anchor=(left / page_width, (bottom - 0.8) / page_height), ncol=4, frameon=False, fontsize=9)
+        
+        self.draw_scale_bar(fig, feet_per_inch, page_width - right, (bottom - 1.1) / page_height)
+        
+        
+    def draw_scale_bar(self, fig, feet_per_inch, right, y):
+        """
+        fig           - Figure of the page
+        feet_per_inch - float, horizontal scale of the page
+        right         - float, inches from the left of the page to the right end of the bar
+        y             - float, height of the bar as a fraction of the page
+        
+        Draws a bar of four alternating black and white blocks about two inches long, labelled in feet, with the scale written under it
+        """
+        
+        page_width, page_height = self.page_size
+        length = round_scale(2 * feet_per_inch, (1, 2, 5))
+        bar_width = length / feet_per_inch
+        bar_left = right - bar_width
+        
+        for block in range(4):
+            fig.add_artist(Rectangle(((bar_left + block * bar_width / 4) / page_width, y), bar_width / 4 / page_width, 0.08 / page_height,
+                                     facecolor='k' if block % 2 == 0 else 'w', edgecolor='k', linewidth=0.6, transform=fig.transFigure))
+        for fraction in (0, 0.5, 1):
+            fig.text((bar_left + fraction * bar_width) / page_width, y + 0.12 / page_height, '{:g}'.format(fraction * length), ha='center', va='bottom', fontsize=8)
+            
+        fig.text(right / page_width, y - 0.1 / page_height, '1 in = {:g} ft    Vertical exaggeration {:g}x'.format(feet_per_inch, self.vertical_exaggeration),
+                 ha='right', va='top', fontsize=8)
+        fig.text((bar_left + bar_width) / page_width + 0.05 / page_width, y + 0.04 / page_height, 'ft', ha='left', va='center', fontsize=8)
+        
+        
+    def close(self):
+        """
+        Finishes the pdf. A book with no pages still gets closed so the file isn't left open
+        """
+        
+        self.pdf.close()
+
+
+# =============================================================================
+#region Illustrator DXF
+# =============================================================================
+def save_illustrator_dxf(section, save_path, vertical_exaggeration, progress=None):
+    """ 
+    section               - CrossSection, with polygons and contacts already calculated
+    save_path             - string, the full path of the file being written
+    vertical_exaggeration - integer, distances are divided by this so the drawing matches the exaggerated plot
+    progress              - function or None, called as progress(steps done, total steps) while the file is built, about one step per formation.
+                            It can raise an exception to stop before anything is written
+    
+    Uses ezdxf to create an illustrator compatible file with layers. Hatches and contact lines included with this file
+    """
+    
+    section.update('contacts')
+    section.create_plot_limits()
+
+    #The last step is writing the file
+    total_steps = len(section.style_array)
+    if progress is not None:
+        progress(0, total_steps)
+
+    formation_chunk_dict = {}
+    ve_polygons = []
+    shortened_locations = np.array(section.locations) / vertical_exaggeration
+    shortened_distance  = np.array(section.distance) / vertical_exaggeration
+
+    for polygon in section.formation_polygons:
+        shortened_bottom = polygon[-1] / vertical_exaggeration
+        exaggerated_polygon = np.vstack((polygon[0:2], shortened_bottom))
+        ve_polygons.append(exaggerated_polygon)
+
+
+
+    for row, style in enumerate(section.style_array[:-1]):
+        null_indices = np.where(style == STYLE_N)[0]
+        formation_chunk_dict[row] = []
+
+        if null_indices.shape[0] == 0:
+            formation_polygon_chunk = ve_polygons[row].copy()
+            formation_chunk_dict[row].append(formation_polygon_chunk)
+
+        else:
+            for null_index ,null in enumerate(null_indices):
+
+                #Check if it is the last null
+                if null_index == len(null_indices)-1:
+
+                    if null == section.style_array.shape[1]-1:
+
+                        if len(null_indices) == 1:
+                            formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                            formation_polygon_chunk = ve_polygons[row][:, :formation_null_index].copy()
+
+                            #Handles interlocking fades at the end of formations, weird edge case that could show up
+                            if section.style_array[row, null-1] == STYLE_F and section.style_array[row+1, null] == STYLE_F:
+                                formation_polygon_chunk = ve_polygons[row].copy()
+                                no_nulls_columns = ~np.any(np.isnan(formation_polygon_chunk), axis=0)
+                                formation_polygon_chunk = formation_polygon_chunk[:, no_nulls_columns]
+
+                                formation_chunk_dict[row].append(formation_polygon_chunk)
+                        else:
+                            continue
+
+                    elif len(null_indices) == 1:
+                        #The formation chunk starts at the beginning of the array and ends at this null
+                        formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                        formation_polygon_chunk = ve_polygons[row][:, :formation_null_index].copy()
+                        formation_chunk_dict[row].append(formation_polygon_chunk)
+
+                        formation_polygon_chunk = ve_polygons[row][:, formation_null_index+1:].copy()
+
+                    else:
+                        # The formation polygon chunk is the entire thing after this null
+                        formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                        formation_polygon_chunk = ve_polygons[row][:, formation_null_index+1:].copy()
+
+                #Check if it is the first null
+                elif null_index == 0:
+                    #Check if there are any other nulls
+                    if len(null_indices) == 1:
+
+                        if null == 0:
+                            #The formation polygon chunk is the entire thing minus the first point
+                            formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                            formation_polygon_chunk = ve_polygons[row][:, formation_null_index+1:].copy()
+
+
+                        else: #The formation chunk starts at the beginning of the array and ends at this null
+                            formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                            formation_polygon_chunk = ve_polygons[row][:, :formation_null_index].copy()
+
+                            formation_chunk_dict[row].append(formation_polygon_chunk)
+
+                            formation_polygon_chunk = ve_polygons[row][:, formation_null_index+1:].copy()
+
+
+                    #Check if it has a null immediately after it
+                    elif null == null_indices[null_index+1]-1:
+                        formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                        formation_polygon_chunk = ve_polygons[row][:, :formation_null_index].copy()
+
+
+                    elif null == 0: #The formation polygon chunk starts after this null and ends at the next null
+                        formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                        next_formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null_indices[null_index+1]])[0][0]
+                        formation_polygon_chunk = ve_polygons[row][:, formation_null_index+1:next_formation_null_index].copy()
+
+
+
+                    else: #The formation chunk starts at the beginning of the array and ends at this null
+                        formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                        formation_polygon_chunk = ve_polygons[row][:, :formation_null_index].copy()
+
+
+                #Check if the null is just a normal null in the middle
+                else:
+                    #Check if it has a null immediately after it
+                    if null == null_indices[null_index+1]-1:
+                        continue #Skip to the next null
+
+                    else:#The formation polygon chunk starts after this null and ends at the next null
+                        formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null])[0][0]
+                        next_formation_null_index = np.where(ve_polygons[row][-1] == shortened_locations[null_indices[null_index+1]])[0][0]
+                        formation_polygon_chunk = ve_polygons[row][:, formation_null_index+1:next_formation_null_index].copy()
+
+
+                if formation_polygon_chunk.shape[1] != 0:
+                    formation_chunk_dict[row].append(formation_polygon_chunk)
+
+
+
+
+    #print(formation_chunk_dict)
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+
+    doc.layers.add(name='Formation_Polygons')
+    doc.layers.add(name='Solid_Contact_Lines')
+    doc.layers.add(name='Boreholes')
+    doc.layers.add(name='Dashed_Contact_Lines')
+    doc.layers.add(name='W-Numbers')
+    doc.layers.add(name='Scale_Bar')
+
+    if "DASHED" not in doc.linetypes:
+        doc.linetypes.new("DASHED", dxfattribs={"description": "Dashed __ __ __", "pattern": [20, 10, -10]})
+
+    line_points_list = []
+    for i in range(len(section.elev)):
+        if i == 0:
+            line_points_list.append((shortened_distance[i], section.top_of_bottom))
+            line_points_list.append((shortened_distance[i], section.elev[i]))
+
+        elif i == len(section.elev)-1:
+            line_points_list.append((shortened_distance[i], section.elev[i]))
+            line_points_list.append((shortened_distance[i], section.top_of_bottom))
+
+        else:
+            line_points_list.append((shortened_distance[i], section.elev[i]))
+
+    hatch = msp.add_hatch(dxfattribs={'layer':'Formation_Polygons'})
+    hatch.dxf.true_color = hex_to_rgb("#FFE563")
+    hatch.paths.add_polyline_path(line_points_list, is_closed = True)
+
+    for row, formation_chunk_list in formation_chunk_dict.items():
+
+        for formation_chunk in formation_chunk_list:
+            hatch_polyline_list = []
+            for i in range(formation_chunk.shape[1]):
+                hatch_polyline_list.append((formation_chunk[-1, i], formation_chunk[0, i]))
+
+            for j in range(formation_chunk.shape[1]-1, -1, -1):
+                hatch_polyline_list.append((formation_chunk[-1, j], formation_chunk[1, j]))
+
+            hatch = msp.add_hatch(dxfattribs={'layer':'Formation_Polygons'})
+            hatch.dxf.true_color = hex_to_rgb(section.plotting_colors[row])
+            hatch.paths.add_polyline_path(hatch_polyline_list, is_closed = True)
+
+        if progress is not None:
+            progress(row + 1, total_steps)
+
+    for line in section.solid_contacts:
+        line_points_list = []
+        for i in range(line.shape[1]):
+            line_points_list.append((line[-1, i] / vertical_exaggeration, line[0, i]))
+        msp.add_lwpolyline(line_points_list, dxfattribs={'layer':"Solid_Contact_Lines"})
+
+    for line in section.dashed_contacts:
+        line_points_list = []
+        for i in range(line.shape[1]):
+            line_points_list.append((line[-1, i] / vertical_exaggeration, line[0, i]))
+        msp.add_lwpolyline(line_points_list, dxfattribs={'linetype': 'DASHED', 'layer':"Dashed_Contact_Lines"})
+
+    for n in range(len(section.w_num)):
+        msp.add_line((shortened_locations[n], section.formations_array[-1, n]), (shortened_locations[n], section.well_elev[n]), dxfattribs={'layer': 'Boreholes'} )
+        msp.add_text(section.w_num_headers[n], dxfattribs={'insert':(shortened_locations[n], section.tallest_borehole+80), 'layer':'W-Numbers'})
+
+    line_points_list = []
+    for i in range(len(section.elev)):
+        line_points_list.append((shortened_distance[i], section.elev[i]))
+    msp.add_lwpolyline(line_points_list, dxfattribs={'layer':"Solid_Contact_Lines"})
+
+
+    rounded_top = round(section.tallest_borehole/50) * 50
+    rounded_bottom = round(section.deepest_borehole/50) * 50
+
+    if rounded_top < section.tallest_borehole:
+        rounded_top += 50 
+    if rounded_bottom > section.deepest_borehole:
+        rounded_bottom -= 50
+
+    meters_top = int(rounded_top / 3.281)
+    meters_bottom = int(rounded_bottom / 3.281)
+
+
+
+    #Adds vertical scale bar
+    msp.add_line((shortened_locations[0]-50, rounded_bottom), (shortened_locations[0]-50, rounded_top), dxfattribs={'layer':'Scale_Bar'})
+
+    #Adds the depth lines on the scale bar in feet
+    for depth in range(rounded_bottom, rounded_top+1, 10):
+        if depth % 50 == 0:
+            msp.add_line((shortened_locations[0]-70, depth), (shortened_locations[0]-50, depth), dxfattribs={'layer':'Scale_Bar'})
+            msp.add_text(str(depth), dxfattribs={'insert':(shortened_locations[0]-90, depth), 'layer':'Scale_Bar'})
+        else:
+            msp.add_line((shortened_locations[0]-60, depth), (shortened_locations[0]-50, depth), dxfattribs={'layer':'Scale_Bar'})
+
+    #Adds the depth lines on the scale bar in meters
+    for depth in range(meters_top+1):
+        if depth % 20 == 0:
+            msp.add_line((shortened_locations[0]-30, depth*3.281), (shortened_locations[0]-50, depth*3.281), dxfattribs={'layer':'Scale_Bar'})
+            msp.add_text(str(depth), dxfattribs={'insert':(shortened_locations[0]-20, depth*3.281), 'layer':'Scale_Bar'})
+
+    for depth in range(meters_bottom, 0):
+        if depth % 20 == 0:
+            msp.add_line((shortened_locations[0]-30, depth*3.281), (shortened_locations[0]-50, depth*3.281), dxfattribs={'layer':'Scale_Bar'})
+            msp.add_text(str(depth), dxfattribs={'insert':(shortened_locations[0]-20, depth*3.281), 'layer':'Scale_Bar'})
+
+    #Adds horizontal scale bar
+    shortened_mile = 5280 / vertical_exaggeration
+    msp.add_line((0, section.deepest_borehole - 500), (shortened_mile, section.deepest_borehole-500), dxfattribs={'layer': 'Scale_Bar'})
+
+    mile_markers = [0, 1320, 2640, 3960, 5280]
+
+    for marker in mile_markers:
+        msp.add_line((marker/vertical_exaggeration, section.deepest_borehole-500), (marker/vertical_exaggeration, section.deepest_borehole-450), dxfattribs={'layer': "Scale_Bar"})
+        msp.add_text(str(marker), dxfattribs={"insert":(marker/vertical_exaggeration, section.deepest_borehole-430)})
+
+    doc.saveas(save_path)
+    if progress is not None:
+        progress(total_steps, total_steps)
+
+
+# =============================================================================
+#region Autocad DXF
+# =============================================================================
+def save_autocad_dxf(section, save_path, vertical_exaggeration, progress=None):
+    """ 
+    section               - CrossSection, with polygons and contacts already calculated
+    save_path             - string, the full path of the file being written
+    vertical_exaggeration - integer, distances are divided by this so the drawing matches the exaggerated plot
+    progress              - function or None, called as progress(steps done, total steps) while the file is built, about one step per formation.
+                            It can raise an exception to stop before anything is written
+    
+    Uses ezdxf to create an autocad compatible file. Each formation is drawn as closed outlines on its own layer
+    """
+    
+    #The outlines take about as long as the formations together, they count as one step and the file as the last
+    total_steps = len(section.formations_list) + 2
+    if progress is not None:
+        progress(0, total_steps)
+
+    section.set_vertical_exaggeration(vertical_exaggeration)
+    section.update('contacts')
+    section.update('outlines')
+    if progress is not None:
+        progress(1, total_steps)
+    section.create_plot_limits()
+
+    shortened_locations = np.array(section.locations) / vertical_exaggeration
+    shortened_distance  = np.array(section.distance) / vertical_exaggeration
+    #print(formation_chunk_dict)
+    doc = ezdxf.new("R2000")
+    msp = doc.modelspace()
+
+    doc.layers.add(name='Formation_Polygons')
+    doc.layers.add(name='Surficial_Geology')
+    doc.layers.add(name='Boreholes')
+    doc.layers.add(name='Dashed_Contact_Lines')
+    doc.layers.add(name='W-Numbers')
+    doc.layers.add(name='Horizontal_Scale_Bar')
+    doc.layers.add(name='Horizontal_Scale_Bar_Text')
+    doc.layers.add(name='Vertical_Scale_Bar')
+    doc.layers.add(name='Vertical_Scale_Bar_Text')
+
+    if "DASHED" not in doc.linetypes:
+        doc.linetypes.new("DASHED", dxfattribs={"description": "Dashed __ __ __", "pattern": [100, 50, -50]})
+
+    #Adds the borehole lines
+    for n in range(len(section.w_num)):
+        msp.add_line((shortened_locations[n], section.formations_array[-1, n]), (shortened_locations[n], section.well_elev[n]), dxfattribs={'layer': 'Boreholes'} )
+        msp.add_text(section.w_num_headers[n], dxfattribs={'insert':(shortened_locations[n], section.tallest_borehole+80), 'layer':'W-Numbers'})
+
+    #Adds the Surface Elevation line
+    line_points_list = []
+    for i in range(len(section.elev)):
+        line_points_list.append((section.distance[i] / vertical_exaggeration, section.elev[i]))
+    msp.add_lwpolyline(line_points_list, dxfattribs={'layer':"Surficial_Geology"})
+
+    #Creates a rounded top and bottom for the scale bar
+    rounded_top = round(section.tallest_borehole/50) * 50
+    rounded_bottom = round(section.deepest_borehole/50) * 50
+
+    if rounded_top < section.tallest_borehole:
+        rounded_top += 50 
+    if rounded_bottom > section.deepest_borehole:
+        rounded_bottom -= 50
+
+    meters_top = int(rounded_top / 3.281)
+    meters_bottom = int(rounded_bottom / 3.281)
+
+    #Adds the vertical scale bar
+    msp.add_line((section.locations[0]-50, rounded_bottom), (section.locations[0]-50, rounded_top), dxfattribs={'layer':'Vertical_Scale_Bar'})
+
+    #Add the depth lines on the scale bar in feet
+    for depth in range(rounded_bottom, rounded_top+1, 10):
+        if depth % 50 == 0:
+            msp.add_line((section.locations[0]-70, depth), (section.locations[0]-50, depth), dxfattribs={'layer':'Vertical_Scale_Bar'})
+            msp.add_text(str(depth), dxfattribs={'insert':(section.locations[0]-90, depth), 'layer':'Vertical_Scale_Bar_Text'})
+        else:
+            msp.add_line((section.locations[0]-60, depth), (section.locations[0]-50, depth), dxfattribs={'layer':'Vertical_Scale_Bar'})
+
+    #Adds the depth lines on the scale bar in meters
+    for depth in range(meters_top):
+        if depth % 20 == 0:
+            msp.add_line((section.locations[0]-30, depth*3.281), (section.locations[0]-50, depth*3.281), dxfattribs={'layer':'Vertical_Scale_Bar'})
+            msp.add_text(str(depth), dxfattribs={'insert':(section.locations[0]-20, depth*3.281), 'layer':'Vertical_Scale_Bar_Text'})
+
+    for depth in range(meters_bottom, 0):
+        if depth % 20 == 0:
+            msp.add_line((section.locations[0]-30, depth*3.281), (section.locations[0]-50, depth*3.281), dxfattribs={'layer':'Vertical_Scale_Bar'})
+            msp.add_text(str(depth), dxfattribs={'insert':(section.locations[0]-20, depth*3.281), 'layer':'Vertical_Scale_Bar_Text'})
+
+    #Adds horizontal scale bar
+    shortened_mile = 5280 / vertical_exaggeration
+    msp.add_line((0, section.deepest_borehole - 110), (shortened_mile, section.deepest_borehole-110), dxfattribs={'layer': 'Horizontal_Scale_Bar'})
+
+    mile_markers = [0, 1320, 2640, 3960, 5280]
+
+    for marker in mile_markers:
+        msp.add_line((marker/vertical_exaggeration, section.deepest_borehole-120), (marker/vertical_exaggeration, section.deepest_borehole-110), dxfattribs={'layer': "Horizontal_Scale_Bar"})
+        msp.add_text(str(marker), dxfattribs={"insert":(marker/vertical_exaggeration, section.deepest_borehole-100), 'layer':'Horizontal_Scale_Bar_Text'})
+
+    #Somewhere somehow the formations list is being added to. It will contain Distance as the final value by the time it gets here
+    for done, (formation_name, outline_list) in enumerate(section.formation_outline_dict.items(), 2):
+        if progress is not None:
+            progress(min(done, total_steps - 1), total_steps)
+
+        if len(outline_list) == 0:
+            continue
+        else:
+
+            doc.layers.add(name=str(formation_name))
+            for outline in outline_list:
+                msp.add_lwpolyline(outline, close=True, dxfattribs={'layer':str(formation_name)})
+
+
+    doc.saveas(save_path)
+    if progress is not None:
+        progress(total_steps, total_steps)
+
+
+
+# =============================================================================
+#region SVG
+# =============================================================================
+#Fractions of the figure from create_figure around the axes: left, bottom, right and top. These are matplotlib's subplot defaults
+SVG_AXES_POSITION = (0.125, 0.11, 0.9, 0.88)
+
+
+def svg_path_data(x, y, precision, close=False):
+    """
+    x, y      - arrays, coordinates on the page in points. A NaN in either one breaks the line, the same as matplotlib
+    precision - integer, decimal places written for every coordinate
+    close     - bool, closes every piece back to its first point, for fills
+    
+    Returns the d attribute of a path with one M command per unbroken piece of the line
+    """
+    
+    finite = np.isfinite(x) & np.isfinite(y)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(np.int8), [0]))))
+    point_format = '{{:.{0}f}},{{:.{0}f}}'.format(precision).format
+    
+    pieces = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        if end - start < 2:
+            continue
+        points = np.round(np.column_stack((x[start:end], y[start:end])), precision) + 0.0 #Adding zero turns -0.0 into 0.0
+        pieces.append('M' + ' '.join(point_format(*point) for point in points.tolist()) + ('Z' if close else ''))
+    
+    return ''.join(pieces)
+
+
+def svg_fill_data(x, y1, y2, precision):
+    """
+    Returns the d attribute of the area between y1 and y2, the same shapes fill_between draws. Each unbroken piece is its own closed outline
+    """
+    
+    finite = np.isfinite(x) & np.isfinite(y1) & np.isfinite(y2)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(np.int8), [0]))))
+    
+    pieces = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        piece = slice(start, end)
+        pieces.append(svg_path_data(np.concatenate((x[piece], x[piece][::-1])), np.concatenate((y1[piece], y2[piece][::-1])), precision, close=True))
+    
+    return ''.join(pieces)
+
+
+def save_svg(section, save_path, vertical_exaggeration, fig_height=12, precision=1, progress=None):
+    """
+    section               - CrossSection, with polygons and contacts already calculated
+    save_path             - string, the full path of the file being written
+    vertical_exaggeration - integer, same as create_figure
+    fig_height            - float, height of the drawing in inches. The width is calculated from the vertical exaggeration
+    precision             - integer, decimal places of every coordinate. Coordinates are in points (1/72 inch) so 1 is already finer than
+                            any screen, 0 makes the smallest files
+    progress              - function or None, called as progress(steps done, total steps), about one step per formation
+    
+    Writes the same drawing as create_figure straight from the section's arrays: the formations, contacts, surface, boreholes, W-numbers and
+    a plain frame with ticks. Skipping matplotlib's figure and renderer makes this several times faster than saving the figure as svg and the
+    text is kept as text instead of glyph outlines, so the files are much smaller
+    """
+    
+    total_steps = len(section.formation_polygons) + 2
+    if progress is not None:
+        progress(0, total_steps)
+    
+    section.update('contacts')
+    section.create_plot_limits()
+    
+    #Page size, the same as create_figure
+    vertical_exaggeration_ratio = ((section.locations[-1]) / (section.tallest_borehole - section.deepest_borehole)) / vertical_exaggeration
+    page_width, page_height = vertical_exaggeration_ratio * fig_height * 72, fig_height * 72
+    left, bottom, right, top = SVG_AXES_POSITION
+    plot_left, plot_right = left * page_width, right * page_width
+    plot_top, plot_bottom = (1 - top) * page_height, (1 - bottom) * page_height
+    
+    #Axis limits the same way matplotlib picks them, the data's x range with a 5% margin on each side
+    x_data = np.concatenate([np.asarray(section.distance, dtype=float), np.asarray(section.locations, dtype=float)]
+                            + [formation[-1] for formation in section.formation_polygons] + [line[1] for line in section.solid_contacts + section.dashed_contacts])
+    x_min, x_max = np.nanmin(x_data), np.nanmax(x_data)
+    x_min, x_max = x_min - (x_max - x_min) * 0.05, x_max + (x_max - x_min) * 0.05
+    y_min, y_max = section.deepest_borehole - 50, section.tallest_borehole + 100
+    
+    x_scale = (plot_right - plot_left) / (x_max - x_min)
+    y_scale = (plot_bottom - plot_top) / (y_max - y_min)
+    page_x = lambda x: plot_left + (np.asarray(x, dtype=float) - x_min) * x_scale
+    page_y = lambda y: plot_bottom - (np.asarray(y, dtype=float) - y_min) * y_scale
+    number = '{{:.{}f}}'.format(precision).format
+    
+    line_width = matplotlib.rcParams['lines.linewidth']
+    dashes = ','.join(number(dash * line_width) for dash in matplotlib.rcParams['lines.dashed_pattern'])
+    font_size = matplotlib.rcParams['font.size']
+    
+    #fill_between also strokes the edge of each fill with its color, which closes the hairline gaps between formations
+    def fill(x, y1, y2, color):
+        color = matplotlib.colors.to_hex(color)
+        return '<path d="{}" fill="{}" stroke="{}" stroke-width="1"/>'.format(svg_fill_data(page_x(x), page_y(y1), page_y(y2), precision), color, color)
+    
+    def line(x, y, width, extra=''):
+        return '<path d="{}" fill="none" stroke="#000" stroke-width="{}"{}/>'.format(svg_path_data(page_x(x), page_y(y), precision), width, extra)
+    
+    distance = np.asarray(section.distance, dtype=float)
+    elev = np.asarray(section.elev, dtype=float)
+    
+    parts = ['<?xml version="1.0" encoding="utf-8"?>',
+             '<svg xmlns="http://www.w3.org/2000/svg" width="{0}pt" height="{1}pt" viewBox="0 0 {0} {1}">'.format(number(page_width), number(page_height)),
+             '<defs><clipPath id="plot"><rect x="{}" y="{}" width="{}" height="{}"/></clipPath></defs>'.format(
+                 number(plot_left), number(plot_top), number(plot_right - plot_left), number(plot_bottom - plot_top)),
+             '<rect width="100%" height="100%" fill="#fff"/>',
+             '<g clip-path="url(#plot)" stroke-linejoin="round">']
+    
+    #Drawn in the same order as the figure: fills, boreholes, contacts, sky and the surface line on top
+    parts.append(fill(distance, np.full(distance.shape, section.top_of_bottom), elev, "#FFE563"))
+    for runs, formation in enumerate(section.formation_polygons):
+        parts.append(fill(formation[-1], formation[0], formation[1], section.plotting_colors[runs]))
+        if progress is not None:
+            progress(runs + 1, total_steps)
+    
+    borehole_x, borehole_y = [], []
+    for n in range(len(section.w_num)):
+        borehole_x += [section.locations[n], section.locations[n], np.nan]
+        borehole_y += [max(section.borehole_TD[n], section.max_TD), section.well_elev[n], np.nan]
+    parts.append(line(borehole_x, borehole_y, line_width))
+    
+    for contacts, extra in ((section.solid_contacts, ' stroke-linecap="square"'), (section.dashed_contacts, ' stroke-dasharray="{}"'.format(dashes))):
+        #Each contact is its own piece of one path. Dashes start again at every M, the same as separate lines
+        if contacts:
+            parts.append(line(np.concatenate([np.append(contact[1], np.nan) for contact in contacts]),
+                              np.concatenate([np.append(contact[0], np.nan) for contact in contacts]), line_width, extra))
+    
+    parts.append(fill(distance, elev, np.full(distance.shape, section.tallest_borehole + 50), 'w'))
+    parts.append(line(distance, elev, 0.8))
+    parts.append('</g>')
+    
+    #W-numbers, 1% of the section length to the left of each well like the figure
+    parts.append('<g font-family="DejaVu Sans, Arial, sans-serif" font-size="{}">'.format(font_size))
+    label_y = number(page_y(section.tallest_borehole + 80))
+    for n in range(len(section.w_num)):
+        parts.append('<text x="{}" y="{}">{}</text>'.format(number(page_x(section.locations[n] - section.locations[-1] * 0.01)), label_y,
+                                                            escape('W-' + str(section.w_num[n]))))
+    
+    #Frame, ticks and axis labels
+    tick_length = 3.5
+    parts.append('<rect x="{}" y="{}" width="{}" height="{}" fill="none" stroke="#000" stroke-width="0.8"/>'.format(
+        number(plot_left), number(plot_top), number(plot_right - plot_left), number(plot_bottom - plot_top)))
+    ticks = []
+    #As many ticks as matplotlib's AutoLocator fits along each axis
+    tick_values = lambda low, high, length, spacing: ticker.MaxNLocator(nbins=max(min(int(length // (font_size * spacing)), 9), 1),
+                                                                        steps=[1, 2, 2.5, 5, 10]).tick_values(low, high)
+    for tick in tick_values(x_min, x_max, plot_right - plot_left, 3):
+        if x_min <= tick <= x_max:
+            x = number(page_x(tick))
+            ticks.append('M{},{}v{}'.format(x, number(plot_bottom), tick_length))
+            parts.append('<text x="{}" y="{}" text-anchor="middle">{:.10g}</text>'.format(x, number(plot_bottom + tick_length * 2 + font_size), tick))
+    widest_label = 0
+    for tick in tick_values(y_min, y_max, plot_bottom - plot_top, 2):
+        if y_min <= tick <= y_max:
+            y = number(page_y(tick))
+            ticks.append('M{},{}h{}'.format(number(plot_left), y, -tick_length))
+            parts.append('<text x="{}" y="{}" text-anchor="end" dominant-baseline="central">{:.10g}</text>'.format(number(plot_left - tick_length * 2), y, tick))
+            widest_label = max(widest_label, len('{:.10g}'.format(tick)))
+    parts.append('<path d="{}" stroke="#000" stroke-width="0.8"/>'.format(''.join(ticks)))
+    
+    parts.append('<text x="{}" y="{}" text-anchor="middle">Distance (ft)</text>'.format(number((plot_left + plot_right) / 2),
+                                                                                        number(plot_bottom + tick_length * 2 + font_size * 2.5)))
+    #Tick labels are about 0.6 of the font size wide per character
+    label_x = number(plot_left - tick_length * 2 - widest_label * font_size * 0.6 - font_size * 0.8)
+    parts.append('<text x="{0}" y="{1}" text-anchor="middle" transform="rotate(-90 {0} {1})">Elevation (ft)</text>'.format(
+        label_x, number((plot_top + plot_bottom) / 2)))
+    parts.append('</g>')
+    parts.append('</svg>')
+    
+    if progress is not None:
+        progress(total_steps - 1, total_steps)
+    
+    with open(save_path, 'w', encoding='utf-8') as file:
+        file.write('\n'.join(parts) + '\n')
+    
+    if progress is not None:
+        progress(total_steps, total_steps)
+    
+    return save_path
+
+
+# =============================================================================
+#region Export Queue
+# =============================================================================
+class ExportCancelled(Exception):
+    """
+    Raised inside an export by its progress function once the export has been cancelled, so it stops at its next step
+    """
+
+
+class ExportJob(object):
+    """
+    One export in an ExportQueue. status is pending, running, done, failed or cancelled. done and total are the last progress the
+    export reported, error is the message of a failed export
+    """
+    
+    def __init__(self, job_id, title, function, args):
+        self.job_id = job_id
+        self.title = title
+        self.function = function
+        self.args = args
+        self.status = 'pending'
+        self.done = 0
+        self.total = 0
+        self.error = None
+        self.result = None
+        self.cancel_requested = False
+        self.future = None
+        
+        
+    def finished(self):
+        return self.status in ('done', 'failed', 'cancelled')
+
+
+class ExportQueue(object):
+    """
+    Runs exports on a few background threads. Each export is given its own copy of the section when it is added, so the section can keep
+    being edited while the queue works through them. Used by the window's export queue and by scripts:
+        
+        queue = ExportQueue()
+        for dpi in (150, 300, 600):
+            queue.add_figures(section, {'png': 'section_{}.png'.format(dpi)}, 100, dpi=dpi)
+        queue.wait()
+    """
+    
+    def __init__(self, workers=2, on_change=None):
+        """
+        workers   - integer, number of exports written at the same time
+        on_change - function or None, called as on_change(job) whenever a job starts, reports progress or finishes. It is called
+                    on the thread running the export, the window passes a Qt signal's emit so it is handled on the main thread
+        """
+        
+        self.executor = futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export')
+        self.on_change = on_change
+        self.jobs = {} #Every job added, in the order they were added
+        self.last_job_id = 0
+        self.lock = threading.Lock()
+        
+        
+    def submit(self, title, function, *args):
+        """
+        title    - string, describes the export in the queue
+        function - called as function(*args, progress=progress) on one of the queue's threads
+        
+        Adds an export to the queue and returns its ExportJob. Nothing in args should be changed after it is added
+        """
+        
+        with self.lock:
+            self.last_job_id += 1
+            job = ExportJob(self.last_job_id, title, function, args)
+            self.jobs[job.job_id] = job
+            
+        job.future = self.executor.submit(self.run_job, job)
+        self.changed(job)
+        
+        return job
+    
+    
+    def add_figures(self, section, save_paths, vertical_exaggeration, fig_height=12, dpi=300):
+        """
+        Adds export_figures for a copy of the section as it is now. Returns the ExportJob
+        """
+        
+        title = '{} at {} dpi'.format(', '.join(save_paths.values()), dpi)
+        return self.submit(title, export_figures, copy.deepcopy(section), dict(save_paths), vertical_exaggeration, fig_height, dpi)
+    
+    
+    def add_dxf(self, section, save_path, vertical_exaggeration, illustrator=False):
+        """
+        Adds one of the DXF writers for a copy of the section as it is now. Returns the ExportJob
+        """
+        
+        function = save_illustrator_dxf if illustrator else save_autocad_dxf
+        return self.submit(save_path, function, copy.deepcopy(section), save_path, vertical_exaggeration)
+        
+        
+    def add_svg(self, section, save_path, vertical_exaggeration, fig_height=12, precision=1):
+        """
+        Adds save_svg for a copy of the section as it is now. Returns the ExportJob
+        """
+        
+        return self.submit(save_path, save_svg, copy.deepcopy(section), save_path, vertical_exaggeration, fig_height, precision)
+        
+        
+    def run_job(self, job):
+        """
+        Runs on one of the queue's threads
+        """
+        
+        def progress(done, total):
+            if job.cancel_requested:
+                raise ExportCancelled()
+            job.done, job.total = done, total
+            self.changed(job)
+            
+        if job.cancel_requested:
+            job.status = 'cancelled'
+            self.changed(job)
+            return
+        
+        job.status = 'running'
+        self.changed(job)
+        try:
+            job.result = job.function(*job.args, progress=progress)
+        except ExportCancelled:
+            job.status = 'cancelled'
+        except Exception as error:
+            job.error = '{}: {}'.format(type(error).__name__, error)
+            job.status = 'failed'
+        else:
+            job.status = 'done'
+        
+        job.args = None #The copy of the section isn't needed anymore
+        self.changed(job)
+        
+        
+    def cancel(self, job):
+        """
+        A job that hasn't started is removed from the queue, a running job stops at its next step. Finished jobs are not affected
+        """
+        
+        if job.finished():
+            return
+        
+        job.cancel_requested = True
+        if job.future.cancel():
+            job.status = 'cancelled'
+            job.args = None
+            self.changed(job)
+            
+            
+    def cancel_pending(self):
+        """
+        Cancels every job that hasn't started yet
+        """
+        
+        for job in list(self.jobs.values()):
+            if job.status == 'pending':
+                self.cancel(job)
+                
+                
+    def clear_finished(self):
+        """
+        Forgets the jobs that are done, failed or cancelled
+        """
+        
+        with self.lock:
+            self.jobs = {job_id: job for job_id, job in self.jobs.items() if not job.finished()}
+            
+            
+    def wait(self):
+        """
+        Waits until every job added so far has finished. Returns the list of jobs
+        """
+        
+        jobs = list(self.jobs.values())
+        futures.wait([job.future for job in jobs])
+        
+        return jobs
+    
+    
+    def shutdown(self):
+        """
+        Cancels every job and waits for the running ones to stop
+        """
+        
+        for job in list(self.jobs.values()):
+            self.cancel(job)
+        self.executor.shutdown(wait=True)
+        
+        
+    def changed(self, job):
+        if self.on_change is not None:
+            self.on_change(job)
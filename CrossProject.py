@@ -0,0 +1,143 @@
+"""
+Saves a whole CrossSection to a project file and opens it again. Everything the engine holds is kept: the data from the workbook,
+table and polygon edits, pinch/fade midpoints, fade teeth, colors, max TD and every calculated product. Opening a project doesn't
+read excel or recalculate anything, the products that were up to date when it was saved are still up to date.
+
+A project is a compressed .npz file. Each array in the section is stored as it is, everything around them (lists, dictionaries and
+settings) is described by a JSON manifest saved alongside. Nothing is pickled, so opening a project from someone else can't run code.
+"""
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from CrossSection import CrossSection
+
+
+#Bumped whenever the layout of the file changes. Projects made by a newer version are refused instead of being read wrong
+PROJECT_VERSION = 1
+PROJECT_EXTENSION = '.xsproj'
+MANIFEST = 'manifest'
+
+
+def encode_value(value, arrays):
+    """
+    value  - anything held by a CrossSection
+    arrays - dictionary, the arrays found are added to it under the names used in the manifest
+
+    Returns value as something json can write. Arrays are replaced by their name in arrays, and tuples, sets and dictionaries
+    are marked so they come back as the same type
+    """
+
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return {'objects': encode_value(value.tolist(), arrays), 'shape': list(value.shape)}
+        name = 'array_{}'.format(len(arrays))
+        arrays[name] = value
+        return {'array': name}
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [encode_value(item, arrays) for item in value]
+    if isinstance(value, tuple):
+        return {'tuple': [encode_value(item, arrays) for item in value]}
+    if isinstance(value, set):
+        return {'set': [encode_value(item, arrays) for item in sorted(value, key=str)]}
+    if isinstance(value, dict):
+        return {'dict': [[encode_value(key, arrays), encode_value(item, arrays)] for key, item in value.items()]}
+
+    raise TypeError('{} values can not be saved in a project'.format(type(value).__name__))
+
+
+def decode_value(value, arrays):
+    """
+    Undoes encode_value. arrays is the opened .npz file
+    """
+
+    if isinstance(value, list):
+        return [decode_value(item, arrays) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    if 'array' in value:
+        return arrays[value['array']]
+    if 'objects' in value:
+        return np.array(decode_value(value['objects'], arrays), dtype=object).reshape(value['shape'])
+    if 'tuple' in value:
+        return tuple(decode_value(item, arrays) for item in value['tuple'])
+    if 'set' in value:
+        return set(decode_value(item, arrays) for item in value['set'])
+    if 'dict' in value:
+        return {decode_value(key, arrays): decode_value(item, arrays) for key, item in value['dict']}
+
+    raise ValueError('Unknown value in project manifest: {}'.format(value))
+
+
+def save_project(section, filepath, settings=None, progress=None):
+    """
+    section  - CrossSection to save. It isn't changed
+    filepath - string, the project file written
+    settings - dictionary or None, window settings saved with the section such as the vertical exaggeration and figure height.
+               The values can be anything encode_value handles
+    progress - function or None, called as progress(steps done, steps to do)
+
+    Writes the project file. It is written under a temporary name and renamed when it is complete, so a failed save never leaves
+    half of a project in place of the one that was there. Returns filepath
+    """
+
+    if progress is not None:
+        progress(0, 2)
+
+    arrays = {}
+    manifest = {'version': PROJECT_VERSION,
+                'section': {name: encode_value(value, arrays) for name, value in vars(section).items()},
+                'settings': encode_value(settings or {}, arrays)}
+
+    if progress is not None:
+        progress(1, 2)
+
+    #The manifest is stored as bytes so the file can be opened without allow_pickle
+    arrays[MANIFEST] = np.frombuffer(json.dumps(manifest).encode('utf-8'), dtype=np.uint8)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(filepath)), suffix='.tmp', delete=False) as file:
+            temp_path = file.name
+            np.savez_compressed(file, **arrays)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if progress is not None:
+        progress(2, 2)
+
+    return filepath
+
+
+def load_project(filepath):
+    """
+    filepath - string, a project file written by save_project
+
+    Returns (section, settings). The section is exactly as it was saved, including which products are out of date
+    """
+
+    with np.load(filepath, allow_pickle=False) as stored:
+        if MANIFEST not in stored.files:
+            raise ValueError('{} is not a CrossPlot project'.format(filepath))
+        manifest = json.loads(stored[MANIFEST].tobytes().decode('utf-8'))
+
+        if manifest.get('version', 0) > PROJECT_VERSION:
+            raise ValueError('{} was saved by a newer version of CrossPlot'.format(filepath))
+
+        arrays = {name: stored[name] for name in stored.files if name != MANIFEST}
+
+    #Starts from a new section so anything added to CrossSection after the project was saved still has its default
+    section = CrossSection()
+    for name, value in manifest['section'].items():
+        setattr(section, name, decode_value(value, arrays))
+
+    return section, decode_value(manifest['settings'], arrays)
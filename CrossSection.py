@@ -0,0 +1,2371 @@
+"""
+The cross section engine. Everything needed to turn formation tops, styles, well locations and elevations into formation polygons,
+contact lines and outlines lives here so a section can be computed without building the Qt window.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+#calamine reads excel files several times faster than openpyxl. It is optional, pandas falls back to openpyxl without it
+try:
+    import python_calamine
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = None
+    
+#pyarrow reads CSV files on several threads. It is optional, pandas uses its own reader without it. Parquet files need it
+try:
+    import pyarrow
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = None
+    
+#Sheets of the template and the columns each one must have
+SHEET_NAMES = ['Elev', 'Xsecs']
+REQUIRED_COLUMNS = {'Elev': ['LiDAR_Elev', 'ACTUAL_DISTANCE'],
+                    'Xsecs': ['W_NUM', 'DIST_FT', 'DEM_ELEV', 'FORM_START', 'STYLE_START', 'CORE_OR_CUTTINGS']}
+
+
+#The style array is held as small integer codes, the letters are only used in the tables and excel sheets
+STYLE_N = 0 #No data
+STYLE_X = 1 #Formation top
+STYLE_P = 2 #Pinch
+STYLE_F = 3 #Fade
+STYLE_C = 4 #Connection
+STYLE_UNKNOWN = 255 #Anything else, like an empty cell in the excel sheet
+
+STYLE_CODES = {'n': STYLE_N, 'x': STYLE_X, 'p': STYLE_P, 'f': STYLE_F, 'c': STYLE_C}
+
+#Letter for every possible code so the whole array can be turned back into letters with one index
+STYLE_LETTERS = np.full(256, '', dtype='U1')
+for letter, code in STYLE_CODES.items():
+    STYLE_LETTERS[code] = letter
+
+
+def styles_to_codes(styles):
+    """
+    styles - 2D list or array of characters: x, p, f, c, n
+
+    Returns an array of uint8 style codes the same shape as styles. Anything that isn't one of the style letters becomes STYLE_UNKNOWN
+    """
+    letters = np.asarray(styles).astype('U')
+    codes = np.full(letters.shape, STYLE_UNKNOWN, dtype=np.uint8)
+    for letter, code in STYLE_CODES.items():
+        codes[letters == letter] = code
+
+    return codes
+
+
+def codes_to_styles(codes):
+    """
+    codes - array of uint8 style codes
+
+    Returns an array of style letters the same shape as codes. STYLE_UNKNOWN becomes an empty string
+    """
+    return STYLE_LETTERS[codes]
+
+
+def read_workbook(filepath):
+    """
+    filepath - string, path to an excel sheet in the cross section template (Elev and Xsecs sheets)
+
+    Opens the workbook once and reads both sheets. Returns the Elev and Xsecs sheets as DataFrames
+    """
+    with pd.ExcelFile(filepath, engine=EXCEL_ENGINE) as workbook:
+        sheets = workbook.parse(sheet_name=SHEET_NAMES)
+
+    return sheets['Elev'], sheets['Xsecs']
+
+
+def read_csv(filepath):
+    """
+    Reads one sheet of the template saved as a CSV file
+    """
+    if CSV_ENGINE is not None:
+        return pd.read_csv(filepath, engine=CSV_ENGINE)
+
+    #The default C parser can be off in the last digit, round_trip reads every number exactly as it was written
+    return pd.read_csv(filepath, float_precision='round_trip')
+
+
+#Files that hold one sheet of the template each instead of a workbook, name_Elev.csv and name_Xsecs.csv for example
+TABLE_READERS = {'.csv': read_csv, '.parquet': pd.read_parquet}
+
+
+def section_files(filepath):
+    """
+    filepath - string, a workbook, either file of a CSV or Parquet pair, or the name in front of _Elev and _Xsecs with the extension
+
+    Returns the list of files the section is read from. That is the workbook itself, or the Elev and Xsecs files of a pair
+    """
+    base, extension = os.path.splitext(filepath)
+    if extension.lower() not in TABLE_READERS:
+        return [filepath]
+
+    for sheet in SHEET_NAMES:
+        if base.endswith('_' + sheet):
+            base = base[:-len(sheet) - 1]
+
+    return ['{}_{}{}'.format(base, sheet, extension) for sheet in SHEET_NAMES]
+
+
+def read_tables(filepath):
+    """
+    filepath - string, see section_files
+
+    Returns the Elev and Xsecs sheets as DataFrames, from a workbook or from a CSV or Parquet pair
+    """
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension not in TABLE_READERS:
+        return read_workbook(filepath)
+
+    elev_path, cross_path = section_files(filepath)
+    return TABLE_READERS[extension](elev_path), TABLE_READERS[extension](cross_path)
+
+
+def check_tables(df_elev, df_cross, filepath):
+    """
+    Raises a ValueError naming what is wrong if the sheets don't follow the template. Every file type is checked the same way
+    """
+    for sheet, df in zip(SHEET_NAMES, [df_elev, df_cross]):
+        missing = [column for column in REQUIRED_COLUMNS[sheet] if column not in df.columns]
+        if missing:
+            raise ValueError('{} is missing the {} column(s) {}'.format(filepath, sheet, ', '.join(missing)))
+
+    #The formations are the columns between FORM_START and STYLE_START, their styles the columns between STYLE_START and CORE_OR_CUTTINGS
+    form_start, style_start, sample_type = [df_cross.columns.get_loc(column) for column in ['FORM_START', 'STYLE_START', 'CORE_OR_CUTTINGS']]
+    if not form_start < style_start < sample_type:
+        raise ValueError('{} must have the columns in the order FORM_START, formations, STYLE_START, styles, CORE_OR_CUTTINGS'.format(filepath))
+    if style_start - form_start != sample_type - style_start:
+        raise ValueError('{} has {} formation columns but {} style columns'.format(filepath, style_start - form_start - 1, sample_type - style_start - 1))
+
+
+def read_section_data(filepath):
+    """
+    filepath - string, an excel sheet in the cross section template (Elev and Xsecs sheets), or a pair of CSV or Parquet files
+               holding the same two sheets (see section_files)
+
+    Reads the section and returns its data as a dictionary of the arguments to CrossSection.set_section_data
+    """
+    df_elev, df_cross = read_tables(filepath)
+    check_tables(df_elev, df_cross, filepath)
+
+    #Here we split the well info sheet into formations and styles
+    df_formations = df_cross.loc[:, 'FORM_START' : 'STYLE_START'].drop(columns=['FORM_START', 'STYLE_START'])
+    df_style      = df_cross.loc[:, 'STYLE_START':'CORE_OR_CUTTINGS'].drop(columns=['STYLE_START', 'CORE_OR_CUTTINGS'])
+
+    #The sheet has one column per formation, the engine has one row per formation
+    return dict(w_num = df_cross['W_NUM'].tolist(),
+                dist_ft = df_cross['DIST_FT'].to_numpy(dtype=np.float64),
+                well_elev = df_cross['DEM_ELEV'].to_numpy(dtype=np.float64),
+                formations_list = df_formations.columns.tolist(),
+                formation_tops = df_formations.to_numpy(dtype=np.float64).T,
+                styles = df_style.to_numpy().T,
+                core_or_cuttings = df_cross['CORE_OR_CUTTINGS'].tolist(),
+                elev = df_elev['LiDAR_Elev'].to_numpy(dtype=np.float64),
+                distance = df_elev["ACTUAL_DISTANCE"].to_numpy(dtype=np.float64))
+
+
+#######################################################################################################################################################
+#######################################################################################################################################################
+#######################################################################################################################################################
+
+def check_left_right(style_row, index):
+    """
+    style_row - array of style codes
+    index     - integer of where a pinch or fade is said to be
+
+    Uses the index to search the style_row for the direction of pinching and fading.
+    """
+    # If it is the last item in the array then the direction is left
+    if index == (len(style_row)-1) and style_row[index - 1] == STYLE_N :
+        return 'left'
+    # If it is the first item in the array then the direction is right
+    elif index == 0 and style_row[index + 1] == STYLE_N:
+        return 'right'
+    # If both directions are void, then pinch in both directions
+    elif style_row[index - 1] == STYLE_N and style_row[index + 1] == STYLE_N:
+        return 'both'
+    # If the item before is void, pinch to the left
+    elif style_row[index - 1] == STYLE_N:
+        return 'left'
+    # If the item after is void pinch to the right
+    elif style_row[index + 1] == STYLE_N:
+        return 'right'
+
+#######################################################################################################################################################
+
+def direction_map(style_array):
+    """
+    style_array - array of style codes
+
+    Runs check_left_right on every cell of the style array at once. Returns an array the same shape with left, right, both or an empty string
+    where check_left_right would return None.
+    """
+    is_void = style_array == STYLE_N
+    #What check_left_right sees at index - 1 and index + 1. The first column wraps around to the last one the same way style_row[-1] does
+    void_left = np.roll(is_void, 1, axis=1)
+    void_right = np.roll(is_void, -1, axis=1)
+    void_right[:, -1] = False
+
+    directions = np.full(style_array.shape, '', dtype='U5')
+    directions[void_right] = 'right'
+    directions[void_left] = 'left'
+    directions[void_left & void_right] = 'both'
+    #The first item only checks to the right before anything else
+    directions[void_right[:, 0], 0] = 'right'
+
+    return directions
+
+#######################################################################################################################################################
+
+def find_bottom(pair_rows, row, index, direction):
+    """
+    pair_rows - array of integers, the next_pair_row table of a CrossSection. The first row at or below each row where a column and the one to its right are both x
+    row       - integer, the row of the style array currently being worked
+    index     - integer, the index at which the pinch of fade currently being calculated is at
+    direction - string: left, righ, both. The direction in which the formation pinches or fades
+
+    Finds the non np.nan values for the slope calculation later.
+    """
+    #Creates an empty list to add row number to later
+    slope_rows = []
+
+    if direction == 'left':
+        #The pair to the left of the pinch or fade starts one column over
+        slope_rows.append(pair_rows[row+1, index-1])
+
+    elif direction == 'right':
+        slope_rows.append(pair_rows[row+1, index])
+
+    elif direction == 'both': 
+        #If direction is both we need the left and the right pair
+        slope_rows.append(pair_rows[row+1, index-1])
+        slope_rows.append(pair_rows[row+1, index])
+
+    return slope_rows
+
+#######################################################################################################################################################
+
+def slope_calculator(formations_array, pair_rows, distance, row, index, direction, midpoint_ratio1, midpoint_ratio2=2):
+    """
+    formations_array - array of floats, top depth of formations
+    pair_rows        - array of integers, the next_pair_row table of a CrossSection
+    distance         - array of integers or floats, indicating the distance from the start of the cross section that each well is at
+    row              - integer, the row of the style array currently being worked
+    index            - integer, the index at which the pinch of fade currently being calculated is at
+    direction        - string: left, righ, both. The direction in which the formation pinches or fades 
+    """
+    
+    if direction == 'right':
+        slope_rows = find_bottom(pair_rows, row, index, direction)
+        depth1 = formations_array[slope_rows, index][0]
+        depth2 = formations_array[slope_rows, index+1][0]
+
+        distance1 = distance[index]
+        distance2 = distance[index+1]
+        
+
+        slope = (depth1 - depth2) / (distance1 - distance2)
+        midpoint = midpoint_ratio1
+        yintercept = depth1 - (slope * distance1)
+        point = (slope * midpoint) + yintercept
+
+
+        new_point = np.array([[point], [point], [midpoint]])
+
+        return new_point
+
+    elif direction == 'left':
+        slope_rows = find_bottom(pair_rows, row, index, direction)
+        depth1 = formations_array[slope_rows, index][0]
+        depth2 = formations_array[slope_rows, index-1][0]
+
+        distance1 = distance[index]
+        distance2 = distance[index-1]
+        
+
+        slope = (depth1 - depth2) / (distance1 - distance2)
+        midpoint = midpoint_ratio1
+        yintercept = depth1 - (slope * distance1)
+        point = (slope * midpoint) + yintercept
+
+        new_point = np.array([[point], [point], [midpoint]])
+
+        return new_point
+
+    
+    elif direction == 'both':
+        left_right_points = []
+        slope_rows = find_bottom(pair_rows, row, index, direction)
+        #Calculate the left point
+        
+        depth1 = formations_array[slope_rows[0], index]
+        depth2 = formations_array[slope_rows[0], index-1]
+
+        distance1 = distance[index]
+        distance2 = distance[index-1]
+        
+        slope = (depth1 - depth2) / (distance1 - distance2)
+        midpoint = midpoint_ratio1
+        yintercept = depth1 - (slope * distance1)
+        point = (slope * midpoint) + yintercept
+
+        new_point = np.array([[point], [point], [midpoint]])
+        left_right_points.append(new_point)
+
+        #Calculate the right point
+        depth1 = formations_array[slope_rows[1], index]
+        depth2 = formations_array[slope_rows[1], index+1]
+
+        distance1 = distance[index]
+        distance2 = distance[index+1]
+        
+        slope = (depth1 - depth2) / (distance1 - distance2)
+        midpoint = midpoint_ratio2
+        yintercept = depth1 - (slope * distance1)
+        point = (slope * midpoint) + yintercept
+
+        new_point = np.array([[point], [point], [midpoint]])
+        left_right_points.append(new_point)
+
+        return left_right_points
+
+
+
+
+def next_row_table(mask):
+    """
+    mask - 2D array of booleans, True where a row has usable data
+
+    Returns an array of integers one row taller than mask. Each value is the first row at or below that row where mask is True in the same column,
+    or mask.shape[0] if there isn't one. The extra row at the bottom means row+1 can always be looked up
+    """
+    padded = np.vstack([mask, np.ones((1, mask.shape[1]), dtype=bool)])
+    found = np.where(padded, np.arange(padded.shape[0])[:, None], mask.shape[0])
+    
+    return np.minimum.accumulate(found[::-1], axis=0)[::-1]
+
+#######################################################################################################################################################
+
+class PolygonBuilder(object):
+    """
+    base - array of floats, 3 rows (top, bottom, distance), one column per well
+
+    Collects the columns that are inserted into a formation polygon and builds the final polygon once at the end.
+    Each insert only records where the new columns go, so a row with many pinches and fades does not copy the whole polygon for every one.
+    Inserting at an index puts the new columns before the column currently at that index, the same as np.insert(..., axis=1).
+    """
+    
+    def __init__(self, base):
+        self.base = base
+        self.columns = [base]
+        self.total_columns = base.shape[1]
+        self.order = list(range(base.shape[1])) #Column order of the final polygon, as indexes into all the collected columns
+        
+    
+    def insert(self, index, new_columns):
+        """
+        index       - integer, where the new columns go in the polygon as it currently stands
+        new_columns - array of floats, 3 rows and any number of columns
+        """
+        
+        new_columns = np.asarray(new_columns, dtype=np.float64).reshape(3, -1)
+        first = self.total_columns
+        self.total_columns += new_columns.shape[1]
+        
+        self.columns.append(new_columns)
+        self.order[index:index] = range(first, self.total_columns)
+        
+        
+    def build(self):
+        """
+        Returns the finished polygon. If nothing was inserted the original array is returned
+        """
+        
+        if len(self.columns) == 1:
+            return self.base
+        
+        return np.hstack(self.columns)[:, self.order]
+    
+
+#######################################################################################################################################################
+#######################################################################################################################################################
+#######################################################################################################################################################
+
+
+#What each input or calculated product feeds into. Changing an input marks everything downstream of it as needing to be recalculated
+SECTION_GRAPH = {
+    #Inputs, changed by the window, the batch renderer or the setters below
+    'formation_tops':        ['initial_polygons'],
+    'formation_top_cells':   ['initial_polygons'], #Single tops changed with set_formation_top, only the formations using them are recalculated
+    'styles':                ['pinch_fade_dicts'],
+    'pinch_fade':            ['polygons'],
+    'polygon_edit':          ['contacts'],
+    'sample_type':           ['contacts'],
+    'max_TD':                ['total_depth'],
+    'vertical_exaggeration': ['outlines', 'plot'],
+    'colors':                ['plot'],
+    'figure_size':           ['plot'],
+    #Calculated products
+    'pinch_fade_dicts':      ['polygons'],
+    'initial_polygons':      ['polygons'],
+    'polygons':              ['total_depth'],
+    'total_depth':           ['contacts', 'outlines'],
+    'contacts':              ['plot'],
+    'outlines':              [],
+    'plot':                  [],
+}
+
+#The calculated products in the order they have to be made. The plot is drawn by whoever is showing the section
+PRODUCT_ORDER = ['pinch_fade_dicts', 'initial_polygons', 'polygons', 'total_depth', 'contacts', 'outlines', 'plot']
+
+
+def downstream(names):
+    """
+    names - list of strings, inputs or products in SECTION_GRAPH
+
+    Returns the set of every product that depends on any of the names
+    """
+    found = set()
+    to_check = list(names)
+    while to_check:
+        for product in SECTION_GRAPH[to_check.pop()]:
+            if product not in found:
+                found.add(product)
+                to_check.append(product)
+
+    return found
+
+
+def upstream(product):
+    """
+    product - string, a product in SECTION_GRAPH
+
+    Returns the set of products that have to be up to date before product can be made, including product itself
+    """
+    needed = {product}
+    for name in reversed(PRODUCT_ORDER):
+        if name in needed:
+            continue
+        if needed & set(SECTION_GRAPH[name]):
+            needed.add(name)
+
+    return needed
+
+#######################################################################################################################################################
+#######################################################################################################################################################
+#######################################################################################################################################################
+
+
+# =============================================================================
+#region CrossSection
+# =============================================================================
+class CrossSection(object):
+    """
+    Holds the data for a single cross section and calculates its geometry. The Ui_MainWindow in CrossPlot.py is a client of this class,
+    anything that does not need a widget should be done here.
+    """
+    
+    def __init__(self):
+        self.filepath = None
+        self.max_TD = -1000000000000
+        self.vertical_exaggeration = 100
+        self.changed_polygon_rows = None #Formations whose polygons need to be calculated again, None means all of them
+        self.changed_initial_rows = None #Formations whose initial polygons need to be made again, None means all of them
+        self.revision = 0 #Counts the edits, a copy of the section calculated elsewhere is out of date if its revision doesn't match
+        
+        #Products that are out of date. Nothing can be made until data is loaded
+        self.dirty = set(PRODUCT_ORDER)
+        
+        self.colors_list = ['#c0392b', '#e74c3c', '#9b59b6', '#8e44ad', '#2980b9', '#3498db', '#1abc9c', '#16a085', '#27ae60', '#2ecc71', '#f1c40f', '#f39c12', '#e67e22', '#d35400', '#34495e', '#2c3e50']
+        self.formation_colors = {"qh": "#E0A74D", "qbd": "#FFDB96", "qu": "#EBEB98", "tqu": "#DCC27D", "tc": "#CCCCCC", "th": "#75E5AB", "thp": "#92C272", "that": "#DEA0CB", "ts": "#B7B1F1", "to": "#6CD1E8", "tap": "#3460C1", "tha": "#FAC0CC" }
+        self.plotting_colors = []
+        
+        
+    def build_section(self):
+        """
+        Brings the polygons, TD and contact lines up to date. Used after new data is loaded
+        """
+        
+        self.update('contacts')
+        
+        return self
+    
+    
+    def mark_changed(self, *inputs):
+        """
+        inputs - strings, any of the inputs in SECTION_GRAPH: formation_tops, styles, pinch_fade, polygon_edit, sample_type, max_TD,
+                 vertical_exaggeration, colors, figure_size. Use set_formation_top instead of formation_top_cells
+        
+        Records that an input was changed. Only the products that depend on it are recalculated by the next update
+        """
+        
+        self.dirty |= downstream(inputs)
+        self.revision += 1
+        
+        #Without knowing which tops changed, every initial polygon has to be made again
+        if 'formation_tops' in inputs:
+            self.changed_initial_rows = None
+        
+        
+    def needs_update(self, product):
+        """
+        product - string, a product in PRODUCT_ORDER
+        
+        Returns True if the product is out of date
+        """
+        
+        return product in self.dirty
+    
+    
+    def mark_updated(self, product):
+        """
+        product - string, a product in PRODUCT_ORDER
+        
+        Used by clients for the products the engine doesn't make itself, like the plot, once they have made them
+        """
+        
+        self.dirty.discard(product)
+        
+        
+    def update(self, product='contacts', progress=None):
+        """
+        product  - string, a product in PRODUCT_ORDER
+        progress - function or None, called as progress(steps done, steps to do) before each step and once at the end.
+                   It can raise an exception to stop the update between steps, everything finished so far stays up to date
+        
+        Recalculates the out of date products that product depends on, then product itself. Nothing that is already up to date is recalculated.
+        Returns the list of products that were recalculated. The plot is never made here, it is left marked for the client
+        """
+        
+        steps = {'pinch_fade_dicts': self.create_pinch_fade_correction_dict,
+                 'initial_polygons': self.create_initial_polygon_list,
+                 'polygons': self.calculate_polygons,
+                 'total_depth': self.apply_max_TD,
+                 'contacts': self.create_contact_line_arrays,
+                 'outlines': lambda: self.create_formation_outlines(self.vertical_exaggeration)}
+        
+        needed = upstream(product)
+        to_do = [name for name in PRODUCT_ORDER if name in needed and name in self.dirty and name in steps]
+        recalculated = []
+        for name in to_do:
+            if progress is not None:
+                progress(len(recalculated), len(to_do))
+            steps[name]()
+            self.dirty.discard(name)
+            recalculated.append(name)
+            
+        if progress is not None:
+            progress(len(recalculated), len(to_do))
+                
+        return recalculated
+    
+    
+    def set_max_TD(self, max_TD=-1000000000000):
+        """
+        max_TD - float, the lowest elevation any well is drawn to
+        
+        Changes the max TD. It is applied to the polygons by the next update
+        """
+        
+        if max_TD != self.max_TD:
+            self.max_TD = max_TD
+            self.mark_changed('max_TD')
+            
+            
+    def set_vertical_exaggeration(self, vertical_exaggeration):
+        """
+        vertical_exaggeration - integer, used for the formation outlines
+        """
+        
+        if vertical_exaggeration != self.vertical_exaggeration:
+            self.vertical_exaggeration = vertical_exaggeration
+            self.mark_changed('vertical_exaggeration')
+
+    # =============================================================================
+    #region Intial Info
+    # =============================================================================
+    def create_initial_info (self, filepath, cache=None):
+        """
+        filepath - string, path to an excel sheet in the cross section template (Elev and Xsecs sheets), or to a CSV or Parquet pair
+                   with the same sheets (name_Elev.csv and name_Xsecs.csv)
+        cache    - WorkbookCache from CrossCache.py or None. A workbook that was read before and hasn't changed is loaded from the cache
+                   instead of reading the excel file again
+        
+        Pulls info from the selected excel sheet and generates arrays with formation tops, style, elevation, distance, w numbers and sample type.
+        """
+        
+        self.filepath = filepath
+        
+        #Pulls in data from excel sheets, or from the cache if this exact file has been read before
+        data = None
+        if cache is not None:
+            key = cache.key(*section_files(self.filepath))
+            data = cache.get(key)
+        if data is None:
+            data = read_section_data(self.filepath)
+            if cache is not None:
+                cache.put(key, data)
+                
+        self.set_section_data(**data)
+        
+        
+    def set_section_data(self, w_num, dist_ft, well_elev, formations_list, formation_tops, styles, core_or_cuttings, elev, distance):
+        """
+        w_num            - list of well numbers
+        dist_ft          - list or array of floats, distance from the previous well. The first value is ignored
+        well_elev        - list or array of floats, surface elevation of each well
+        formations_list  - list of formation names, the last one is the bottom of the cross section
+        formation_tops   - 2D list or array of floats, depth below surface of each formation top. One row per formation, one column per well
+        styles           - 2D list or array of characters: x, p, f, c, n. Same shape as formation_tops
+        core_or_cuttings - list of strings, CORE or CUTTINGS for each well
+        elev             - list or array of floats, surface elevation profile
+        distance         - list or array of floats, distance along the cross section for each surface elevation
+        
+        Takes the cross section data in the same layout as the excel template and generates the arrays used for the polygon calculations.
+        This is what create_initial_info uses after reading the excel sheet, it can also be called directly when the data comes from somewhere else.
+        """
+        
+        #This creates an array that can be plotted later. Surface elevation
+        self.elev = np.array(elev, dtype=np.float64)
+        self.distance = np.array(distance, dtype=np.float64)
+        self.elev_array = np.array([self.elev, self.distance])
+        
+        self.w_num = list(w_num)
+        self.w_num_headers = [ "W-" + str(w) for w in self.w_num]
+        self.core_or_cuttings = list(core_or_cuttings)
+
+        #This extracts the distances for each well from the distance to the previous well
+        self.locations = np.array(dist_ft, dtype=np.float64)
+        self.locations[0] = 0
+        self.locations = np.cumsum(self.locations)
+        
+        
+        self.well_elev = np.array(well_elev, dtype=np.float64)
+
+        #This creates a list of all the formation names
+        self.formations_list = list(formations_list)
+
+        #This creates an array of the formation tops
+        self.formations_array = np.array(formation_tops, dtype=np.float64)
+
+        #Creates a mask that is used for the true formation depth calculation later
+        not_elev = self.formations_array != 0
+        #Creates an array of repeated well elevations that is used to calculate true formation depth
+        elev_stack = np.repeat([self.well_elev], self.formations_array.shape[0], axis=0)
+
+        #Calculates true formation depth by the difference of elevation and formation top only for values that arent equal to 0
+        self.formations_array[not_elev] = elev_stack[not_elev] - self.formations_array[not_elev]
+        #Calculates true formation depth by the sum of elevation and formation top for the values that are 0
+        self.formations_array[~not_elev] = elev_stack[~not_elev] + self.formations_array[~not_elev]
+
+        #########################################################################################################################################################
+
+        #Creates an array of the style indicators that can be used for the polygon calculation decisions
+        self.style_array = styles_to_codes(styles)
+        
+        self.plotting_colors = []
+        runs = 0
+        for formation in self.formations_list:
+            if formation.lower() in self.formation_colors.keys():
+                self.plotting_colors.append(self.formation_colors[formation.lower()])
+            else:
+                self.plotting_colors.append(self.colors_list[runs])
+                runs += 1
+
+        self.borehole_TD = self.formations_array[-1].copy()
+        
+        #Everything is calculated from this data, so all of it is out of date
+        self.dirty = set(PRODUCT_ORDER)
+        self.revision += 1
+        self.changed_initial_rows = None
+        
+        
+    def create_initial_polygon_list(self):
+        """ 
+        Creates some rough formation polygons that can be added to and reshaped slightly in the formation polygon calculation below.
+        After set_formation_top only the initial polygons using the changed tops are made again
+        """
+        
+        if self.changed_initial_rows is None:
+            self.initial_polygon_list = [self.create_initial_polygon(row) for row in range(self.formations_array.shape[0] - 1)]
+            self.changed_polygon_rows = None #Every polygon has to be calculated again
+        else:
+            for row in sorted(self.changed_initial_rows):
+                self.initial_polygon_list[row] = self.create_initial_polygon(row)
+                
+            if self.changed_polygon_rows is not None:
+                self.changed_polygon_rows |= self.changed_initial_rows #Only these formations and the ones that use them are calculated again
+                
+        self.changed_initial_rows = set()
+        
+        
+    def create_initial_polygon(self, row):
+        """
+        row - integer, the formation
+        
+        Returns the initial polygon of one formation, its top and the top of the formation below it.
+        If the top of the formation is np.nan the bottom is too. Also makes sure that if the formation below has np.nan as a value,
+        it searches the next one down to make sure it has a number in the formation bottom
+        """
+        
+        first_row = np.copy(self.formations_array[row])
+        nan_template = np.isnan(first_row)
+
+        second_row = np.copy(self.formations_array[row + 1])
+        second_row[nan_template] = np.nan
+        nan_second = np.isnan(second_row)
+
+        run = 2
+        while not np.array_equal(nan_template, nan_second):
+            values_needed = nan_template != nan_second
+            second_row[values_needed] = self.formations_array[row + run][values_needed]
+            run += 1
+            nan_second = np.isnan(second_row)
+            
+        return np.array([first_row, second_row])
+    
+    
+    def set_formation_top(self, row, col, value):
+        """
+        row   - integer, the formation. The last row is the bottom of the section, the TD of each well
+        col   - integer, the well
+        value - float, the new top elevation. np.nan if the formation isn't in that well
+        
+        Changes a single formation top. The next update only remakes the initial polygons that use it, and only recalculates those formations
+        and the ones above them that use their polygons
+        """
+        
+        self.formations_array[row, col] = value
+        if row == self.formations_array.shape[0] - 1:
+            self.borehole_TD[col] = value
+            
+        self.mark_changed('formation_top_cells')
+        if self.changed_initial_rows is None:
+            return
+        
+        #The formation's own polygon starts at this top
+        if row < self.formations_array.shape[0] - 1:
+            self.changed_initial_rows.add(row)
+        
+        #The formation right above uses it as its bottom (pinches read it directly), and so does every formation above that
+        #which is missing in this well, since their bottoms are searched for further down
+        above = row - 1
+        while above >= 0:
+            self.changed_initial_rows.add(above)
+            if not np.isnan(self.formations_array[above, col]):
+                break
+            above -= 1
+            
+            
+    # =============================================================================
+    #region Pinch Fade Settings
+    # =============================================================================
+    def create_pinch_fade_correction_dict(self):
+        """ 
+        Creates dictionaries with pinch/fade lists, also creates well dictionaries for both and a tooth number dictionary.
+        These dictionaries are locations necessary for the user to edit these features in the front end and create some sort of change in the plot
+        """
+        
+        self.create_next_row_tables()
+        self.direction_array = direction_map(self.style_array)
+        
+        # Defining all the empty dictionaries
+        self.pinch_correction_dict = {}
+        self.fade_correction_dict = {}
+        
+        self.pinch_well_dict = {}
+        self.fade_well_dict = {}
+        
+        self.number_of_teeth_dict = {}
+        
+        #Loop for each row(formation) of the style array
+        for row in range(self.style_array.shape[0]):
+            #Create empty lists for each row that can be used to assign to each row(formation) in the dictionary
+            pinch_list = []
+            fade_list = []
+            fade_well_list = []
+            pinch_well_list = []
+            number_of_teeth_list = []
+            
+            #Loop for each column(well) in the style array
+            for col in range(self.style_array.shape[1]):
+                
+                if self.style_array[row, col] == STYLE_F: #Check for fading
+                    direction = self.direction_array[row, col] #Collect the direction to decide which locations values to add in what order
+                    
+                    if direction == 'left':
+                        fade_list.append(self.locations[col-1]) #Add the left well first 
+                        middle = (self.locations[col-1] + self.locations[col]) / 2 #Calculate the midpoint
+                        fade_list.append(middle) #Add the midpoint second
+                        fade_list.append(self.locations[col]) #Add the right well third
+                        fade_well_list.append('W-'+ str(self.w_num[col]) + ' Left') #Create a string with the form W-# direction for ease of use to the user
+                        number_of_teeth_list.append(7) # Add a default value for the teeth
+                        number_of_teeth_list.append(3) # Add a default value for the teeth
+                        
+                    elif direction == 'right':
+                        fade_list.append(self.locations[col]) #Add the left well first
+                        middle = (self.locations[col] + self.locations[col+1]) / 2 #Calculate the midpoint
+                        fade_list.append(middle) #Add the midpoint second
+                        fade_list.append(self.locations[col+1]) #Add the right well third
+                        fade_well_list.append('W-'+ str(self.w_num[col]) + ' Right') #Create a string with the form W-# direction for ease of use to the user
+                        number_of_teeth_list.append(7) # Add a default value for the teeth
+                        number_of_teeth_list.append(3) # Add a default value for the teeth
+                        
+                    elif direction == 'both': #In the case of both, the left point will be added first so that it is easy to read options as top-down = left-right
+                        fade_list.append(self.locations[col-1]) #Add the left well first
+                        middle = (self.locations[col-1] + self.locations[col]) / 2 #Calculate the midpoint
+                        fade_list.append(middle) #Add the midpoint second
+                        fade_list.append(self.locations[col]) #Add the right well third
+                        fade_well_list.append('W-'+ str(self.w_num[col]) + ' Left') #Create a string with the form W-# direction for ease of use to the user
+                        number_of_teeth_list.append(7) # Add a default value for the teeth
+                        number_of_teeth_list.append(3) # Add a default value for the teeth
+                        
+                        fade_list.append(self.locations[col]) #Add the left well first
+                        middle = (self.locations[col] + self.locations[col+1]) / 2 #Calculate the midpoint
+                        fade_list.append(middle) #Add the midpoint second
+                        fade_list.append(self.locations[col+1]) #Add the right point third
+                        fade_well_list.append('W-'+ str(self.w_num[col]) + ' Right') #Create a string with the form W-# direction for ease of use to the user
+                        number_of_teeth_list.append(7) # Add a default value for the teeth
+                        number_of_teeth_list.append(3) # Add a default value for the teeth
+                        
+                elif self.style_array[row, col] == STYLE_P: #Check for pinching
+                    direction = self.direction_array[row, col] #Collect the direction to decide which locations values to add in what order
+                    
+                    if direction == 'left':
+                        pinch_list.append(self.locations[col-1]) #Add the left point first
+                        middle = (self.locations[col-1] + self.locations[col]) / 2 #Calculate the midpoint
+                        pinch_list.append(middle) #Add the midpoint second
+                        pinch_list.append(self.locations[col]) #Add the right point third
+                        pinch_well_list.append('W-'+ str(self.w_num[col]) + ' Left') #Create a string with the form W-# direction for ease of use to the user
+    
+                    elif direction == 'right':
+                        pinch_list.append(self.locations[col]) #Add the left point first
+                        middle = (self.locations[col] + self.locations[col+1]) / 2
+                        pinch_list.append(middle) #Add the midpoint second
+                        pinch_list.append(self.locations[col+1]) #Add the right point third
+                        pinch_well_list.append('W-'+ str(self.w_num[col]) + ' Right') #Create a string with the form W-# direction for ease of use to the user
+    
+                    elif direction == 'both': #In the case of both, the left point will be added first so that it is easy to read options as top-down = left-right
+                        pinch_list.append(self.locations[col-1]) #Add the left point first
+                        middle = (self.locations[col-1] + self.locations[col]) / 2
+                        pinch_list.append(middle) #Add the midpoint second
+                        pinch_list.append(self.locations[col]) #Add the right point third
+                        pinch_well_list.append('W-'+ str(self.w_num[col]) + ' Left') #Create a string with the form W-# direction for ease of use to the user
+    
+                        pinch_list.append(self.locations[col]) #Add the left point first
+                        middle = (self.locations[col] + self.locations[col+1]) / 2
+                        pinch_list.append(middle) #Add the midpoint second
+                        pinch_list.append(self.locations[col+1]) #Add the right point third
+                        pinch_well_list.append('W-'+ str(self.w_num[col]) + ' Right') #Create a string with the form W-# direction for ease of use to the user
+
+            # Check if there is no pinching or fading in the formation and add that to the dictionary
+            if len(pinch_list) == 0:
+                pinch_list.append('No Pinch')
+                pinch_well_list.append("No Pinch")
+            if len(fade_list) == 0:
+                fade_list.append('No Fade')
+                fade_well_list.append('No Fade')
+                number_of_teeth_list.append('No Fade')
+            
+            #Create a key (row number) and definition (list) for each formation
+            self.pinch_correction_dict[row] = pinch_list
+            self.fade_correction_dict[row] = fade_list
+            
+            self.pinch_well_dict[row] = pinch_well_list
+            self.fade_well_dict[row] = fade_well_list
+            
+            self.number_of_teeth_dict[row] = number_of_teeth_list
+            
+        self.changed_polygon_rows = None #Every polygon has to be calculated again
+            
+            
+    def create_next_row_tables(self):
+        """
+        Creates the lookup tables used to find the next formation down that has data. These only depend on the style array,
+        so they are made once every time the styles change instead of searching down the style array for every pinch, fade and outline.
+        next_data_row     - the first row at or below each cell that isn't n
+        previous_data_row - the last row at or above each cell that isn't n, -1 if there isn't one
+        next_pair_row     - the first row at or below each cell where it and the cell to its right are both x
+        """
+        
+        has_data = self.style_array != STYLE_N
+        rows = np.arange(has_data.shape[0])[:, None]
+        
+        self.next_data_row = next_row_table(has_data)
+        self.previous_data_row = np.maximum.accumulate(np.where(has_data, rows, -1), axis=0)
+        
+        both_x = (self.style_array[:, :-1] == STYLE_X) & (self.style_array[:, 1:] == STYLE_X)
+        self.next_pair_row = next_row_table(both_x)
+        
+        
+    def set_pinch_fade_midpoint(self, pinch_or_fade, row, index, value):
+        """
+        pinch_or_fade - string: Pinch or Fade
+        row           - integer, the formation being edited
+        index         - integer, which pinch or fade in that formation is being edited
+        value         - float, the new distance of the middle point
+        
+        Changes the middle distance of a pinch or fade. Used by the pinch fade slider in the window
+        """
+        
+        #Adds an index correction so that it accesses the correct value in the list [left_borehole_distance, middle_distance, right_borehole_distance]
+        #Lists of the previous format are all concatenated so that a single formation has one list containing all the needed values 
+        index_correction = 3*index
+        
+        if pinch_or_fade == 'Pinch':
+            self.pinch_correction_dict[row][1+index_correction] = value
+        else:
+            self.fade_correction_dict[row][1+index_correction] = value
+            
+        self.mark_changed('pinch_fade')
+        if self.changed_polygon_rows is not None:
+            self.changed_polygon_rows.add(row) #Only this formation and the ones that use it are calculated again
+            
+            
+    def set_number_of_teeth(self, row, index, teeth):
+        """
+        row   - integer, the formation being edited
+        index - integer, which fade in that formation is being edited
+        teeth - integer, the number of teeth wanted in the fade
+        
+        Converts the number of teeth into the values required to create that many teeth in the fade
+        """
+        
+        #Changes the values used for that fade. Each fade has two values [linspace number, number of tiles]
+        self.number_of_teeth_dict[row][0+(2*index)] = (teeth * 2) - 1
+        self.number_of_teeth_dict[row][1+(2*index)] = teeth - 1
+        
+        self.mark_changed('pinch_fade')
+        if self.changed_polygon_rows is not None:
+            self.changed_polygon_rows.add(row) #Only this formation and the ones that use it are calculated again
+        
+
+    # =============================================================================
+    #region Calculate Polygons
+    # =============================================================================
+    def calculate_polygons(self):
+        """
+        ########################################################################################################################################################
+        # The final polygon creation                                                                                                                           #
+        # Each polygon will be created in the same form 3-rows, 2Dimensions                                                                                    #
+        # Row-1 is the formation top                                                                                                                           #
+        # Row-2 is the formation bottom                                                                                                                        #
+        # Row-3 is the corresponding x value for the depths in rows 1&2                                                                                        #
+        # Polygons will not necessarily be of the same length, this is why they are added to a list and calulated seperately.                                  #
+        # That is also why the polygons all will contain their own x values within them.                                                                       #
+        ########################################################################################################################################################
+        """
+        
+        if self.changed_polygon_rows is None:
+            self.formation_polygons = []
+            for row in range(len(self.initial_polygon_list)):
+                self.formation_polygons.append('placeholder')
+
+            #Works from the bottom up since formations use the finished polygons below them
+            for row in range(len(self.initial_polygon_list)-1, -1, -1):
+                self.formation_polygons[row] = self.calculate_polygon(row)
+        else:
+            self.calculate_changed_polygons()
+            
+        self.calculated_polygons = self.formation_polygons
+        self.formation_polygons = [polygon.copy() for polygon in self.calculated_polygons] #Copies so the TD limit and polygon edits don't change the calculated polygons
+        self.changed_polygon_rows = set()
+        
+        self.create_formations_TD()
+        
+        
+    def calculate_changed_polygons(self):
+        """
+        Recalculates only the formations whose pinch or fade settings changed, and the formations above them that use their polygons.
+        Every other formation keeps the polygon from the last calculation
+        """
+        
+        #A formation uses the polygon right below it, and searches further down through formations that are missing in some wells.
+        #So a changed polygon is passed up until a formation that has every well
+        passable = np.any(self.style_array == STYLE_N, axis=1) | np.any(np.isnan(self.formations_array), axis=1)
+        
+        to_calculate = set(self.changed_polygon_rows)
+        self.formation_polygons = list(self.calculated_polygons)
+        for row in range(len(self.initial_polygon_list)-1, -1, -1):
+            if row not in to_calculate:
+                continue
+            
+            old_polygon = self.formation_polygons[row]
+            self.formation_polygons[row] = self.calculate_polygon(row)
+            if old_polygon.shape == self.formation_polygons[row].shape and np.array_equal(old_polygon, self.formation_polygons[row], equal_nan=True):
+                continue
+            
+            above = row - 1
+            while above >= 0:
+                to_calculate.add(above)
+                if not passable[above]:
+                    break
+                above -= 1
+        
+        
+    def calculate_polygon(self, row):
+        """
+        row - integer, the formation being calculated
+        
+        Calculates the final polygon for one formation. The polygons of every formation below it have to be in self.formation_polygons already
+        """
+        
+        fade_teeth_offset = self.locations[-1] * 0.01
+        
+        if row == self.style_array.shape[0]-2:
+            #The last formation starts from the polygon made for the bottom of the cross section
+            total_stack = self.calculate_polygon(row+1)
+            sorted_fade_index = 'NO'
+            midpoint_correction_index = 0 #Used to keep track of which number to use in the midpoint correction list for this row. Found in pinch_fade_correction_dict
+            tooth_index_correction = 0
+            
+        elif row == self.style_array.shape[0]-1:
+            total_stack = self.initial_polygon_list[row-1].copy()
+            total_stack = np.vstack((total_stack, self.locations))
+            sorted_fade_index = 'NO'
+            midpoint_correction_index = 0 #Used to keep track of which number to use in the midpoint correction list for this row. Found in pinch_fade_correction_dict
+            tooth_index_correction = 0
+            
+        else: 
+            total_stack = self.initial_polygon_list[row].copy()
+            total_stack = np.vstack((total_stack, self.locations))
+            sorted_fade_index = 'NO'
+            midpoint_correction_index = 0 #Used to keep track of which number to use in the midpoint correction list for this row. Found in pinch_fade_correction_dict
+            tooth_index_correction = 0
+        
+        #Every tooth and pinch point for this row is collected by the builder and the final polygon is put together once after the pinches
+        polygon_builder = PolygonBuilder(total_stack)
+        
+        # =============================================================================
+        #region Fade
+        # =============================================================================
+       #Calculates formations thatn pinch
+        if np.any(self.style_array[row] == STYLE_F) and row != self.style_array.shape[0]-1:
+            
+
+            fade_index = np.where(self.style_array[row] == STYLE_F)[0]
+            sorted_fade_index = np.sort(fade_index)
+            insert_index_correction = 0 #Used to keep track of where to insert style features
+
+            for fade in fade_index:
+                direction = self.direction_array[row, fade]
+                
+        #Calculates the fade polygon if the formation fades left
+                if direction == 'left':
+                    insert_location = fade + insert_index_correction
+                    #Check for interlocking vs pool case
+                    if row != 0:
+                        #In interlocking cases, the above formation will be blocky and the below formation will have the teeth
+                        if np.all(self.style_array[row-1, fade-1:fade+1] == [STYLE_F, STYLE_N]): #Interlocking above
+                           
+                            #Calculate the universal values for this interlocking figure
+                            midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                            midpoint_correction_index += 3
+                            teeth_point = midpoint + fade_teeth_offset
+                            #Calculate the bottom slope values
+                            bottom_slope = (self.initial_polygon_list[row+1][0, fade-1] - self.initial_polygon_list[row][1, fade] ) / (self.locations[fade-1] - self.locations[fade])
+                            yintercept = self.initial_polygon_list[row][1, fade] - (bottom_slope * self.locations[fade])
+                            bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                            bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+                            #Calculate the top elev with thickness and bottom midpoint elevation
+                            top_slope = (self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row-1][0, fade-1]) / (self.locations[fade] - self.locations[fade-1])
+                            yintercept = self.initial_polygon_list[row][0, fade] - (top_slope * self.locations[fade])
+                            top_midpoint_elev = (top_slope * midpoint) + yintercept
+                            
+                            #Calculate the points between top and bottom
+                            peaks_and_troughs = np.linspace(bottom_midpoint_elev, top_midpoint_elev, num = self.number_of_teeth_dict[row][0+tooth_index_correction])
+                            peak_locations  = np.hstack((np.tile([midpoint, teeth_point], self.number_of_teeth_dict[row][1+tooth_index_correction] ), midpoint))
+                            bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev], self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))   
+
+                            interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+                            
+                            polygon_builder.insert(insert_location, interlock_figure_array)
+                            insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                            tooth_index_correction += 2
+
+                        elif np.all(self.style_array[row+1, fade-1:fade+1] == [STYLE_F, STYLE_N]):#Creates a blocky polygon to draw over if the formation below interlocks
+                            new_stack = np.array([[self.initial_polygon_list[row+1][0,fade-1]], [self.initial_polygon_list[row+1][1,fade-1]], [self.locations[fade-1]]])
+                            polygon_builder.insert(insert_location, new_stack)
+                            insert_index_correction += 1
+                        
+                        else:
+                            #Calculate the universal values for this interlocking figure
+                            thickness = self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row][1, fade]
+                            midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                            midpoint_correction_index += 3
+                            teeth_point = midpoint + fade_teeth_offset
+                            #Calculate the bottom slope values
+                            bottom_slope = (self.initial_polygon_list[row+1][0, fade-1] - self.initial_polygon_list[row][1, fade] ) / (self.locations[fade-1] - self.locations[fade])
+                            yintercept = self.initial_polygon_list[row][1, fade] - (bottom_slope * self.locations[fade])
+                            bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                            bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+                            #Calculate the top elev with thickness and bottom midpoint elevation
+                            top_midpoint_elev = bottom_midpoint_elev + thickness
+        
+                            #Calculate the points between top and bottom
+                            peaks_and_troughs = np.linspace(bottom_midpoint_elev, top_midpoint_elev, num = self.number_of_teeth_dict[row][0+tooth_index_correction])
+                            peak_locations  = np.hstack((np.tile([midpoint, teeth_point], self.number_of_teeth_dict[row][1+tooth_index_correction]), midpoint))
+                            bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev], self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))
+                            
+                            interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+                            
+                            polygon_builder.insert(insert_location, interlock_figure_array)
+                            insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                            tooth_index_correction += 2
+
+            #Calculates the fade polygon if the formation fades right
+                elif direction == 'right':
+                    insert_location = fade + insert_index_correction
+                    
+                    #Check for interlocking vs pool case
+                    if row != 0:
+                        #In interlocking cases, the above formation will be blocky and the below formation will have the teeth
+                        if np.all(self.style_array[row-1, fade:fade+2] == [STYLE_N, STYLE_F]): #Interlocking above
+                            midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                            midpoint_correction_index += 3
+                            teeth_point = midpoint - fade_teeth_offset
+
+                            top_slope = (self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row-1][0, fade+1]) / (self.locations[fade] - self.locations[fade+1])
+                            yintercept = self.initial_polygon_list[row][0, fade] - (top_slope * self.locations[fade])
+                            top_midpoint_elev = (top_slope * midpoint) + yintercept
+
+                            bottom_slope = (self.initial_polygon_list[row][1, fade] - self.initial_polygon_list[row-1][1, fade+1]) / (self.locations[fade] - self.locations[fade+1])
+                            yintercept = self.initial_polygon_list[row][1, fade] - (bottom_slope * self.locations[fade])
+                            bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                            bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+                            
+                            top_slope = (self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row-1][0, fade+1]) / (self.locations[fade] - self.locations[fade+1])
+                            yintercept = self.initial_polygon_list[row][0, fade] - (top_slope * self.locations[fade])
+                            top_midpoint_elev = (top_slope * midpoint) + yintercept
+
+                            peaks_and_troughs = np.linspace(top_midpoint_elev, bottom_midpoint_elev, num=self.number_of_teeth_dict[row][0+tooth_index_correction])
+                            peak_locations = np.hstack((np.tile([midpoint, teeth_point], self.number_of_teeth_dict[row][1+tooth_index_correction]), midpoint))
+                            bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev], self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))
+                            
+                            interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+        
+                            polygon_builder.insert(insert_location+1, interlock_figure_array)
+                            insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                            tooth_index_correction += 2
+                            
+                        elif np.all(self.style_array[row+1, fade:fade+2] == [STYLE_N, STYLE_F]): #Creates a blocky polygon to draw over if the formation below interlocks
+                            new_stack = np.array([[self.initial_polygon_list[row+1][0,fade+1]], [self.initial_polygon_list[row+1][1,fade+1]], [self.locations[fade+1]]])
+                            polygon_builder.insert(insert_location+1, new_stack)
+                            insert_index_correction += 1
+
+                        else:
+                            
+                            thickness = self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row][1, fade]
+                            midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                            midpoint_correction_index += 3
+                            teeth_point = midpoint - fade_teeth_offset
+                            
+                            left_borehole_index = np.where(self.formation_polygons[row+1][-1] == self.locations[fade])[0][0]
+                            right_borehole_index = np.where(self.formation_polygons[row+1][-1] == self.locations[fade+1])[0][0]
+                            
+                            bottom_slope = (self.formation_polygons[row+1][0, left_borehole_index] - self.formation_polygons[row+1][0, right_borehole_index]) / (self.locations[fade] - self.locations[fade+1])
+                            yintercept = self.formation_polygons[row+1][0, left_borehole_index] - (bottom_slope * self.locations[fade])
+                            bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                            bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+                            
+                        
+                            
+                            top_midpoint_elev = bottom_midpoint_elev + thickness
+
+                            peaks_and_troughs = np.linspace(top_midpoint_elev, bottom_midpoint_elev, num=self.number_of_teeth_dict[row][0+tooth_index_correction])
+                            peak_locations = np.hstack((np.tile([midpoint, teeth_point], self.number_of_teeth_dict[row][1+tooth_index_correction]), midpoint))
+                            bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev], self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))
+                            
+                            interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+
+                            polygon_builder.insert(insert_location+1, interlock_figure_array)
+                            insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                            tooth_index_correction += 2
+                            
+                    
+
+                elif direction == 'both':
+                    insert_location = fade + insert_index_correction
+
+                    #In interlocking cases, the above formation will be blocky and the below formation will have the teeth
+                    if np.all(self.style_array[row-1, fade-1:fade+1] == [STYLE_F, STYLE_N]): #Interlocks above
+                        #Calculate the universal values for this interlocking figure
+                        thickness = self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row][1, fade]
+                        midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                        midpoint_correction_index += 3
+                        teeth_point = midpoint + fade_teeth_offset
+                        #Calculate the bottom slope values
+                        bottom_slope = (self.initial_polygon_list[row+1][0, fade-1] - self.initial_polygon_list[row][1, fade] ) / (self.locations[fade-1] - self.locations[fade])
+                        yintercept = self.initial_polygon_list[row][1, fade] - (bottom_slope * self.locations[fade])
+                        bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                        bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+                        #Calculate the top elev with thickness and bottom midpoint elevation
+                        top_midpoint_elev = bottom_midpoint_elev + thickness
+                        
+                        #Calculate the points between top and bottom
+                        peaks_and_troughs = np.linspace(bottom_midpoint_elev, top_midpoint_elev, num = self.number_of_teeth_dict[row][0+tooth_index_correction])
+                        peak_locations  = np.hstack((np.tile([midpoint, teeth_point], self.number_of_teeth_dict[row][1+tooth_index_correction]), midpoint))
+                        bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev], self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))
+                        
+                        interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+                        
+                        polygon_builder.insert(insert_location, interlock_figure_array)
+                        insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                        tooth_index_correction += 2
+                            
+                        #Creates a blocky polygon to draw over if the formation below interlocks
+                    elif np.all(self.style_array[row+1, fade-1:fade+1] == [STYLE_F, STYLE_N]): #Interlocks below
+                        new_stack = np.array([[self.initial_polygon_list[row+1][0,fade-1]], [self.initial_polygon_list[row+1][1,fade-1]], [self.locations[fade-1]]])
+                        polygon_builder.insert(insert_location, new_stack)
+                        insert_index_correction += 1
+                        
+                    else: #No interlocking
+                        #Calculate the universal values for this interlocking figure
+                        thickness = self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row][1, fade]
+                        midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                        midpoint_correction_index += 3
+                        teeth_point = midpoint + fade_teeth_offset
+                        #Calculate the bottom slope values
+                        bottom_slope = (self.initial_polygon_list[row][1, fade] - self.initial_polygon_list[row+1][0, fade-1]) / (self.locations[fade] - self.locations[fade-1])
+                        yintercept = self.initial_polygon_list[row][1, fade] - (bottom_slope * self.locations[fade])
+                        bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                        bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+                        #Calculate the top elev with thickness and bottom midpoint elevation
+                        top_midpoint_elev = bottom_midpoint_elev + thickness
+                        
+                        #Calculate the points between top and bottom
+                        peaks_and_troughs = np.linspace(bottom_midpoint_elev, top_midpoint_elev, num = self.number_of_teeth_dict[row][0+tooth_index_correction])
+                        peak_locations  = np.hstack((np.tile([midpoint, teeth_point],self.number_of_teeth_dict[row][1+tooth_index_correction]), midpoint))
+                        bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev],self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))
+                        
+                        interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+                        
+                        polygon_builder.insert(insert_location, interlock_figure_array)
+                        insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                        tooth_index_correction += 2
+
+                    insert_location = fade + insert_index_correction
+                    #In interlocking cases, the above formation will be blocky and the below formation will have the teeth
+                    if np.all(self.style_array[row-1, fade:fade+2] == [STYLE_N, STYLE_F]): #Interlocks above
+                        midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                        midpoint_correction_index += 3
+                        teeth_point = midpoint - fade_teeth_offset
+
+                        top_slope = (self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row-1][0, fade+1]) / (self.locations[fade] - self.locations[fade+1])
+                        yintercept = self.initial_polygon_list[row][0, fade] - (top_slope * self.locations[fade])
+                        top_midpoint_elev = (top_slope * midpoint) + yintercept
+                           
+                        bottom_slope = (self.initial_polygon_list[row][1, fade] - self.initial_polygon_list[row-1][1, fade+1]) / (self.locations[fade] - self.locations[fade+1])
+                        yintercept = self.initial_polygon_list[row][0, fade] - (bottom_slope * self.locations[fade])
+                        bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                        bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+
+                        peaks_and_troughs = np.linspace(top_midpoint_elev, bottom_midpoint_elev, num=self.number_of_teeth_dict[row][0+tooth_index_correction])
+                        peak_locations = np.hstack((np.tile([midpoint, teeth_point], self.number_of_teeth_dict[row][1+tooth_index_correction]), midpoint))
+                        bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev], self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))
+                        
+                        interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+                        
+                        polygon_builder.insert(insert_location, interlock_figure_array)
+                        insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                        tooth_index_correction += 2
+                            
+                        #Creates a blocky polygon to draw over if the formation below interlocks
+                    elif np.all(self.style_array[row+1, fade:fade+2] == [STYLE_N, STYLE_F]): #Interlocks below
+                        new_stack = np.array([[self.initial_polygon_list[row+1][0,fade+1]], [self.initial_polygon_list[row+1][1,fade+1]], [self.locations[fade+1]]])
+                        polygon_builder.insert(insert_location+1, new_stack)
+                        insert_index_correction += 1
+                       
+                    else: #No interlocking
+                        thickness = self.initial_polygon_list[row][0, fade] - self.initial_polygon_list[row][1, fade]
+                        midpoint = self.fade_correction_dict[row][1 + midpoint_correction_index]
+                        midpoint_correction_index += 3
+                        teeth_point = midpoint - fade_teeth_offset
+
+                        bottom_slope = (self.initial_polygon_list[row][1, fade] - self.initial_polygon_list[row+1][0, fade+1]) / (self.locations[fade] - self.locations[fade+1])
+                        yintercept = self.initial_polygon_list[row][1, fade] - (bottom_slope * self.locations[fade])
+                        bottom_midpoint_elev = (bottom_slope * midpoint) + yintercept
+                        bottom_teeth_elev = (bottom_slope * teeth_point) + yintercept
+
+                        top_midpoint_elev = bottom_midpoint_elev + thickness
+
+                        peaks_and_troughs = np.linspace(top_midpoint_elev, bottom_midpoint_elev, num=self.number_of_teeth_dict[row][0+tooth_index_correction])
+                        peak_locations = np.hstack((np.tile([midpoint, teeth_point], self.number_of_teeth_dict[row][1+tooth_index_correction]), midpoint))
+                        bottom_array = np.hstack((np.tile([bottom_midpoint_elev, bottom_teeth_elev], self.number_of_teeth_dict[row][1+tooth_index_correction]), bottom_midpoint_elev))
+                        
+                        interlock_figure_array = np.vstack((peaks_and_troughs, bottom_array, peak_locations))
+                        
+                        polygon_builder.insert(insert_location+1, interlock_figure_array)
+                        insert_index_correction += self.number_of_teeth_dict[row][0+tooth_index_correction]
+                        tooth_index_correction += 2
+                        
+    ########################################################################################################################################################
+    # =============================================================================
+    #region Pinch
+    # =============================================================================
+
+    #Calculates the polygons for formations that pinch
+        if np.any(self.style_array[row] == STYLE_P) and row != self.style_array.shape[0]-1:
+            pinch_index = np.where(self.style_array[row] == STYLE_P)[0]
+            pinch_insert_correction = 0 #Keeps track of how many points have been added to the array to make sure next points are placed correctly
+            midpoint_correction_index = 0
+            
+            for pinch in pinch_index:
+
+                if type(sorted_fade_index) != str:
+                    #Check which fade indexes have a direction of both and double index correction accordingly
+                    index_compared_to_fade  = np.searchsorted(sorted_fade_index, pinch)
+                    runs = 0
+                    for fade in sorted_fade_index[:index_compared_to_fade]:
+                        fade_direction = self.direction_array[row, fade]
+                        if fade_direction == 'both':
+                            pinch_insert_correction += self.number_of_teeth_dict[row][runs*2]
+                            runs += 1
+                            pinch_insert_correction += self.number_of_teeth_dict[row][runs*2]
+                            runs += 1
+                        else:
+                            pinch_insert_correction += self.number_of_teeth_dict[row][runs*2]
+                            runs += 1
+                else:
+                    pinch_insert_correction =  pinch_insert_correction
+
+                #Figure out direction of pinch
+                direction = self.direction_array[row, pinch]
+                #Calculate midpoint of next formation top
+                
+                #Inserts the new data point into the polygon at the right location
+                if direction == 'left':
+                    #new_point = slope_calculator(self.formations_array, self.next_pair_row, self.locations, row, pinch, direction, self.pinch_correction_dict[row][1+midpoint_correction_index])
+                    
+                    
+                    distance1 = self.locations[pinch]
+                    distance2 = self.locations[pinch-1]
+                    
+                    if row == len(self.initial_polygon_list)-1:
+                    
+                        depth1 = self.formations_array[row+1, pinch]
+                        depth2 = self.formations_array[row+1, pinch-1]
+                        
+                    else:
+                        depth2 = np.nan
+                        runs = 1
+                        
+                        while np.isnan(depth2):
+                            
+                            depth1_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance1)[0][0]
+                            depth2_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance2)[0][0]
+                        
+                            depth1 = self.formation_polygons[row+runs][0, depth1_formation_index]
+                            depth2 = self.formation_polygons[row+runs][0, depth2_formation_index]
+                            
+                            runs += 1
+                    
+                    
+                    
+                    slope = (depth1 - depth2) / (distance1 - distance2)
+                    midpoint = self.pinch_correction_dict[row][1+midpoint_correction_index]
+                    yintercept = depth1 - (slope * distance1)
+                    point = (slope * midpoint) + yintercept
+
+
+                    new_point = np.array([[point], [point], [midpoint]])
+                    
+                    
+                    
+                    
+                    midpoint_correction_index += 3
+                    insert_location = pinch + pinch_insert_correction 
+                    polygon_builder.insert(insert_location, new_point)
+                    pinch_insert_correction +=1
+                    
+                #Adds the point to the right by adding one to the insert location index
+                elif direction == 'right':
+                    #new_point = slope_calculator(self.formations_array, self.next_pair_row, self.locations, row, pinch, direction, self.pinch_correction_dict[row][1+midpoint_correction_index])
+                    distance1 = self.locations[pinch]
+                    distance2 = self.locations[pinch+1]
+                    
+                    if row == len(self.initial_polygon_list)-1:
+                    
+                        depth1 = self.formations_array[row+1, pinch]
+                        depth2 = self.formations_array[row+1, pinch+1]
+                        
+                    else:
+                        depth2 = np.nan
+                        runs = 1
+                        
+                        while np.isnan(depth2):
+                            
+                            depth1_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance1)[0][0]
+                            depth2_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance2)[0][0]
+                        
+                            depth1 = self.formation_polygons[row+runs][0, depth1_formation_index]
+                            depth2 = self.formation_polygons[row+runs][0, depth2_formation_index]
+                            
+                            runs += 1
+                    
+                    
+                    
+                    slope = (depth1 - depth2) / (distance1 - distance2)
+                    midpoint = self.pinch_correction_dict[row][1+midpoint_correction_index]
+                    yintercept = depth1 - (slope * distance1)
+                    point = (slope * midpoint) + yintercept
+
+
+                    new_point = np.array([[point], [point], [midpoint]])
+                    
+                    
+                    midpoint_correction_index += 3
+                    insert_location = pinch + pinch_insert_correction + 1
+                    polygon_builder.insert(insert_location, new_point)
+                    pinch_insert_correction +=1
+
+
+                #Combines the two methods from before to add in two points, one left and one right
+                elif direction == 'both':
+                    left_right_points = []
+                    #new_point = slope_calculator(self.formations_array, self.next_pair_row, self.locations, row, pinch, direction, self.pinch_correction_dict[row][1+midpoint_correction_index], self.pinch_correction_dict[row][4+midpoint_correction_index])
+                    distance1 = self.locations[pinch]
+                    distance2 = self.locations[pinch-1]
+                    distance3 = self.locations[pinch+1]
+                    
+                    
+                    if row == len(self.initial_polygon_list)-1:
+                    
+                        depth1 = self.formations_array[row+1, pinch]
+                        depth2 = self.formations_array[row+1, pinch-1]
+                        
+                    else:
+                        depth2 = np.nan
+                        runs = 1
+                        
+                        while np.isnan(depth2):
+                            
+                            depth1_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance1)[0][0]
+                            depth2_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance2)[0][0]
+                        
+                            depth1 = self.formation_polygons[row+runs][0, depth1_formation_index]
+                            depth2 = self.formation_polygons[row+runs][0, depth2_formation_index]
+                            
+                            runs += 1
+                    
+                    
+                    
+                    slope = (depth1 - depth2) / (distance1 - distance2)
+                    midpoint = self.pinch_correction_dict[row][1+midpoint_correction_index]
+                    yintercept = depth1 - (slope * distance1)
+                    point = (slope * midpoint) + yintercept
+                    midpoint_correction_index += 3
+
+                    new_point = np.array([[point], [point], [midpoint]])
+                    left_right_points.append(new_point)
+                    
+                    
+                    
+                    if row == len(self.initial_polygon_list)-1:
+                    
+                        depth1 = self.formations_array[row+1, pinch]
+                        depth3 = self.formations_array[row+1, pinch+1]
+                        
+                    else:
+                        depth3 = np.nan
+                        runs = 1
+                        
+                        while np.isnan(depth3):
+                            
+                            depth1_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance1)[0][0]
+                            depth3_formation_index = np.where(self.formation_polygons[row+runs][-1] == distance3)[0][0]
+                        
+                            depth1 = self.formation_polygons[row+runs][0, depth1_formation_index]
+                            depth3 = self.formation_polygons[row+runs][0, depth3_formation_index]
+                            
+                            runs += 1
+                    
+                    
+                    slope = (depth1 - depth3) / (distance1 - distance3)
+                    midpoint = self.pinch_correction_dict[row][1+midpoint_correction_index]
+                    yintercept = depth1 - (slope * distance1)
+                    point = (slope * midpoint) + yintercept
+                    
+                    new_point = np.array([[point], [point], [midpoint]])
+                    left_right_points.append(new_point)
+                    
+                    
+                    insert_location= pinch + pinch_insert_correction
+                    polygon_builder.insert(insert_location, left_right_points[0])
+                    pinch_insert_correction +=1
+
+                    insert_location = pinch + pinch_insert_correction + 1
+                    polygon_builder.insert(insert_location, left_right_points[1])
+                    pinch_insert_correction +=1
+                    midpoint_correction_index += 6
+                
+        total_stack = polygon_builder.build()
+        
+    ########################################################################################################################################################
+    # =============================================================================
+    #region Normal
+    # =============================================================================
+    #Calculates the polygons for formations that dont fade or pinch
+        if ~np.any(self.style_array[row] == STYLE_P) and ~np.any(self.style_array[row] == STYLE_F) and row != self.style_array.shape[0]-1:
+            #Checks if the next formation down pinches or fades
+            if np.any(self.style_array[row+1] == STYLE_F) or np.any(self.style_array[row+1] == STYLE_P):
+                #If it does, the index of where it pinches or fades will be used to replace the bottom value of the top formation with the bottom value
+                #of the lower formation, this is for ease of plotting later on.
+                total_stack = self.initial_polygon_list[row].copy()
+                bottom_replacements = (self.style_array[row+1] == STYLE_F) | (self.style_array[row+1] == STYLE_P)
+                total_stack[1][bottom_replacements] = self.initial_polygon_list[row+1][1][bottom_replacements]
+                #Lastly it creates the final polygon in the form of a 3-row 2D array and adds it to a list
+                if row != len(self.initial_polygon_list)-2 :
+                    bottom_replacements = (self.style_array[row+2] == STYLE_F) | (self.style_array[row+2] == STYLE_P)
+                    total_stack[1][bottom_replacements] = self.initial_polygon_list[row+2][1][bottom_replacements]
+                    
+                #Connect formation across data gaps, particularly below shallow wells this is important
+                if total_stack.shape[0] == 2:
+                    total_stack = np.vstack((total_stack, self.locations))
+                
+            if np.any(self.style_array[row+1] == STYLE_C):
+                connection_below = np.where(self.style_array[row+1] == STYLE_C)[0]
+                for connection in connection_below:
+                    
+                    if row != self.style_array.shape[0]-2:
+                        connection_top_index = np.where(self.formation_polygons[row+1][-1] == self.locations[connection])[0]
+                        connection_top = self.formation_polygons[row+1][0, connection_top_index]
+                    
+                    
+                        if np.isin(self.locations[connection], total_stack[-1]):
+                            bottom_to_be_replaced = np.where(total_stack[-1] == self.locations[connection])
+                            total_stack[1,bottom_to_be_replaced] = connection_top
+                        
+                        else:
+                            bottom_replace_index = np.searchsorted(total_stack[-1], self.locations[connection])
+                            total_stack = np.insert(total_stack, bottom_replace_index, connection_top)
+                   
+            
+            if total_stack.shape[0] == 2:
+                total_stack = np.vstack((total_stack, self.locations))
+            
+  ###############################################################################################################################################################          
+        # =============================================================================
+        #region Connect
+        # =============================================================================
+        #Calculates polygons with connections
+        if np.any(self.style_array[row] == STYLE_C):
+            connect_index = np.where(self.style_array[row] == STYLE_C)[0] #Creates an array of all the indexes where the style is c
+           
+            
+            
+            #Initiates some empty diccionaries and lists to work with
+            connect_groups = {}
+            current_group = []
+            group_id = 1
+
+            # Iterates through connect_index to group consecutive indices
+            for i in range(len(connect_index)):
+                if i == 0 or connect_index[i] == connect_index[i - 1] + 1:
+                    # Add to current group if index is consecutive
+                    current_group.append(connect_index[i])
+                else:
+                    # Save the current group and start a new one
+                    connect_groups[group_id] = current_group
+                    group_id += 1
+                    current_group = [connect_index[i]]
+
+            # Add the last group
+            if current_group:
+                connect_groups[group_id] = current_group
+                
+            #Begins using the previously made groups to calculate points
+            for group in connect_groups.keys():
+                if row != len(self.initial_polygon_list):
+                    left_index = connect_groups[group][0] - 1
+                    right_index = connect_groups[group][-1] + 1
+                    
+                    left_dist = self.locations[left_index]
+                    left_elev = self.initial_polygon_list[row][0, left_index]
+                
+                    right_dist = self.locations[right_index]
+                    right_elev = self.initial_polygon_list[row][0, right_index]
+                    
+                #Calculate the slope of the top
+                    slope = (right_elev - left_elev) / (right_dist - left_dist)
+                    y_intercept = right_elev - (right_dist * slope)
+                
+                else:
+                    left_index = connect_groups[group][0] - 1
+                    right_index = connect_groups[group][-1] + 1
+                
+                for connection in connect_groups[group]:
+                    if row != len(self.initial_polygon_list):
+                        connection_point = self.locations[connection] * slope + y_intercept
+                    
+                        
+                    if row == len(self.initial_polygon_list):
+                        
+                        
+                        
+                        slope = (self.initial_polygon_list[row-1][1, right_index] - self.initial_polygon_list[row-1][1, left_index]) / (self.locations[right_index] - self.locations[left_index])
+                        y_intercept = self.initial_polygon_list[row-1][1, right_index] - (self.locations[right_index] * slope)
+                        
+                        connection_point_bottom = self.locations[connection] * slope + y_intercept
+                        
+                        replacement_index = np.where(total_stack[-1] == self.locations[connection])[0]
+                        total_stack[1, replacement_index] = connection_point_bottom
+                        
+                       
+                    elif row == len(self.initial_polygon_list)-1:
+                        connection_point_bottom = (self.formations_array[row+1, left_index] + self.formations_array[row+1, right_index]) / 2
+                            
+                    else:
+                        if self.style_array[row+1, connection] == STYLE_C or self.style_array[row+1, connection] == STYLE_X:
+                            bottom_connection_point_index = np.where(self.formation_polygons[row+1][-1] == self.locations[connection])[0][0]
+                            connection_point_bottom = self.formation_polygons[row+1][0, bottom_connection_point_index]
+                            
+                        elif self.style_array[row+1, connection] == STYLE_F or self.style_array[row+1, connection] == STYLE_P:
+                            bottom_connection_point_index = np.where(self.formation_polygons[row+1][-1] == self.locations[connection])[0][0]
+                            connection_point_bottom = self.formation_polygons[row+1][1, bottom_connection_point_index]
+
+                        else:
+                            runs = self.next_data_row[row+1, connection] - row
+                            bottom_connection_point_index = np.where(self.formation_polygons[row+runs][-1] == self.locations[connection])[0][0]
+                            connection_point_bottom = self.formation_polygons[row+runs][1, bottom_connection_point_index]
+                    
+                    if row != len(self.initial_polygon_list):
+                        point_array = np.array([[connection_point], [connection_point_bottom], [self.locations[connection]]])
+                        insert_index = np.where(total_stack[-1] == self.locations[connection])[0]
+                        total_stack[:, insert_index] = point_array
+        
+        """
+        print("Row", row)
+        print(total_stack)
+        """
+        
+        return total_stack
+
+    def create_formations_TD(self):
+        """
+        Creates an array containing the total depth along the bottom of the cross section
+        The first row is the depth
+        Second row is the location
+        Third row is the formation
+        """
+
+        total_depths = []
+        TD_locations = []
+        TD_formations = []
+        for style_column in range(self.style_array.shape[1]):
+            #The lowest formation above the bottom of the cross section that has data in this well
+            runs = self.previous_data_row[-2, style_column]
+            
+
+            if self.style_array[runs, style_column] == STYLE_F or self.style_array[runs, style_column] == STYLE_P:
+                
+                direction = self.direction_array[runs, style_column]
+                if direction == 'left':
+                    left_borehole_location = self.locations[style_column-1]
+                    right_borehole_location = self.locations[style_column]
+                    mask = (self.formation_polygons[runs][-1] > left_borehole_location) & (self.formation_polygons[runs][-1] <= right_borehole_location)
+                    TD_chunk = self.formation_polygons[runs][1, mask]
+                    locations_chunk = self.formation_polygons[runs][-1, mask]
+                    for point in range(TD_chunk.shape[0]):
+                        TD_formations.append(runs)
+                        total_depths.append(TD_chunk[point])
+                        TD_locations.append(locations_chunk[point])
+                    
+                elif direction == 'right':
+                    left_borehole_location = self.locations[style_column]
+                    right_borehole_location = self.locations[style_column+1]
+                    mask = (self.formation_polygons[runs][-1] >= left_borehole_location) & (self.formation_polygons[runs][-1] < right_borehole_location)
+                    TD_chunk = self.formation_polygons[runs][1, mask]
+                    locations_chunk = self.formation_polygons[runs][-1, mask]
+                    for point in range(TD_chunk.shape[0]):
+                        TD_formations.append(runs)
+                        total_depths.append(TD_chunk[point])
+                        TD_locations.append(locations_chunk[point])
+                    
+                elif direction == "both":
+                    left_borehole_location = self.locations[style_column-1]
+                    right_borehole_location = self.locations[style_column+1]
+                    mask = (self.formation_polygons[runs][-1] > left_borehole_location) & (self.formation_polygons[runs][-1] < right_borehole_location)
+                    TD_chunk = self.formation_polygons[runs][1, mask]
+                    locations_chunk = self.formation_polygons[runs][-1, mask]
+                    for point in range(TD_chunk.shape[0]):
+                        TD_formations.append(runs)
+                        total_depths.append(TD_chunk[point])
+                        TD_locations.append(locations_chunk[point])
+                    
+            else:
+                
+                mask = self.formation_polygons[runs][-1] == self.locations[style_column]
+                TD_chunk = self.formation_polygons[runs][1, mask]
+                locations_chunk = self.formation_polygons[runs][-1, mask]
+                total_depths.append(TD_chunk[0])
+                TD_locations.append(locations_chunk[0])
+                for point in TD_chunk:
+                    TD_formations.append(runs)
+
+        self.formations_TD = np.array([total_depths, TD_locations, TD_formations])
+        self.original_formations_TD = np.array([total_depths, TD_locations, TD_formations])
+        
+
+    def limit_TD(self, max_TD=-1000000000000):
+        """
+        max_TD - float, the lowest elevation any well is drawn to. Defaults to a number low enough to not limit anything
+        
+        Limits the TD of wells to the number entered, right away. Contact lines and plots made before this need to be made again
+        """
+        
+        self.max_TD = max_TD
+        self.apply_max_TD()
+        self.mark_changed('max_TD')
+        self.dirty.discard('total_depth')
+        
+        
+    def apply_max_TD(self):
+        """
+        Limits the TD of wells to self.max_TD. This starts from the original TD each time, so raising or clearing the limit puts the wells back
+        """
+        
+        for TD_index in range(self.formations_TD.shape[1]):
+            row = int(self.formations_TD[-1, TD_index])
+            change_index = np.where(self.formation_polygons[row][-1] == self.formations_TD[1, TD_index])[0]
+
+            if self.original_formations_TD[0, TD_index] < self.max_TD:
+                self.formation_polygons[row][1, change_index] = self.max_TD
+                self.formations_TD[0, TD_index] = self.max_TD
+            else:
+                self.formation_polygons[row][1, change_index] = self.original_formations_TD[0, TD_index]
+                self.formations_TD[0, TD_index] = self.original_formations_TD[0, TD_index]
+            
+
+    def create_plot_limits(self):
+        """
+        Finds the values used to frame the plot and the exports. The top of the bottom formation is used as the bottom of the surface formation
+        """
+        
+        self.top_of_bottom = np.nanmax(self.formation_polygons[-1][0])
+        self.tallest_borehole = np.max(self.well_elev)
+        self.deepest_borehole = min(self.formation_polygons[-1][1])
+        
+
+    # =============================================================================
+    #region Contact Line Arrays
+    # =============================================================================
+    def create_contact_line_arrays(self):
+        """ 
+        Creates 2 lists of line segments for solid and dashed contacts. Each line segment is created from the top row of formation polygons
+        """
+        
+        self.dashed_contacts = []
+        self.solid_contacts = []
+        
+        
+        for row in range(self.style_array.shape[0]-1):
+            for index in range(len(self.core_or_cuttings)-1):
+                if self.core_or_cuttings[index] == 'CORE':
+                    linestyle = '-'
+                else:
+                    linestyle = '--'
+            
+                if self.core_or_cuttings[index] != self.core_or_cuttings[index+1]: #Change in linestyle
+                
+                    # Checks for interlocking fades
+                    if self.style_array[row, index] == STYLE_F and (self.style_array[row+1, index-1] == STYLE_F or self.style_array[row+1, index+1] == STYLE_F):
+                        direction = self.direction_array[row, index]
+                        
+                        below_left_direction = self.direction_array[row+1, index-1]
+                        below_right_direction = self.direction_array[row+1, index+1]
+                        
+                        if direction == 'right':
+                            
+                            if below_right_direction == 'both' or below_right_direction == 'left':
+                                left_distance = self.locations[index] 
+                                left_elev_index = np.where(self.formation_polygons[row][-1] == left_distance)
+                                left_elev = self.formation_polygons[row][0, left_elev_index][0,0]
+                                
+                                mask = (self.formation_polygons[row+1][-1] > self.locations[index]) & (self.formation_polygons[row+1][-1] < self.locations[index+1])
+                                
+                                right_elev = self.formation_polygons[row+1][0][mask][-1]
+                                right_distance = self.formation_polygons[row+1][-1][mask][-1]
+                                
+                                line_segment = np.array([left_elev, right_elev])
+                                distance_segment = np.array([left_distance, right_distance])
+                                
+                                line_stack = np.vstack((line_segment, distance_segment))
+                                
+                                if linestyle == '-':
+                                    self.solid_contacts.append(line_stack)
+                                else:
+                                    self.dashed_contacts.append(line_stack)
+                                
+                                
+                        elif direction == 'left':
+                            
+                            if below_left_direction == 'both' or below_left_direction == 'right':
+                                right_distance = self.locations[index]
+                                right_elev_index = np.where(self.formation_polygons[row][-1] == right_distance)
+                                right_elev = self.formation_polygons[row][0, right_elev_index][0,0]
+                                
+                                mask = (self.formation_polygons[row+1][-1] > self.locations[index-1]) & (self.formation_polygons[row+1][-1] < self.locations[index])
+                                
+                                left_elev = self.formation_polygons[row+1][0][mask][0]
+                                left_distance = self.formation_polygons[row+1][-1][mask][0]
+                                
+                                line_segment = np.array([left_elev, right_elev])
+                                distance_segment = np.array([left_distance, right_distance])
+                                
+                                line_stack = np.vstack((line_segment, distance_segment))
+                                
+                                
+                                if linestyle == '-':
+                                    self.solid_contacts.append(line_stack)
+                                else:
+                                    self.dashed_contacts.append(line_stack)
+                                
+                                
+                        elif direction == 'both':
+                            if below_right_direction == 'both' or below_right_direction == 'left':
+                                pass
+                                
+                            if below_left_direction == 'both' or below_left_direction == 'right':
+                                pass
+                    
+                    
+                    if self.style_array[row, index] == STYLE_N:
+                        
+                        if index == len(self.core_or_cuttings)-2:
+                            if linestyle == '-':
+                                linestyle = '--'
+                                mask = (self.formation_polygons[row][-1] > self.locations[index]) & (self.formation_polygons[row][-1] <= self.locations[index+1])
+                                line_segment = self.formation_polygons[row][0][mask]
+                                distance_segment = self.formation_polygons[row][-1][mask]
+                            else:
+                                linestyle = '-'
+                                mask = (self.formation_polygons[row][-1] > self.locations[index]) & (self.formation_polygons[row][-1] <= self.locations[index+1])
+                                line_segment = self.formation_polygons[row][0][mask]
+                                distance_segment = self.formation_polygons[row][-1][mask]
+                        else:       
+                            continue
+                    
+                    
+                    elif self.style_array[row, index] == STYLE_F or self.style_array[row, index] == STYLE_P:
+                        direction = self.direction_array[row, index]
+                        
+                        
+                        if direction == 'right':
+                            #Create a mask where the values you want are starting at the left, but less than the right
+                            mask = (self.formation_polygons[row][-1] >= self.locations[index]) & (self.formation_polygons[row][-1] < self.locations[index+1])
+                            line_segment = self.formation_polygons[row][0][mask]
+                            distance_segment = self.formation_polygons[row][-1][mask]
+                            
+                        elif direction == 'both':
+                            mask = (self.formation_polygons[row][-1] > self.locations[index-1]) & (self.formation_polygons[row][-1] < self.locations[index+1])
+                            line_segment = line_segment = self.formation_polygons[row][0][mask]
+                            distance_segment = self.formation_polygons[row][-1][mask]
+                            
+                        else: #If direction is left
+                            #Start at greater than the borehole before this one, and end halfway to the next borehole
+                            mask = (self.formation_polygons[row][-1] > self.locations[index-1]) & (self.formation_polygons[row][-1] < self.locations[index+1])
+                            line_segment = self.formation_polygons[row][0][mask]
+                            distance_segment = self.formation_polygons[row][-1][mask]
+                            
+                            mask = (self.formation_polygons[row][-1] >= self.locations[index]) & (self.formation_polygons[row][-1] <= self.locations[index+1])
+                                
+                            temp_arr = self.formation_polygons[row][0][mask]
+                            temp_arr_distance = self.formation_polygons[row][0][mask]
+                            
+                            left_elev = temp_arr[0]
+                            right_elev = temp_arr[-1]
+                            
+                            left_location = self.locations[index]
+                            right_location = self.locations[index+1]
+                            
+                            
+                            midpoint = (right_location + left_location) / 2
+                            slope = (right_elev - left_elev) / (right_location - left_location)
+                                
+                            yintercept = right_elev - (slope*right_location)
+                                
+                            midpoint_elev = (slope * midpoint) + yintercept
+                            
+                            
+                            line_segment = np.append(line_segment, midpoint_elev)
+                            distance_segment = np.append(distance_segment, midpoint)
+                            
+                            #Create a line segment that is the opposite linestyle of the current line segment
+                            second_line_segment = np.array([midpoint_elev, right_elev])
+                            second_distance_segment = np.array([midpoint, right_location])
+                            second_line_stack = np.vstack((second_line_segment, second_distance_segment))
+                            #Add that line segment to the approriate list
+                            if linestyle == '-':
+                                self.dashed_contacts.append(second_line_stack)
+                                    
+                            else:
+                                self.solid_contacts.append(second_line_stack)
+                                
+                            
+                            #Do the whole slope calculation and create the mid point the line will stop at
+                            if self.style_array[row-1, index] == STYLE_F or self.style_array[row-1, index] == STYLE_P:
+                                # Use the last point of the pinch or fade to end the line at
+                                mask = (self.formation_polygons[row-1][-1] > self.locations[index]) & (self.formation_polygons[row-1][-1] < self.locations[index+1])
+                                temp_arr = self.formation_polygons[row-1][0][mask]
+                                temp_arr_distance = self.formation_polygons[row-1][-1][mask]
+                                
+                                line_segment = np.append(line_segment, temp_arr[-1])
+                                distance_segment = np.append(distance_segment, temp_arr_distance[-1])
+                                
+                    
+                    else:
+                        #The line segment if its just a normal connection or a user defined connection
+                        #Start at the left well and go halfway to the right well
+                        mask = (self.formation_polygons[row][-1] >= self.locations[index]) & (self.formation_polygons[row][-1] < self.locations[index+1])
+                        line_segment = self.formation_polygons[row][0][mask]
+                        distance_segment = self.formation_polygons[row][-1][mask]
+                        
+                        #Do the whole slope calculation and create the mid point the line will stop at
+                        if self.style_array[row-1, index] == STYLE_F or self.style_array[row-1, index] == STYLE_P:
+                            above_direction = self.direction_array[row-1, index]
+                            # Use the last point of the pinch or fade to end the line at
+                            
+                            if above_direction == 'right':
+                                mask = (self.formation_polygons[row-1][-1] > self.locations[index]) & (self.formation_polygons[row-1][-1] < self.locations[index+1])
+                                temp_arr = self.formation_polygons[row-1][0][mask]
+                                temp_arr_distance = self.formation_polygons[row-1][-1][mask]
+                                
+                            
+                                line_segment = np.append(line_segment, temp_arr[-1])
+                                distance_segment = np.append(distance_segment, temp_arr_distance[-1])
+                                
+                                #Create a line segment that is the opposite linestyle of the current line segment
+                                second_line_segment = np.array([temp_arr[-1], self.formation_polygons[row][0, index+1]])
+                                second_distance_segment = np.array([temp_arr_distance[-1], self.formation_polygons[row][-1, index+1]])
+                                second_line_stack = np.vstack((second_line_segment, second_distance_segment))
+                                #Add that line segment to the approriate list
+                                if linestyle == '-':
+                                    self.dashed_contacts.append(second_line_stack)
+                                else:
+                                    self.solid_contacts.append(second_line_stack)
+                                    
+                            elif above_direction == 'both':
+                                mask = (self.formation_polygons[row-1][-1] > self.locations[index-1]) & (self.formation_polygons[row-1][-1] < self.locations[index+1])
+                                temp_arr = self.formation_polygons[row-1][0][mask]
+                                temp_arr_distance = self.formation_polygons[row-1][-1][mask]
+                                
+                                current_well_formation_index = np.where(self.formation_polygons[row][-1] == self.locations[index])
+                                current_formation_top = self.formation_polygons[row][0, current_well_formation_index]
+                                
+                                line_segment = np.array([temp_arr[0], current_formation_top[0, 0], temp_arr[-1]])
+                                
+                                distance_segment = np.append(temp_arr_distance[0], self.locations[index])
+                                distance_segment = np.append(distance_segment, temp_arr_distance[-1])
+                                
+                            
+                                mask = (self.formation_polygons[row-1][-1] > self.locations[index]) & (self.formation_polygons[row-1][-1] < self.locations[index+1])
+                                #Create a line segment that is the opposite linestyle of the current line segment
+                                temp_arr = self.formation_polygons[row-1][0][mask]
+                                temp_arr_distance = self.formation_polygons[row-1][-1][mask]
+                                
+                                right_well_index = np.where(self.formation_polygons[row][-1] == self.locations[index+1])
+                                right_well_formation_top = self.formation_polygons[row][0, right_well_index]
+                                
+                                
+                                
+                                second_line_segment = np.array([temp_arr[-1], right_well_formation_top[0,0]])
+                                second_distance_segment = np.array([temp_arr_distance[-1], self.locations[index+1]])
+                                second_line_stack = np.vstack((second_line_segment, second_distance_segment))
+                                #Add that line segment to the approriate list
+                                if linestyle == '-':
+                                    self.dashed_contacts.append(second_line_stack)
+                                else:
+                                    self.solid_contacts.append(second_line_stack)
+                                
+                                
+                            else: #If above_direction is left
+                                left_location = self.locations[index]
+                                right_location = self.locations[index+1]
+                                
+                                left_formation_polygon_index = np.where(self.formation_polygons[row][-1,:] == left_location)
+                                right_formation_polygon_index = np.where(self.formation_polygons[row][-1,:] == right_location)
+                            
+                                left_elev = self.formation_polygons[row][0, left_formation_polygon_index]
+                                right_elev = self.formation_polygons[row][0, right_formation_polygon_index]
+                                
+                                
+                                midpoint = (right_location + left_location) / 2
+                                slope = (right_elev - left_elev) / (right_location - left_location)
+                                yintercept = right_elev - (slope*right_location)
+                                midpoint_elev = (slope * midpoint) + yintercept
+                                
+                                line_segment = np.append(line_segment, midpoint_elev)
+                                distance_segment = np.append(distance_segment, midpoint)
+                                
+                                #Create a line segment that is the opposite linestyle of the current line segment
+                                second_line_segment = np.array([midpoint_elev[0,0], right_elev[0, 0]])
+                                second_distance_segment = np.array([midpoint, right_location])
+                                second_line_stack = np.vstack((second_line_segment, second_distance_segment))
+                                #Add that line segment to the approriate list
+                                if linestyle == '-':
+                                    self.dashed_contacts.append(second_line_stack)
+                                else:
+                                    self.solid_contacts.append(second_line_stack)
+                        
+                        elif self.style_array[row-1, index+1] == STYLE_F or self.style_array[row-1, index+1] == STYLE_P:
+                            above_right_direction = self.direction_array[row-1, index+1]
+                            if above_right_direction == 'left' or above_right_direction == 'both':
+                                mask = (self.formation_polygons[row-1][-1] > self.locations[index]) & (self.formation_polygons[row-1][-1] < self.locations[index+1])
+                                temp_arr = self.formation_polygons[row-1][0][mask]
+                                temp_arr_distance = self.formation_polygons[row-1][-1][mask]
+                                
+                                line_segment = np.array([line_segment[0], temp_arr[0]])
+                                distance_segment = np.array([distance_segment[0], temp_arr_distance[0]])
+                                
+                                right_well_index = np.where(self.formation_polygons[row][-1] == self.locations[index+1])[0][0]
+                                
+                                if above_right_direction == 'left':
+                                    right_well_index = np.where(self.formation_polygons[row][-1] == self.locations[index+1])
+                                    right_formation_top = self.formation_polygons[row][0, right_well_index]
+                                    
+                                    #Create a line segment that is the opposite linestyle of the current line segment
+                                    second_line_segment = np.array([temp_arr[0], right_formation_top[0,0]])
+                                    second_distance_segment = np.array([temp_arr_distance[0], self.locations[index+1]])
+                                    second_line_stack = np.vstack((second_line_segment, second_distance_segment))
+                                    #Add that line segment to the approriate list
+                                    if linestyle == '-':
+                                        self.dashed_contacts.append(second_line_stack)
+                                    else:
+                                        self.solid_contacts.append(second_line_stack)
+                                
+                                
+                                
+                                    
+                            else: #Normal midpoint calculation if above_right_direction is right
+                                left_location = self.locations[index]
+                                right_location = self.locations[index+1]
+                            
+                                left_formation_polygon_index = np.where(self.formation_polygons[row][-1,:] == left_location)
+                                right_formation_polygon_index = np.where(self.formation_polygons[row][-1,:] == right_location)
+                        
+                                left_elev = self.formation_polygons[row][0, left_formation_polygon_index]
+                                right_elev = self.formation_polygons[row][0, right_formation_polygon_index]
+                            
+                            
+                                midpoint = (right_location + left_location) / 2
+                                slope = (right_elev - left_elev) / (right_location - left_location)
+                                yintercept = right_elev - (slope*right_location)
+                                midpoint_elev = (slope * midpoint) + yintercept
+                            
+                                line_segment = np.append(line_segment, midpoint_elev)
+                                distance_segment = np.append(distance_segment, midpoint)
+                            
+                                #Create a line segment that is the opposite linestyle of the current line segment
+                                second_line_segment = np.array([midpoint_elev[0,0], right_elev[0, 0]])
+                                second_distance_segment = np.array([midpoint, right_location])
+                                second_line_stack = np.vstack((second_line_segment, second_distance_segment))
+                                #Add that line segment to the approriate list
+                                if linestyle == '-':
+                                    self.dashed_contacts.append(second_line_stack)
+                                else:
+                                    self.solid_contacts.append(second_line_stack)
+                                
+                                
+                                
+                            
+                        else: #If there is no pinch or fade
+                            left_location = self.locations[index]
+                            right_location = self.locations[index+1]
+                            
+                            left_formation_polygon_index = np.where(self.formation_polygons[row][-1,:] == left_location)
+                            right_formation_polygon_index = np.where(self.formation_polygons[row][-1,:] == right_location)
+                        
+                            left_elev = self.formation_polygons[row][0, left_formation_polygon_index]
+                            right_elev = self.formation_polygons[row][0, right_formation_polygon_index]
+                            
+                            
+                            midpoint = (right_location + left_location) / 2
+                            slope = (right_elev - left_elev) / (right_location - left_location)
+                            yintercept = right_elev - (slope*right_location)
+                            midpoint_elev = (slope * midpoint) + yintercept
+                            
+                            line_segment = np.append(line_segment, midpoint_elev)
+                            distance_segment = np.append(distance_segment, midpoint)
+                            
+                            
+                            
+                            #Create a line segment that is the opposite linestyle of the current line segment
+                            second_line_segment = np.array([midpoint_elev[0,0], right_elev[0, 0]])
+                            second_distance_segment = np.array([midpoint, right_location])
+                            second_line_stack = np.vstack((second_line_segment, second_distance_segment))
+                            #Add that line segment to the approriate list
+                            if linestyle == '-':
+                                self.dashed_contacts.append(second_line_stack)
+                            else:
+                                self.solid_contacts.append(second_line_stack)
+                    
+                    
+                    
+            ###########################################################################################################################        
+                    
+                    ########################################################################################################
+                    
+                else: #This borehole and the next are the same sample type
+                    if self.style_array[row, index] == STYLE_N:
+                        
+                        
+                        if index == len(self.core_or_cuttings)-2 and self.style_array[row, index+1] != STYLE_N: #Adresses the last borehole
+                            mask = (self.formation_polygons[row][-1] > self.locations[index]) & (self.formation_polygons[row][-1] <= self.locations[index+1])
+                            line_segment = self.formation_polygons[row][0][mask]
+                            distance_segment = self.formation_polygons[row][-1][mask]
+                            
+                            
+                        else:
+                            continue
+                
+                    elif self.style_array[row, index] == STYLE_F or self.style_array[row, index] == STYLE_P:
+                        direction = self.direction_array[row, index]
+                        
+                        if direction == 'right':
+                            #Create a mask where the values you want are starting at the left and ending at the right
+                            mask = (self.formation_polygons[row][-1] >= self.locations[index]) & (self.formation_polygons[row][-1] < self.locations[index+1])
+                            line_segment = self.formation_polygons[row][0][mask]
+                            distance_segment = self.formation_polygons[row][-1][mask]
+                        
+                        elif direction == 'both':
+                            mask = (self.formation_polygons[row][-1] >= self.locations[index-1]) & (self.formation_polygons[row][-1] <= self.locations[index+1])
+                            line_segment = line_segment = self.formation_polygons[row][0][mask]
+                            distance_segment = self.formation_polygons[row][-1][mask]
+                        
+                        else: #If direction is left
+                            #Start at greater than the borehole before this one, and end at the next borehole
+                            mask = (self.formation_polygons[row][-1] > self.locations[index-1]) & (self.formation_polygons[row][-1] <= self.locations[index+1])
+                            line_segment = self.formation_polygons[row][0][mask]
+                            distance_segment = self.formation_polygons[row][-1][mask]
+                            
+                    else:
+                        #The line segment if its just a normal connection or a user defined connection
+                        #Start at the left well and end at the right well
+                        mask = (self.formation_polygons[row][-1] >= self.locations[index]) & (self.formation_polygons[row][-1] <= self.locations[index+1])
+                        line_segment = self.formation_polygons[row][0][mask]
+                        distance_segment = self.formation_polygons[row][-1][mask]
+                
+                line_stack = np.vstack((line_segment, distance_segment))
+                
+                """
+                print('Row:', row)
+                print("Index:", index)
+                print(line_stack)
+                """
+                
+                if linestyle == '-':
+                    self.solid_contacts.append(line_stack)
+                else:
+                    self.dashed_contacts.append(line_stack)
+                    
+        
+# =============================================================================
+#region Formation Outline
+# =============================================================================
+    def create_formation_outlines(self, vertical_exaggeration):
+        """
+        vertical_exaggeration - integer, distances are divided by this so the outlines match the exaggerated plot
+        
+        Creates a polygon outline for each formation. This is done by splitting formations into chunks if needed and finding the bottom of the formation by looking at
+        the top of formations below
+        This is primarily to be used in the export for autocad
+        """
+        self.formation_outline_dict = {}
+        for form in self.formations_list[:-1]:
+            self.formation_outline_dict[form] = []
+        
+        for row, formation in enumerate(self.formation_polygons):
+            if np.any(self.style_array[row] == STYLE_F) or np.any(self.style_array[row] == STYLE_P):
+                #Then we create a process that breaks the formation in to chunks
+                chunk_list = []
+                chunk = []
+                for style_column, style_letter in enumerate(self.style_array[row]):
+                    if style_letter != STYLE_N:
+                        chunk.append(style_column)
+                    else:
+                        if len(chunk) > 0:
+                            chunk_list.append(chunk)
+                            chunk = []
+                if len(chunk) > 0:
+                    chunk_list.append(chunk)
+
+                #Gather the top of formation outline
+                for chunk in chunk_list:
+                    formation_chunk_outline = []
+                    #Check if there is only one borehole in the chunk
+                    if len(chunk) == 1:
+                        direction = self.direction_array[row, chunk[0]]
+                        if direction == 'left':
+                            left_borehole_location = self.locations[chunk[0]-1]
+                            current_borehole_location = self.locations[chunk[0]]
+                            mask = (self.formation_polygons[row][-1] > left_borehole_location) & (self.formation_polygons[row][-1] <= current_borehole_location)
+                            top_formation_chunk = self.formation_polygons[row][:, mask]
+                            for top_col in range(top_formation_chunk.shape[1]):
+                                formation_chunk_outline.append((top_formation_chunk[-1, top_col]/vertical_exaggeration, top_formation_chunk[0, top_col]))
+                        elif direction == 'right':
+                            right_borehole_location = self.locations[chunk[0]+1]
+                            current_borehole_location = self.locations[chunk[0]]
+                            mask = (self.formation_polygons[row][-1] >= current_borehole_location) & (self.formation_polygons[row][-1] < right_borehole_location)
+                            top_formation_chunk = self.formation_polygons[row][:, mask]
+                            for top_col in range(top_formation_chunk.shape[1]):
+                                formation_chunk_outline.append((top_formation_chunk[-1, top_col]/vertical_exaggeration, top_formation_chunk[0, top_col]))
+                        elif direction == 'both':
+                            left_borehole_location = self.locations[chunk[0]-1]
+                            right_borehole_location = self.locations[chunk[0]+1]
+                            mask = (self.formation_polygons[row][-1] > left_borehole_location) & (self.formation_polygons[row][-1] < right_borehole_location)
+                            top_formation_chunk = self.formation_polygons[row][:, mask]
+                            for top_col in range(top_formation_chunk.shape[1]):
+                                formation_chunk_outline.append((top_formation_chunk[-1, top_col]/vertical_exaggeration, top_formation_chunk[0, top_col]))
+
+                    #Check if the start of the chunk is a pinch or fade
+                    elif self.style_array[row, chunk[0]] == STYLE_P or self.style_array[row, chunk[0]] == STYLE_F:
+                        left_borehole_location = self.locations[chunk[0]-1]
+                        if self.style_array[row, chunk[-1]] == STYLE_P or self.style_array[row, chunk[-1]] == STYLE_F:
+                            right_borehole_location = self.locations[chunk[-1]+1]
+                            mask = (self.formation_polygons[row][-1] > left_borehole_location) & (self.formation_polygons[row][-1] < right_borehole_location)
+                        else:
+                            right_borehole_location = self.locations[chunk[-1]]
+                            mask = (self.formation_polygons[row][-1] > left_borehole_location) & (self.formation_polygons[row][-1] <= right_borehole_location)
+
+                        top_formation_chunk = self.formation_polygons[row][:, mask]
+                        for top_col in range(top_formation_chunk.shape[1]):
+                            formation_chunk_outline.append((top_formation_chunk[-1, top_col]/vertical_exaggeration, top_formation_chunk[0, top_col]))
+                    
+                    else:
+                        left_borehole_location = self.locations[chunk[0]]
+                        if self.style_array[row, chunk[-1]] == STYLE_P or self.style_array[row, chunk[-1]] == STYLE_F:
+                            right_borehole_location = self.locations[chunk[-1]+1]
+                            mask = (self.formation_polygons[row][-1] >= left_borehole_location) & (self.formation_polygons[row][-1] < right_borehole_location)
+                        else:
+                            right_borehole_location = self.locations[chunk[-1]]
+                            mask = (self.formation_polygons[row][-1] >= left_borehole_location) & (self.formation_polygons[row][-1] <= right_borehole_location)
+
+                        top_formation_chunk = self.formation_polygons[row][:, mask]
+                        for top_col in range(top_formation_chunk.shape[1]):
+                            formation_chunk_outline.append((top_formation_chunk[-1, top_col]/vertical_exaggeration, top_formation_chunk[0, top_col]))
+
+
+                    #Get the bottom of the formation outline
+                    for style_column in reversed(chunk):
+                        runs = self.next_data_row[row+1, style_column] - row
+
+                        if row+runs == self.style_array.shape[0]-1:
+                            current_borehole_location = self.locations[style_column]
+                            mask = self.formations_TD[1] == current_borehole_location
+                            TD_chunk = self.formations_TD[:, mask]
+                            formation_chunk_outline.append((TD_chunk[1,0]/vertical_exaggeration, TD_chunk[0,0]))
+                            
+
+                        elif self.style_array[row+runs, style_column] == STYLE_F or self.style_array[row+runs, style_column] == STYLE_P:
+                            #Create a process to find the bottom of the formation
+                            direction = self.direction_array[row+runs, style_column]
+                            if direction == 'left':
+                                #Create a process to find the bottom of the formation
+                                current_borehole_location = self.locations[style_column]
+                                left_borehole_location = self.locations[style_column-1]
+                                
+                                mask = (self.formation_polygons[row+runs][-1] <= current_borehole_location) & (self.formation_polygons[row+runs][-1] > left_borehole_location)
+                                formation_chunk = self.formation_polygons[row+runs][:, mask]
+                                for bottom_col in reversed(range(formation_chunk.shape[1])):
+                                    formation_chunk_outline.append((formation_chunk[-1, bottom_col]/vertical_exaggeration, formation_chunk[0, bottom_col]))
+
+                            elif direction == 'right':
+                                #Create a process to find the bottom of the formation
+                                current_borehole_location = self.locations[style_column]
+                                right_borehole_location = self.locations[style_column+1]
+
+                                mask = (self.formation_polygons[row+runs][-1] >= current_borehole_location) & (self.formation_polygons[row+runs][-1] < right_borehole_location)
+                                formation_chunk = self.formation_polygons[row+runs][:, mask]
+                                for bottom_col in reversed(range(formation_chunk.shape[1])):
+                                    formation_chunk_outline.append((formation_chunk[-1, bottom_col]/vertical_exaggeration, formation_chunk[0, bottom_col]))
+
+                            elif direction == 'both':
+                                #Create a process to find the bottom of the formation
+                                left_borehole_location = self.locations[style_column-1]
+                                right_borehole_location = self.locations[style_column+1]
+
+                                mask = (self.formation_polygons[row+runs][-1] > left_borehole_location) & (self.formation_polygons[row+runs][-1] < right_borehole_location)
+                                formation_chunk = self.formation_polygons[row+runs][:, mask]
+                                for bottom_col in reversed(range(formation_chunk.shape[1])):
+                                    formation_chunk_outline.append((formation_chunk[-1, bottom_col]/vertical_exaggeration, formation_chunk[0, bottom_col]))
+
+                        elif self.style_array[row+runs, style_column] == STYLE_X or self.style_array[row+runs, style_column] == STYLE_C:
+                            current_borehole_location = self.locations[style_column]
+                            mask = self.formation_polygons[row+1][-1] == current_borehole_location
+                            formation_chunk = self.formation_polygons[row+1][:, mask]
+                            formation_chunk_outline.append((formation_chunk[-1, 0]/vertical_exaggeration, formation_chunk[0, 0]))
+                            
+                    self.formation_outline_dict[self.formations_list[row]].append(formation_chunk_outline)
+                        
+                        
+            else:
+                #Can just check the formation below for the same style conditions. If it contains styles, then we need to search for the bottom continuously until it is
+                #a usable value
+                if np.any(self.style_array[row+1] == STYLE_F) or np.any(self.style_array[row+1] == STYLE_P):
+                    #Create the top half of the formation outline
+                    complete_formation_outline = []
+                    for top_col in range(formation.shape[1]):
+                        complete_formation_outline.append((formation[-1, top_col]/vertical_exaggeration, formation[0, top_col]))
+                    #Create a process to search for the bottom of the formation
+                    for style_column in reversed(range(self.style_array.shape[1])):
+                        runs = self.next_data_row[row+1, style_column] - row
+
+                        if row+runs == self.style_array.shape[0]-1:
+                            current_borehole_location = self.locations[style_column]
+                            mask = self.formations_TD[1] == current_borehole_location
+                            TD_chunk = self.formations_TD[:, mask]
+                            complete_formation_outline.append((TD_chunk[1, 0]/vertical_exaggeration, TD_chunk[0,0]))
+
+                        elif self.style_array[row+runs, style_column] == STYLE_F or self.style_array[row+runs, style_column] == STYLE_P:
+                            #Create a process to find the bottom of the formation
+                            direction = self.direction_array[row+runs, style_column]
+                            if direction == 'left':
+                                #Create a process to find the bottom of the formation
+                                current_borehole_location = self.locations[style_column]
+                                left_borehole_location = self.locations[style_column-1]
+                                
+                                mask = (self.formation_polygons[row+runs][-1] <= current_borehole_location) & (self.formation_polygons[row+runs][-1] > left_borehole_location)
+                                formation_chunk = self.formation_polygons[row+runs][:, mask]
+                                for bottom_col in reversed(range(formation_chunk.shape[1])):
+                                    complete_formation_outline.append((formation_chunk[-1, bottom_col]/vertical_exaggeration, formation_chunk[0, bottom_col]))
+
+                            elif direction == 'right':
+                                #Create a process to find the bottom of the formation
+                                current_borehole_location = self.locations[style_column]
+                                right_borehole_location = self.locations[style_column+1]
+
+                                mask = (self.formation_polygons[row+runs][-1] >= current_borehole_location) & (self.formation_polygons[row+runs][-1] < right_borehole_location)
+                                formation_chunk = self.formation_polygons[row+runs][:, mask]
+                                for bottom_col in reversed(range(formation_chunk.shape[1])):
+                                    complete_formation_outline.append((formation_chunk[-1, bottom_col]/vertical_exaggeration, formation_chunk[0, bottom_col]))
+
+                            elif direction == 'both':
+                                #Create a process to find the bottom of the formation
+                                left_borehole_location = self.locations[style_column-1]
+                                right_borehole_location = self.locations[style_column+1]
+
+                                mask = (self.formation_polygons[row+runs][-1] > left_borehole_location) & (self.formation_polygons[row+runs][-1] < right_borehole_location)
+                                formation_chunk = self.formation_polygons[row+runs][:, mask]
+                                for bottom_col in reversed(range(formation_chunk.shape[1])):
+                                    complete_formation_outline.append((formation_chunk[-1, bottom_col]/vertical_exaggeration, formation_chunk[0, bottom_col]))
+
+                        elif self.style_array[row+runs, style_column] == STYLE_X or self.style_array[row+runs, style_column] == STYLE_C:
+                            current_borehole_location = self.locations[style_column]
+                            mask = self.formation_polygons[row+1][-1] == current_borehole_location
+                            formation_chunk = self.formation_polygons[row+1][:, mask]
+                            complete_formation_outline.append((formation_chunk[-1, 0]/vertical_exaggeration, formation_chunk[0, 0]))
+                            
+                    self.formation_outline_dict[self.formations_list[row]].append(complete_formation_outline)
+
+                else:
+                    #Create a full clean polygon with no breaks
+                    complete_formation_outline = []
+                    for top_col in range(formation.shape[1]):
+                        complete_formation_outline.append((formation[-1, top_col]/vertical_exaggeration, formation[0, top_col]))
+                    for bottom_col in reversed(range(formation.shape[1])):
+                        complete_formation_outline.append((formation[-1, bottom_col]/vertical_exaggeration, formation[1, bottom_col]))
+                    self.formation_outline_dict[self.formations_list[row]].append(complete_formation_outline)
@@ -0,0 +1,89 @@
+"""
+Checks that a section saved to a project file opens again exactly as it was, and that a failed save leaves the previous project alone
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import CrossProject
+from CrossSection import CrossSection
+
+
+def sample_section():
+    """
+    Returns a small calculated section where tc pinches out after the middle well
+    """
+
+    section = CrossSection()
+    section.set_section_data(['W-1', 'W-2', 'W-3'], [0, 500, 700], [100, 110, 105], ['qh', 'tc', 'ts', 'bottom'],
+                             [[0, 0, 0], [20, 40, 60], [50, 60, 60], [200, 200, 200]],
+                             [['x', 'x', 'x'], ['x', 'p', 'n'], ['x', 'x', 'x'], ['x', 'x', 'x']],
+                             ['CORE', 'CUTTINGS', 'CORE'], [100, 108, 110, 105], [0, 300, 500, 1200])
+    return section.build_section()
+
+
+def assert_same(saved, opened):
+    #numpy scalars come back as the python number they hold
+    if isinstance(saved, np.generic):
+        saved = saved.item()
+    assert type(opened) is type(saved)
+    if isinstance(saved, np.ndarray):
+        assert opened.dtype == saved.dtype
+        assert opened.shape == saved.shape
+        if saved.dtype == object:
+            for saved_item, opened_item in zip(saved.ravel(), opened.ravel()):
+                assert_same(saved_item, opened_item)
+        else:
+            assert np.array_equal(opened, saved, equal_nan=saved.dtype.kind in 'fc')
+    elif isinstance(saved, (list, tuple)):
+        assert len(opened) == len(saved)
+        for saved_item, opened_item in zip(saved, opened):
+            assert_same(saved_item, opened_item)
+    elif isinstance(saved, dict):
+        assert list(opened) == list(saved)
+        for key in saved:
+            assert_same(saved[key], opened[key])
+    elif isinstance(saved, float) and np.isnan(saved):
+        assert np.isnan(opened)
+    else:
+        assert opened == saved
+
+
+def test_round_trip(tmp_path):
+    section = sample_section()
+    #Saved with the polygons out of date, they are calculated after opening the same as they would have been
+    section.set_pinch_fade_midpoint('Pinch', 1, 0, 800.0)
+    settings = {'vertical_exaggeration': 50, 'figsize': (12.5, 8)}
+    save_path = str(tmp_path / ('section' + CrossProject.PROJECT_EXTENSION))
+
+    assert CrossProject.save_project(section, save_path, settings) == save_path
+    opened, opened_settings = CrossProject.load_project(save_path)
+
+    assert sorted(vars(opened)) == sorted(vars(section))
+    for name, value in vars(section).items():
+        assert_same(value, getattr(opened, name))
+    assert opened_settings == settings
+    assert os.listdir(str(tmp_path)) == ['section' + CrossProject.PROJECT_EXTENSION]
+
+    assert opened.update('contacts') == section.update('contacts') == ['polygons', 'total_depth', 'contacts']
+    for name in ['formation_polygons', 'solid_contacts', 'dashed_contacts']:
+        assert_same(getattr(section, name), getattr(opened, name))
+
+
+def test_failed_save_keeps_previous_project(tmp_path, monkeypatch):
+    save_path = tmp_path / ('section' + CrossProject.PROJECT_EXTENSION)
+    CrossProject.save_project(sample_section(), str(save_path))
+    previous = save_path.read_bytes()
+
+    def failed_write(file, **arrays):
+        file.write(b'half a project')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(np, 'savez_compressed', failed_write)
+    with pytest.raises(OSError):
+        CrossProject.save_project(sample_section(), str(save_path))
+    assert save_path.read_bytes() == previous
+    assert os.listdir(str(tmp_path)) == [save_path.name]
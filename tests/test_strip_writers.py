@@ -0,0 +1,122 @@
+"""
+Checks the png and tiff files written a strip at a time by decoding them with PIL and comparing the pixels to the image they were
+written from, and striped exports of a figure to the same figure drawn in one go
+"""
+import io
+import os
+import sys
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import CrossExport
+
+
+def sample_figure():
+    """
+    Returns a small figure with the same kinds of artists as a cross section: fills, solid and dashed lines, a long line and text
+    """
+
+    fig = Figure(figsize=(3, 4))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    x = np.linspace(0, 10, 400)
+    ax.fill_between(x, np.sin(x) - 3, np.sin(x), color='#FFE563')
+    ax.plot(x, np.sin(x), 'k', linewidth=0.8)
+    ax.plot([0, 4, 6, 10], [-3, 0.5, -2.5, 0.8], 'k--', linewidth=1.5)
+    ax.plot([1, 9], [-2.8, 0.9], 'k-', linewidth=1.5, solid_capstyle='projecting')
+    ax.text(5, 0.5, 'W-101')
+    return fig
+
+
+def whole_image(fig, dpi):
+    """
+    Returns fig drawn in one go as an array of (rows, width, 4)
+    """
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='rgba', dpi=dpi)
+    width, height = CrossExport.raster_size(fig, dpi)
+    return np.frombuffer(buffer.getvalue(), dtype=np.uint8).reshape(height, width, 4)
+
+
+def write_in_strips(writer_class, save_path, image, rows_per_strip, dpi=100):
+    writer = writer_class(save_path, image.shape[1], image.shape[0], dpi)
+    for top in range(0, image.shape[0], rows_per_strip):
+        writer.write(image[top:top + rows_per_strip])
+    writer.close()
+
+
+@pytest.mark.parametrize('writer_class, extension', [(CrossExport.PNGStripWriter, 'png'), (CrossExport.TIFFStripWriter, 'tiff')])
+@pytest.mark.parametrize('rows_per_strip', [1, 37, 400])
+def test_writer_matches_whole_image(tmp_path, writer_class, extension, rows_per_strip):
+    #37 rows doesn't divide the 400 row image, so the last strip is short
+    image = whole_image(sample_figure(), 100)
+    save_path = str(tmp_path / ('strips.' + extension))
+    write_in_strips(writer_class, save_path, image, rows_per_strip)
+
+    with Image.open(save_path) as decoded:
+        assert decoded.mode == 'RGBA'
+        assert decoded.size == (image.shape[1], image.shape[0])
+        assert np.array_equal(np.asarray(decoded), image)
+        assert [round(float(value)) for value in decoded.info['dpi']] == [100, 100]
+
+
+def test_bigtiff(tmp_path, monkeypatch):
+    monkeypatch.setattr(CrossExport.TIFFStripWriter, 'BIG_BYTES', 0)
+    image = whole_image(sample_figure(), 100)
+    save_path = str(tmp_path / 'big.tiff')
+    write_in_strips(CrossExport.TIFFStripWriter, save_path, image, 37)
+
+    with open(save_path, 'rb') as file:
+        header = file.read(16)
+    assert header[:4] == b'II+\0'
+    assert header[4:8] == b'\x08\0\0\0'
+    with Image.open(save_path) as decoded:
+        assert np.array_equal(np.asarray(decoded), image)
+
+
+def test_random_pixels(tmp_path):
+    #Noise doesn't compress or difference to anything simple, so every byte of the filters has to be right
+    image = np.random.RandomState(0).randint(0, 256, (53, 29, 4)).astype(np.uint8)
+    for writer_class, extension in ((CrossExport.PNGStripWriter, 'png'), (CrossExport.TIFFStripWriter, 'tiff')):
+        save_path = str(tmp_path / ('noise.' + extension))
+        write_in_strips(writer_class, save_path, image, 10)
+        with Image.open(save_path) as decoded:
+            assert np.array_equal(np.asarray(decoded), image)
+
+
+@pytest.mark.parametrize('rows_per_strip', [37, 128, 400])
+def test_striped_export_matches_whole_render(tmp_path, rows_per_strip):
+    fig = sample_figure()
+    image = whole_image(fig, 100)
+    save_paths = {'png': str(tmp_path / 'section.png'), 'tiff': str(tmp_path / 'section.tiff')}
+    CrossExport.save_raster_strips(fig, save_paths, 100, rows_per_strip * image.shape[1])
+
+    assert fig.dpi == 100
+    assert sorted(os.listdir(str(tmp_path))) == ['section.png', 'section.tiff']
+    for save_path in save_paths.values():
+        with Image.open(save_path) as decoded:
+            pixels = np.asarray(decoded).astype(int)
+        #Agg cuts lines at the edge of each strip, which can change an edge pixel by a shade or two
+        assert np.abs(pixels - image).max() <= 2
+        assert np.count_nonzero(np.abs(pixels - image).max(axis=2)) < image.shape[0] * image.shape[1] // 1000
+
+
+def test_cancelled_export_leaves_nothing(tmp_path):
+    fig = sample_figure()
+    save_path = tmp_path / 'section.png'
+    save_path.write_bytes(b'previous')
+
+    def progress(done, total):
+        if done == 2:
+            raise CrossExport.ExportCancelled()
+
+    with pytest.raises(CrossExport.ExportCancelled):
+        CrossExport.save_raster_strips(fig, {'png': str(save_path)}, 100, 50 * 300, progress)
+    assert save_path.read_bytes() == b'previous'
+    assert os.listdir(str(tmp_path)) == ['section.png']